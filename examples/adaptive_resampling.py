@@ -0,0 +1,70 @@
+import itertools
+import time
+
+import pywincalc
+
+# pywincalc.resampling.resample picks a subset of the measured wavelengths of a product so that its integrated
+# SOLAR and PHOTOPIC transmittances and reflectances change by at most a tolerance.  The Resampling it returns
+# has the resampled product, the number of wavelengths before and after, the guaranteed error bound and the
+# actual error for each method.
+clear_3 = pywincalc.parse_optics_file("products/CLEAR_3.DAT")
+result = pywincalc.resampling.resample(clear_3, tolerance=1e-3)
+print("CLEAR_3: {n} of {o} wavelengths kept".format(n=result.number_of_wavelengths,
+                                                    o=result.original_number_of_wavelengths))
+for method, bound in result.error_bounds.items():
+    print("    {m}: error bound {b:.5f}, actual error {e:.5f}".format(m=method, b=bound, e=result.errors[method]))
+
+# GlazingSystem resamples its n-band solid layers when given spectral_resampling_tolerance.  Resampled products
+# are cached so each product is only resampled once however many systems it is used in.
+#
+# The rest of this example compares the accuracy and speed of resampling with the full calculation for every
+# single and double layer system that can be made from the glazings in the products directory.  The tolerance
+# bounds the results of each layer on its own.  Results of systems with more than one layer are not bounded
+# but stay close.
+product_paths = ["products/CLEAR_3.DAT", "products/CLEAR_6.DAT", "products/CLEAR5.LOF", "products/LOW-E_5.LOF",
+                 "products/CSR42_3.afg", "products/SS20-8_3ww.bsf"]
+products = [pywincalc.parse_optics_file(path) for path in product_paths]
+gap = pywincalc.Layers.gap(thickness=.0127)
+environment = pywincalc.nfrc_shgc_environments()
+layer_combinations = [[product] for product in products] + [list(pair) for pair in itertools.product(products,
+                                                                                                     repeat=2)]
+metric_names = ["Tsol", "Tvis", "SHGC", "U"]
+
+
+def metrics(glazing_system):
+    solar = glazing_system.optical_method_results("SOLAR")
+    photopic = glazing_system.optical_method_results("PHOTOPIC")
+    return [solar.system_results.front.transmittance.direct_hemispherical,
+            photopic.system_results.front.transmittance.direct_hemispherical,
+            glazing_system.shgc(), glazing_system.u()]
+
+
+# Parse the optical standard before timing anything.  The time for resampling includes resampling each product.
+pywincalc.standards.get()
+reference = None
+reference_seconds = None
+print("| tolerance | wavelengths per product | ms per system | speedup | " +
+      " | ".join("max error " + name for name in metric_names) + " |")
+print("|---" * (4 + len(metric_names)) + "|")
+for tolerance in [None, 1e-4, 1e-3, 1e-2]:
+    start = time.perf_counter()
+    systems = [pywincalc.GlazingSystem(solid_layers=layers, gap_layers=[gap] * (len(layers) - 1),
+                                       environment=environment, spectral_resampling_tolerance=tolerance)
+               for layers in layer_combinations]
+    results = [metrics(glazing_system) for glazing_system in systems]
+    seconds = time.perf_counter() - start
+    if reference is None:
+        reference, reference_seconds = results, seconds
+        wavelengths = sum(len(product.measurements) for product in products) / len(products)
+    else:
+        resampled = [pywincalc.resampling.resample(product, tolerance) for product in products]
+        wavelengths = sum(len(result.product.measurements) for result in resampled) / len(products)
+    max_errors = [max(abs(result[i] - expected[i]) for result, expected in zip(results, reference))
+                  for i in range(len(metric_names))]
+    print("| {l} | {w:.0f} | {t:.1f} | {s:.1f}x | ".format(l="FULL" if tolerance is None else tolerance,
+                                                          w=wavelengths,
+                                                          t=1000 * seconds / len(layer_combinations),
+                                                          s=reference_seconds / seconds) +
+          " | ".join("{e:.4f}".format(e=error) for error in max_errors) + " |")
+
+print("{n} resampled products cached".format(n=pywincalc.resampling.size()))
@@ -0,0 +1,33 @@
+import pywincalc
+
+clear_3 = pywincalc.parse_optics_file("products/CLEAR_3.DAT")
+clear_6 = pywincalc.parse_optics_file("products/CLEAR_6.DAT")
+gap = pywincalc.Layers.gap(thickness=.0127)
+
+glazing_system = pywincalc.GlazingSystem(solid_layers=[clear_6, clear_3], gap_layers=[gap],
+                                         environment=pywincalc.nfrc_shgc_environments())
+
+# Calculate results for a table of incidence angles with one call per result instead of one call per angle.
+# phis can be left out (all 0), be a single value used for every theta, or have one value for each theta.
+# Each angle is cached the same as calling u, shgc, optical_method_results or color for that angle.
+thetas = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90]
+
+shgc_values = glazing_system.shgc_angles(thetas)
+# Optical results are returned as columns, one numpy array per value with one row per angle,
+# see pywincalc.results_to_columns
+solar_columns = glazing_system.optical_method_results_angles("SOLAR", thetas)
+photopic_columns = glazing_system.optical_method_results_angles("PHOTOPIC", thetas, phis=[0])
+
+print("theta\tSHGC\tTsol\tTvis")
+for theta, shgc, tsol, tvis in zip(thetas, shgc_values,
+                                   solar_columns["system_front_transmittance_direct_hemispherical"],
+                                   photopic_columns["system_front_transmittance_direct_hemispherical"]):
+    print("{theta}\t{shgc:.4f}\t{tsol:.4f}\t{tvis:.4f}".format(theta=theta, shgc=shgc, tsol=tsol, tvis=tvis))
+
+# Color results for every angle, also as columns, see pywincalc.color_results_to_columns
+color_columns = glazing_system.color_angles(thetas)
+print("theta\tL*\ta*\tb*")
+for theta, l, a, b in zip(color_columns["theta"], color_columns["system_front_transmittance_direct_hemispherical_lab_L"],
+                          color_columns["system_front_transmittance_direct_hemispherical_lab_a"],
+                          color_columns["system_front_transmittance_direct_hemispherical_lab_b"]):
+    print("{theta:.0f}\t{l:.2f}\t{a:.2f}\t{b:.2f}".format(theta=theta, l=l, a=a, b=b))
@@ -0,0 +1,72 @@
+import time
+
+import wincalcbindings
+
+import pywincalc
+
+# When only the environmental conditions change the optical results of a glazing system stay the same.
+# A GlazingSystem keeps its optical results when its environments are changed and keeps the thermal
+# results for each environment it has been calculated for.  The thermal system is still solved again for
+# every new environment.  Only optical results and environments that were already calculated are
+# reused so the first sweep is faster only by the optical calculations that are not repeated.
+#
+# This example compares changing the environments of one glazing system with and without cached results
+# using the triple glazing from deflection.py.  wincalcbindings.GlazingSystem is the glazing system of the
+# bindings without cached results.
+clear_3 = pywincalc.parse_optics_file("products/CLEAR_3.DAT")
+clear_6 = pywincalc.parse_optics_file("products/CLEAR_6.DAT")
+solid_layers = [clear_6, clear_3, clear_6]
+gap_1 = pywincalc.Layers.gap(thickness=.0127)
+gap_2 = pywincalc.Layers.gap(thickness=.02)
+gaps = [gap_1, gap_2]
+
+
+def create_environments(outside_air_temperature):
+    environments = pywincalc.nfrc_shgc_environments()
+    outside = environments.outside
+    outside.air_temperature = outside_air_temperature
+    outside.radiation_temperature = outside_air_temperature
+    return pywincalc.Environments(outside=outside, inside=environments.inside)
+
+
+outside_temperatures = [250 + 2.5 * i for i in range(24)]
+environments = [create_environments(temperature) for temperature in outside_temperatures]
+
+
+def results(glazing_system):
+    return (glazing_system.u(), glazing_system.shgc(),
+            glazing_system.optical_method_results("PHOTOPIC").system_results.front.transmittance.direct_hemispherical)
+
+
+def sweep(glazing_system):
+    start = time.perf_counter()
+    sweep_results = []
+    for environment in environments:
+        glazing_system.environments(environment)
+        sweep_results.append(results(glazing_system))
+    return sweep_results, time.perf_counter() - start
+
+
+uncached_system = wincalcbindings.GlazingSystem(optical_standard=pywincalc.standards.get(),
+                                                solid_layers=solid_layers, gap_layers=gaps)
+uncached_results, uncached_time = sweep(uncached_system)
+_, uncached_repeated_time = sweep(uncached_system)
+
+glazing_system = pywincalc.GlazingSystem(solid_layers=solid_layers, gap_layers=gaps)
+changed_environment_results, changed_environment_time = sweep(glazing_system)
+# Going over the same environments again only uses results that have already been calculated
+_, repeated_environment_time = sweep(glazing_system)
+
+print("T outside\tU\tSHGC\tVT")
+for temperature, (u, shgc, vt) in zip(outside_temperatures[::6], changed_environment_results[::6]):
+    print("{t:.1f}\t{u:.4f}\t{shgc:.4f}\t{vt:.4f}".format(t=temperature, u=u, shgc=shgc, vt=vt))
+
+print("")
+print("\tWithout cached results\tWith cached results\tSpeedup")
+for name, uncached, cached in [("First sweep", uncached_time, changed_environment_time),
+                               ("Repeated sweep", uncached_repeated_time, repeated_environment_time)]:
+    print("{n}\t{u:.3f}s\t{c:.3f}s\t{s:.2f}x".format(n=name, u=uncached, c=cached, s=uncached / cached))
+print("Cache: {info}".format(info=glazing_system.cache_info()))
+print("Largest difference with and without cached results: {d:.2g}".format(
+    d=max(abs(a - b) for cached, uncached in zip(changed_environment_results, uncached_results)
+          for a, b in zip(cached, uncached))))
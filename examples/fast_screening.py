@@ -0,0 +1,75 @@
+import itertools
+import time
+
+import pywincalc
+
+# pywincalc.screening.glazing_system makes glazing systems from products with their measured spectra condensed
+# into a few bands.  Condensed products are cached per product, optical standard and number of bands so each
+# product is only condensed once however many systems it is used in.  This is meant for screening a large
+# number of combinations quickly.  Candidates picked by screening should be calculated again with a normal
+# GlazingSystem.
+#
+# This example compares the accuracy and speed of screening with the full calculation and with WinCalc's
+# CONDENSED spectral data wavelength range method for every single and double layer system that can be made
+# from the glazings in the products directory.
+product_paths = ["products/CLEAR_3.DAT", "products/CLEAR_6.DAT", "products/CLEAR5.LOF", "products/LOW-E_5.LOF",
+                 "products/CSR42_3.afg", "products/SS20-8_3ww.bsf"]
+products = [pywincalc.parse_optics_file(path) for path in product_paths]
+gap = pywincalc.Layers.gap(thickness=.0127)
+environment = pywincalc.nfrc_shgc_environments()
+layer_combinations = [[product] for product in products] + [list(pair) for pair in itertools.product(products,
+                                                                                                     repeat=2)]
+metric_names = ["Tsol", "Tvis", "SHGC", "U"]
+
+
+def metrics(glazing_system):
+    solar = glazing_system.optical_method_results("SOLAR")
+    photopic = glazing_system.optical_method_results("PHOTOPIC")
+    return [solar.system_results.front.transmittance.direct_hemispherical,
+            photopic.system_results.front.transmittance.direct_hemispherical,
+            glazing_system.shgc(), glazing_system.u()]
+
+
+def full(layers):
+    return pywincalc.GlazingSystem(solid_layers=layers, gap_layers=[gap] * (len(layers) - 1),
+                                   environment=environment)
+
+
+def condensed(layers):
+    return pywincalc.GlazingSystem(
+        solid_layers=layers, gap_layers=[gap] * (len(layers) - 1), environment=environment,
+        spectral_data_wavelength_range_method=pywincalc.SpectalDataWavelengthRangeMethodType.CONDENSED)
+
+
+def screening(number_visible_bands, number_solar_bands):
+    def create(layers):
+        return pywincalc.screening.glazing_system(layers, gap_layers=[gap] * (len(layers) - 1),
+                                                  environment=environment,
+                                                  number_visible_bands=number_visible_bands,
+                                                  number_solar_bands=number_solar_bands)
+
+    return create
+
+
+modes = [("FULL", full), ("CONDENSED", condensed), ("screening 5/10 bands", screening(5, 10)),
+         ("screening 10/20 bands", screening(10, 20))]
+
+# Parse the optical standard before timing anything.  The time for screening includes condensing each product.
+pywincalc.standards.get()
+reference = None
+reference_seconds = None
+print("| method | ms per system | speedup | " + " | ".join("max error " + name for name in metric_names) + " |")
+print("|---" * (3 + len(metric_names)) + "|")
+for mode_name, create in modes:
+    start = time.perf_counter()
+    results = [metrics(create(layers)) for layers in layer_combinations]
+    seconds = time.perf_counter() - start
+    if reference is None:
+        reference, reference_seconds = results, seconds
+    max_errors = [max(abs(result[i] - expected[i]) for result, expected in zip(results, reference))
+                  for i in range(len(metric_names))]
+    print("| {m} | {t:.1f} | {s:.1f}x | ".format(m=mode_name, t=1000 * seconds / len(layer_combinations),
+                                                  s=reference_seconds / seconds) +
+          " | ".join("{e:.4f}".format(e=error) for error in max_errors) + " |")
+
+print("{n} condensed products cached".format(n=pywincalc.screening.size()))
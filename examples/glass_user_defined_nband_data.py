@@ -278,6 +278,17 @@ glass_n_band_optical_data = pywincalc.ProductDataOpticalNBand(material_type=glas
                                                               emissivity_back=glass_emissivity_back,
                                                               flipped=flipped)
 
+# If the measurements are already stored as arrays, e.g. numpy arrays or the columns of a pandas DataFrame, the
+# optical data can be created from them directly with ProductDataOpticalNBand.from_arrays without creating a
+# WavelengthData for each wavelength.  to_arrays does the reverse and returns a dict of numpy arrays with the
+# same names as the from_arrays arguments.  Wavelengths are in microns.
+measurement_arrays = glass_n_band_optical_data.to_arrays()
+glass_n_band_optical_data_from_arrays = pywincalc.ProductDataOpticalNBand.from_arrays(
+    material_type=glass_material_type, thickness_meters=glass_material_thickness, coated_side=glass_coated_side,
+    ir_transmittance_front=glass_ir_transmittance_front, ir_transmittance_back=glass_ir_transmittance_back,
+    emissivity_front=glass_emissivity_front, emissivity_back=glass_emissivity_back, flipped=flipped,
+    **measurement_arrays)
+
 # Next create the thermal data for the glass layer
 glass_conductivity = 1
 # Since thermal openings in this case are all zero they can be omitted.  They are included he for example purposes.
@@ -0,0 +1,32 @@
+import asyncio
+
+import pywincalc
+
+# pywincalc.igsdb.IGSDBClient downloads many products from the IGSDB concurrently.  To download from the
+# IGSDB create the client with your API token:
+#     client = pywincalc.igsdb.IGSDBClient(token=igsdb_api_token)
+# See igsdb_interaction.py for more information about the IGSDB.
+#
+# This example uses a local stand-in for the IGSDB serving the json files in the products directory so
+# that it can be run without network access or a token.  Its first two responses are errors to show
+# requests being retried.
+
+product_ids = ["15067", "generic_pv"]
+
+
+async def download(url, cache_directory):
+    async with pywincalc.igsdb.IGSDBClient(base_url=url, max_concurrency=4, backoff_seconds=0.01,
+                                           cache=cache_directory) as client:
+        return await client.get_products_data(product_ids)
+
+
+with pywincalc.igsdb.LocalIGSDBServer("products", failures=2) as server:
+    # Passing a directory caches the responses there.  Pass cache=True to use the pywincalc cache directory.
+    cache_directory = pywincalc.cache.cache_dir() / "igsdb_example"
+    products = asyncio.run(download(server.url, cache_directory))
+    for product_id, product in zip(product_ids, products):
+        print("{id}: {subtype}, thickness {t} mm".format(id=product_id, subtype=product.product_subtype,
+                                                         t=product.thickness))
+    # Downloading again revalidates the cached responses which the server answers without sending them again
+    asyncio.run(download(server.url, cache_directory))
+    print("Requests handled by the server: {n}".format(n=server.requests))
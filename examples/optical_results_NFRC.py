@@ -799,5 +799,18 @@ print("Color back reflectance diffuse-diffuse Trichromatic: ({x}, {y}, {z})".for
     y=color_results.system_results.back.reflectance.diffuse_diffuse.trichromatic.Y,
     z=color_results.system_results.back.reflectance.diffuse_diffuse.trichromatic.Z))
 
+# ---------------------------------All methods at once-----------------------
+# optical_results_all calculates every method in the optical standard that the layers have data for and returns
+# a dict from method name to results.  Color results are under "COLOR".  Results already calculated above are
+# reused from the glazing system's cache.
+all_results = glazing_system.optical_results_all()
+for method_name, results in all_results.items():
+    if method_name == "COLOR":
+        print("Color front transmittance direct-hemispherical Lab L: {v}".format(
+            v=results.system_results.front.transmittance.direct_hemispherical.lab.L))
+    else:
+        print("System {m} front transmittance direct-hemispherical: {v}".format(
+            m=method_name, v=results.system_results.front.transmittance.direct_hemispherical))
+
 # Thermal IR:  Thermal IR results are not available for a system.  They are only available for a solid layer
 # See thermal_ir.py
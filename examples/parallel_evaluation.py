@@ -0,0 +1,54 @@
+import os
+import time
+
+import pywincalc
+
+# The GlazingSystem calculation methods release the GIL while WinCalc is solving.  This means many
+# glazing systems can be calculated at the same time using threads.  pywincalc.evaluate_many does this
+# using a thread pool and returns the results in the same order as the systems that were passed in.
+clear_3 = pywincalc.parse_optics_file("products/CLEAR_3.DAT")
+clear_6 = pywincalc.parse_optics_file("products/CLEAR_6.DAT")
+
+# Create a number of triple layer systems with different gap thicknesses
+gap_thicknesses = [.006 + .0005 * i for i in range(32)]
+
+
+def create_systems():
+    systems = []
+    for gap_thickness in gap_thicknesses:
+        gap = pywincalc.Layers.gap(thickness=gap_thickness)
+        systems.append(pywincalc.GlazingSystem(solid_layers=[clear_6, clear_3, clear_6], gap_layers=[gap, gap]))
+    return systems
+
+
+# metrics can be names of GlazingSystem methods that do not need arguments or functions
+# that take a glazing system
+def vt(glazing_system):
+    return glazing_system.optical_method_results("PHOTOPIC").system_results.front.transmittance.direct_hemispherical
+
+
+metrics = ["u", vt]
+
+results = pywincalc.evaluate_many(create_systems(), metrics, max_workers=4)
+for gap_thickness, result in zip(gap_thicknesses[:4], results[:4]):
+    print("Gap thickness {t:.4f}m: U={u} VT={vt}".format(t=gap_thickness, **result))
+
+# Compare the time taken using different numbers of workers.  New systems are created each time so that
+# no results calculated by a previous run are reused.
+print("")
+print("workers\tseconds\tspeedup")
+worker_counts = [1, 2, 4, 8, os.cpu_count()]
+single_worker_time = None
+for worker_count in sorted(set(worker_counts)):
+    systems = create_systems()
+    start = time.perf_counter()
+    pywincalc.evaluate_many(systems, metrics, max_workers=worker_count)
+    elapsed = time.perf_counter() - start
+    if single_worker_time is None:
+        single_worker_time = elapsed
+    print("{w}\t{t:.3f}\t{s:.2f}".format(w=worker_count, t=elapsed, s=single_worker_time / elapsed))
+
+# Color results for many systems are returned as one numpy array per value with one row per system
+color_columns = pywincalc.color_many(create_systems())
+print("")
+print("Transmitted color L* for each gap thickness:", color_columns["system_front_transmittance_direct_hemispherical_lab_L"])
@@ -1,5 +1,7 @@
 import glass_local_file
 import gaps_and_gases
+import adaptive_resampling
+import angular_properties
 import bsdf_integrator
 import bsdf_shade_igsdb_product
 import bsdf_shade_local_file
@@ -7,24 +9,31 @@ import cma_double_vision_horizontal
 import cma_double_vision_vertical
 import cma_single_vision
 import deflection
+import environment_sweep
 import environmental_conditions_user_defined
+import fast_screening
 import glass_double_layer_igsdb_product
 import glass_local_file
 import glass_triple_layer_local_file
 import glass_user_defined_nband_data
+import igsdb_async_download
 import igsdb_interaction
 import minimum_example
 import optical_results_EN_410
 import optical_results_NFRC
+import parallel_evaluation
 import perforated_screen_igsdb_product
 import perforated_screen_user_defined_geometry_and_user_defined_nband_material
 import perforated_screen_user_defined_geometry_igsdb_material
 import pv_local_file
 import thermal_ir
 import thermal_results_ISO_15099
+import timeseries
+import validate_products
 import venetian_blind_igsdb_product
 import venetian_blind_local_file
 import venetian_blind_user_defined_geometry_igsdb_material
 import venetian_blind_user_defined_geometry_user_defined_dual_band_material
 import vertical_venetian_user_defined_geometry_igsdb_material
+import weighting_kernels
 import woven_shade_user_defined_geometry_igsdb_material
\ No newline at end of file
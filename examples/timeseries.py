@@ -0,0 +1,35 @@
+import math
+
+import pywincalc
+
+# Calculate thermal results for a double glazing for every hour of a week of weather data.
+# Real weather data would normally be read from a weather file.  Here simple daily cycles are used.
+clear_3 = pywincalc.parse_optics_file("products/CLEAR_3.DAT")
+gap = pywincalc.Layers.gap(thickness=.0127)
+
+# The environments of the glazing system are used for everything that is not part of the time series,
+# e.g. the convection models and emissivities.  The NFRC SHGC environments include solar radiation.
+glazing_system = pywincalc.GlazingSystem(solid_layers=[clear_3, clear_3], gap_layers=[gap],
+                                         environment=pywincalc.nfrc_shgc_environments())
+
+hours = range(24 * 7)
+outside_temperatures = [273.15 + 5 - 6 * math.cos(2 * math.pi * hour / 24) for hour in hours]  # K
+inside_temperatures = [294.15 for hour in hours]  # K
+wind_speeds = [3 + 2 * math.sin(2 * math.pi * hour / 24) for hour in hours]  # m/s
+solar_radiation = [max(0.0, 700 * math.sin(2 * math.pi * (hour % 24 - 6) / 24)) for hour in hours]  # W/m2
+
+# The radiation temperatures are kept from the environments unless series are given for them.  Here they
+# follow the air temperatures.
+results = glazing_system.simulate_timeseries(outside_temperatures, inside_temperatures, wind_speeds,
+                                             solar_radiation, outside_radiation_temps=outside_temperatures,
+                                             inside_radiation_temps=inside_temperatures)
+
+print("hour\tTout\tsolar\tU\tSHGC\tq\tinside surface T")
+for hour in range(0, 24, 3):
+    print("{h}\t{t:.1f}\t{s:.0f}\t{u:.3f}\t{shgc:.3f}\t{q:.1f}\t{ts:.1f}".format(
+        h=hour, t=outside_temperatures[hour], s=solar_radiation[hour], u=results["u"][hour],
+        shgc=results["shgc"][hour], q=results["heat_flux"][hour], ts=results["layer_temperatures"][hour][-1]))
+
+print("")
+print("{n} steps in {t:.3f}s".format(n=results["steps"], t=results["wall_time_seconds"]))
+print("Heat gain over the week: {e:.2f} kWh/m2".format(e=results["heat_flux"].sum() / 1000))
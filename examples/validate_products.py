@@ -0,0 +1,29 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pywincalc
+
+# pywincalc.validate_products parses many product files in parallel and reports the files that could not be
+# parsed and the files with suspicious data instead of stopping at the first bad file.
+# Files are parsed in worker processes so a file that crashes the parser is reported like any other error.
+# Scripts need a __main__ guard since the worker processes import the main module.
+# This example validates the product files in the products directory plus a truncated copy of CLEAR_3.DAT
+if __name__ == "__main__":
+    product_extensions = {".dat", ".lof", ".afg", ".bsf", ".json", ".xml"}
+    paths = sorted(path for path in Path("products").iterdir() if path.suffix.lower() in product_extensions)
+
+    with tempfile.TemporaryDirectory() as directory:
+        truncated = os.path.join(directory, "truncated_CLEAR_3.DAT")
+        with open("products/CLEAR_3.DAT", "rb") as source, open(truncated, "wb") as destination:
+            destination.write(source.read(3000))
+        paths.append(truncated)
+
+        report = pywincalc.validate_products(paths, workers=4)
+
+    # The summary has the number of files per second, the time spent in each phase and every problem found
+    print(report.summary())
+
+    # The results can also be used directly
+    for result in report.errors:
+        print("Could not use {p}: {e}".format(p=result.path, e=result.errors[0].message))
@@ -0,0 +1,36 @@
+import time
+
+import numpy
+
+import pywincalc
+
+# pywincalc.weighting.kernel precomputes the normalized weights of a method of an optical standard once.
+# After that integrating a spectral property for that method is one dot product.
+solar = pywincalc.weighting.kernel("SOLAR")
+photopic = pywincalc.weighting.kernel("PHOTOPIC", "W5_NFRC_2003")
+print(solar)
+print(photopic)
+
+# Kernels can be applied directly to measured values, e.g. a flat 50% transmittance
+wavelengths = numpy.linspace(0.3, 2.5, 221)
+print("Flat 50% transmittance: Tsol = {t:.4f}".format(t=solar.integrate(wavelengths, numpy.full(221, 0.5))))
+
+# Many spectra measured at the same wavelengths are integrated together, one per row
+spectra = numpy.array([numpy.full(221, 0.5), numpy.linspace(0.2, 0.8, 221)])
+print("Tsol of each spectrum:", solar.integrate(wavelengths, spectra))
+
+# integrate_products gives the results of a glazing system with only that product at normal incidence
+clear_3 = pywincalc.parse_optics_file("products/CLEAR_3.DAT")
+clear_6 = pywincalc.parse_optics_file("products/CLEAR_6.DAT")
+products = [clear_3, clear_6] * 500
+
+start = time.perf_counter()
+results = pywincalc.weighting.integrate_products(products, "SOLAR")
+kernel_seconds = time.perf_counter() - start
+print("CLEAR_3 Tsol from the kernel: {t:.6f}".format(t=results[0].transmittance_front))
+
+glazing_system = pywincalc.GlazingSystem(solid_layers=[clear_3])
+solar_results = glazing_system.optical_method_results("SOLAR")
+print("CLEAR_3 Tsol from the glazing system: {t:.6f}".format(
+    t=solar_results.system_results.front.transmittance.direct_direct))
+print("Integrated {n} products in {s:.4f}s".format(n=len(products), s=kernel_seconds))
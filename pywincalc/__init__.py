@@ -1,10 +1,14 @@
-from pathlib import Path
+import copy
+import importlib
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import deprecation
 
 from wincalcbindings import (
     AirHorizontalDirection, BSDF, BSDFBasisType, BSDFDirection, BSDFDirections, BSDFHemisphere,
     BSDFIntegrator, BoundaryConditionsCoefficientModelType, CMABestWorstUFactors, CMAResult, CMAWindow,
-    CMAWindowDualVisionHorizontal, CMAWindowDualVisionVertical, CMAWindowSingleVision, Layers, CellSpacingType, PolygonType, pillar_cell_area,
+    CMAWindowDualVisionHorizontal, CMAWindowDualVisionVertical, CMAWindowSingleVision, CellSpacingType, PolygonType, pillar_cell_area,
     PillarData, CylindricalPillar, SphericalPillar, RectangularPillar, TriangularPillar, PentagonPillar, HexagonPillar, LinearBearingPillar, TruncatedConePillar, Glass, PillarMeasurement,
     AnnulusCylinderPillar, CShapedCylinderPillar, UniversalSupportPillar, CylindricalPillarLayer, SphericalPillarLayer, RectangularPillarLayer,
     TriangularPillarLayer, PentagonPillarLayer, HexagonPillarLayer, LinearBearingPillarLayer, TruncatedConePillarLayer,
@@ -26,14 +30,43 @@ from wincalcbindings import (
     ThmxFileContents, ThmxMaterial, ThmxMeshParameters, ThmxPolygon, ThmxPolygonPoint, ThmxRGB, ThmxResult,
     ThmxUFactorProjectionResult, ThmxUFactorResults, Trichromatic, VenetianGeometry, WavelengthBSDFs,
     WavelengthBoundary, WavelengthBoundaryType, WavelengthData, WavelengthSet, WavelengthSetType, WovenGeometry,
-    load_standard as _load_standard, calc_cma, calc_thermal_ir, convert_to_solid_layer, convert_to_solid_layers,
-    create_best_worst_u_factor_option, create_gas, create_perforated_screen, create_venetian_blind, create_woven_shade,
+    load_standard as _load_standard, calc_cma, calc_thermal_ir, color_results_to_columns, convert_to_solid_layer,
+    convert_to_solid_layers,
+    create_best_worst_u_factor_option, create_perforated_screen, create_venetian_blind, create_woven_shade,
     get_cma_window_double_vision_horizontal, get_cma_window_double_vision_vertical, get_cma_window_single_vision,
-    get_spacer_keff, nfrc_shgc_environments, nfrc_u_environments, parse_bsdf_xml_file, parse_bsdf_xml_string,
+    get_spacer_keff, nfrc_shgc_environments, nfrc_u_environments,
+    parse_bsdf_xml_file as _parse_bsdf_xml_file, parse_bsdf_xml_string,
     parse_json, parse_json_file, parse_optics_file, parse_thmx_file, parse_thmx_string, IGUVentilatedGapLayer,
-    forced_ventilation_gap
+    results_to_columns, wavelength_data_from_arrays, wavelength_data_to_arrays
 )
 
+from . import cache, shared_layers, standards
+from .cma import CMAFrameLibrary
+from .gaps import Layers, create_gas, forced_ventilation_gap
+from .headers import (ProductHeader, parse_bsdf_xml_file_header, parse_json_file_header, parse_json_header,
+                      parse_optics_file_header, parse_product_header)
+from .parallel import color_many, evaluate_many, map_systems, parse_json_many
+
+# Submodules that import numpy or asyncio are only imported when they, or a function from them, are first
+# used so that importing pywincalc stays fast.
+_LAZY_SUBMODULES = ("bsdf_binary", "catalog", "igsdb", "resampling", "screening", "validation", "weighting")
+_LAZY_FUNCTIONS = {"convert_bsdf_xml": "bsdf_binary", "read_bsdf_arrays": "bsdf_binary",
+                   "read_bsdf_binary": "bsdf_binary", "write_bsdf_binary": "bsdf_binary",
+                   "validate_products": "validation"}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    if name in _LAZY_FUNCTIONS:
+        return getattr(importlib.import_module("." + _LAZY_FUNCTIONS[name], __name__), name)
+    raise AttributeError("module {m!r} has no attribute {n!r}".format(m=__name__, n=name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES) | set(_LAZY_FUNCTIONS))
+
+
 @deprecation.deprecated(deprecated_in="3.0.0", removed_in="4.0.0",
                         current_version="3.0.0",
                         details="Use pywincalc.Layers.gap or pywincalc.create_gas instead")
@@ -56,21 +89,414 @@ def PredefinedGasMixtureComponent(component, percent):
     return [percent, component]
 
 
-standard_path = Path(__file__).parent / "standards"
+standard_path = standards.standard_path
+
+
+def parse_bsdf_xml_file(path):
+    """Load product data from BSDF xml file.
+
+    Uses the on-disk product cache if it is enabled, see pywincalc.cache.
+    """
+    return cache.cached_parse("bsdf_xml", os.fspath(path), _parse_bsdf_xml_file)
 
 
 def load_standard(standard_file=standard_path / "W5_NFRC_2003.std"):
-    return _load_standard(str(standard_file))
-
-
-def GlazingSystem(solid_layers, gap_layers=[], optical_standard=load_standard(), width_meters=1.0,
-                  height_meters=1.0, tilt_degrees=90, environment=nfrc_u_environments(), bsdf_hemisphere=None,
-                  spectral_data_wavelength_range_method=SpectalDataWavelengthRangeMethodType.FULL,
-                  number_visible_bands=5, number_solar_bands=10):
-    return _GlazingSystem(solid_layers=solid_layers, gap_layers=gap_layers, optical_standard=optical_standard,
-                          width_meters=width_meters, height_meters=height_meters,
-                          tilt_degrees=tilt_degrees, environment=environment,
-                          bsdf_hemisphere=bsdf_hemisphere,
-                          spectral_data_wavelength_range_method=spectral_data_wavelength_range_method,
-                          number_visible_bands=number_visible_bands,
-                          number_solar_bands=number_solar_bands)
+    return standards.load(standard_file)
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "size"])
+
+_TRISTIMULUS_METHODS = ("COLOR_TRISTIMX", "COLOR_TRISTIMY", "COLOR_TRISTIMZ")
+# Methods that are not calculated by GlazingSystem.optical_method_results
+_NON_GENERIC_METHODS = ("THERMAL IR",) + _TRISTIMULUS_METHODS
+# Tolerance used to compare wavelengths in microns, the same as pywincalc.weighting
+_WAVELENGTH_TOLERANCE = 1e-6
+
+
+def _covers(wavelengths, method):
+    """Return whether measured wavelengths cover the numeric minimum and maximum wavelengths of a method."""
+    if method.min_wavelength.type == WavelengthBoundaryType.NUMBER and \
+            min(wavelengths) > method.min_wavelength.value + _WAVELENGTH_TOLERANCE:
+        return False
+    if method.max_wavelength.type == WavelengthBoundaryType.NUMBER and \
+            max(wavelengths) < method.max_wavelength.value - _WAVELENGTH_TOLERANCE:
+        return False
+    return True
+
+
+def _incidence_angles(thetas, phis):
+    thetas = list(thetas)
+    phis = list(phis)
+    if not phis:
+        phis = [0] * len(thetas)
+    elif len(phis) == 1:
+        phis = phis * len(thetas)
+    elif len(phis) != len(thetas):
+        raise ValueError("phis must be empty, contain a single value, or be the same length as thetas.")
+    return thetas, phis
+
+
+def _unpickle_glazing_system(cls, arguments, settings):
+    glazing_system = cls(**arguments)
+    for method_name, args, kwargs in settings:
+        getattr(glazing_system, method_name)(*args, **kwargs)
+    return glazing_system
+
+
+def _environments_state(environments):
+    return environments.outside.__getstate__(), environments.inside.__getstate__()
+
+
+class GlazingSystem(_GlazingSystem):
+    """Glazing system that keeps calculated results until something they depend on changes.
+
+    Thermal results depend on everything in the system.  Optical and color results only depend on the
+    solid layers and so are kept when e.g. the environments, size or tilt change.  Thermal results are
+    kept separately for each environment so switching back to an environment that was already
+    calculated does not solve the system again.  Results are returned as copies so changing them does not
+    change the cached results.
+
+    Solid layers given as ProductData are shared with every other glazing system made from the same
+    ProductData objects, see pywincalc.shared_layers.
+
+    If spectral_resampling_tolerance is given, n-band solid layers are first resampled to fewer wavelengths
+    so that their integrated SOLAR and PHOTOPIC results change by at most the tolerance, see
+    pywincalc.resampling.  spectral_resampling() returns the error bound achieved for each layer.
+
+    Glazing systems are pickled as their constructor arguments and the settings changed since, e.g. with
+    set_tilt or flip_layer, and are rebuilt from them when unpickled.  Cached results are not pickled.
+    Gap layers are pickled as the arguments they were created with, see pywincalc.gaps.
+    """
+
+    def __init__(self, solid_layers, gap_layers=[], optical_standard=None, width_meters=1.0,
+                 height_meters=1.0, tilt_degrees=90, environment=None, bsdf_hemisphere=None,
+                 spectral_data_wavelength_range_method=SpectalDataWavelengthRangeMethodType.FULL,
+                 number_visible_bands=5, number_solar_bands=10, spectral_resampling_tolerance=None):
+        if optical_standard is None:
+            optical_standard = standards.get()
+        if environment is None:
+            environment = nfrc_u_environments()
+        # Replayed when unpickling, see __reduce__
+        self._arguments = dict(solid_layers=list(solid_layers), gap_layers=list(gap_layers),
+                               optical_standard=optical_standard, width_meters=width_meters,
+                               height_meters=height_meters, tilt_degrees=tilt_degrees, environment=environment,
+                               bsdf_hemisphere=bsdf_hemisphere,
+                               spectral_data_wavelength_range_method=spectral_data_wavelength_range_method,
+                               number_visible_bands=number_visible_bands, number_solar_bands=number_solar_bands,
+                               spectral_resampling_tolerance=spectral_resampling_tolerance)
+        self._settings = {}
+        self._spectral_resampling_tolerance = spectral_resampling_tolerance
+        self._spectral_resampling = None
+        solid_layers = self._resample(solid_layers, optical_standard)
+        # Indexes of the layers this system has its own copy of, see flip_layer
+        self._private_layers = set()
+        # Kept to make copies for calculating optical results, which do not depend on anything else
+        self._optical_standard = optical_standard
+        self._gap_layers = list(gap_layers)
+        self._optical_options = dict(bsdf_hemisphere=bsdf_hemisphere,
+                                     spectral_data_wavelength_range_method=spectral_data_wavelength_range_method,
+                                     number_visible_bands=number_visible_bands,
+                                     number_solar_bands=number_solar_bands)
+        super().__init__(solid_layers=shared_layers.solid_layers(solid_layers), gap_layers=self._gap_layers,
+                         optical_standard=optical_standard,
+                         width_meters=width_meters, height_meters=height_meters,
+                         tilt_degrees=tilt_degrees, environment=environment,
+                         bsdf_hemisphere=bsdf_hemisphere,
+                         spectral_data_wavelength_range_method=spectral_data_wavelength_range_method,
+                         number_visible_bands=number_visible_bands,
+                         number_solar_bands=number_solar_bands)
+        self._thermal_results_by_environment = {}
+        self._thermal_results = self._thermal_results_by_environment.setdefault(
+            _environments_state(environment), {})
+        self._optical_results = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def __reduce__(self):
+        return _unpickle_glazing_system, (type(self), self._arguments, list(self._settings.values()))
+
+    def _record(self, key, method_name, *args, **kwargs):
+        # Moved to the end so settings are replayed in the order they were last changed
+        self._settings.pop(key, None)
+        self._settings[key] = (method_name, args, kwargs)
+
+    def _resample(self, solid_layers, optical_standard):
+        if self._spectral_resampling_tolerance is None:
+            return list(solid_layers)
+        from . import resampling
+
+        self._spectral_resampling = [resampling.resample(layer, self._spectral_resampling_tolerance,
+                                                         optical_standard) for layer in solid_layers]
+        return [result.product for result in self._spectral_resampling]
+
+    def spectral_resampling(self):
+        """Return a pywincalc.resampling.Resampling for each solid layer, or None without resampling."""
+        return None if self._spectral_resampling is None else list(self._spectral_resampling)
+
+    def _cached(self, results, key, calculate):
+        try:
+            result = results[key]
+            self._cache_hits += 1
+        except KeyError:
+            result = calculate()
+            results[key] = result
+            self._cache_misses += 1
+        # Do not let callers modify cached lists and results
+        return copy.copy(result)
+
+    def cache_info(self):
+        """Return the number of cache hits and misses and the number of results currently cached."""
+        thermal_size = sum(len(results) for results in self._thermal_results_by_environment.values())
+        return CacheInfo(self._cache_hits, self._cache_misses, thermal_size + len(self._optical_results))
+
+    def clear_cache(self):
+        """Remove all cached results.  The hit and miss counters are not reset."""
+        self._invalidate_all()
+
+    def _invalidate_thermal(self):
+        for results in self._thermal_results_by_environment.values():
+            results.clear()
+
+    def _invalidate_all(self):
+        self._invalidate_thermal()
+        self._optical_results.clear()
+
+    def u(self, theta=0, phi=0):
+        return self._cached(self._thermal_results, ("u", theta, phi),
+                            lambda: super(GlazingSystem, self).u(theta, phi))
+
+    def shgc(self, theta=0, phi=0):
+        return self._cached(self._thermal_results, ("shgc", theta, phi),
+                            lambda: super(GlazingSystem, self).shgc(theta, phi))
+
+    def layer_temperatures(self, system_type, theta=0, phi=0):
+        return self._cached(self._thermal_results, ("layer_temperatures", system_type, theta, phi),
+                            lambda: super(GlazingSystem, self).layer_temperatures(system_type, theta, phi))
+
+    def solid_layers_effective_conductivities(self, system_type, theta=0, phi=0):
+        return self._cached(self._thermal_results, ("solid_layers_effective_conductivities", system_type, theta, phi),
+                            lambda: super(GlazingSystem, self).solid_layers_effective_conductivities(system_type,
+                                                                                                     theta, phi))
+
+    def gap_layers_effective_conductivities(self, system_type, theta=0, phi=0):
+        return self._cached(self._thermal_results, ("gap_layers_effective_conductivities", system_type, theta, phi),
+                            lambda: super(GlazingSystem, self).gap_layers_effective_conductivities(system_type,
+                                                                                                   theta, phi))
+
+    def system_effective_conductivity(self, system_type, theta=0, phi=0):
+        return self._cached(self._thermal_results, ("system_effective_conductivity", system_type, theta, phi),
+                            lambda: super(GlazingSystem, self).system_effective_conductivity(system_type, theta, phi))
+
+    def relative_heat_gain(self, theta=0, phi=0):
+        return self._cached(self._thermal_results, ("relative_heat_gain", theta, phi),
+                            lambda: super(GlazingSystem, self).relative_heat_gain(theta, phi))
+
+    def calc_deflection_properties(self, system_type, theta=0, phi=0):
+        return self._cached(self._thermal_results, ("calc_deflection_properties", system_type, theta, phi),
+                            lambda: super(GlazingSystem, self).calc_deflection_properties(system_type, theta, phi))
+
+    def optical_method_results(self, method_name, theta=0, phi=0):
+        return self._cached(self._optical_results, ("optical_method_results", method_name, theta, phi),
+                            lambda: super(GlazingSystem, self).optical_method_results(method_name, theta, phi))
+
+    def color(self, theta=0, phi=0, tristimulus_x_method="COLOR_TRISTIMX", tristimulus_y_method="COLOR_TRISTIMY",
+              tristimulus_z_method="COLOR_TRISTIMZ"):
+        key = ("color", theta, phi, tristimulus_x_method, tristimulus_y_method, tristimulus_z_method)
+        return self._cached(self._optical_results, key,
+                            lambda: super(GlazingSystem, self).color(theta, phi, tristimulus_x_method,
+                                                                     tristimulus_y_method, tristimulus_z_method))
+
+    def _optical_copy(self):
+        return _GlazingSystem(solid_layers=super().solid_layers(), gap_layers=self._gap_layers,
+                              optical_standard=self._optical_standard, **self._optical_options)
+
+    def optical_results_all(self, methods=None, theta=0, phi=0, max_workers=1):
+        """Calculate optical results for many methods of the optical standard.
+
+        Returns a dict mapping each method name to its OpticalResults.  The method name "COLOR" gives the
+        color results of the COLOR_TRISTIMX, COLOR_TRISTIMY and COLOR_TRISTIMZ methods.  By default every
+        method of the standard is calculated except THERMAL IR, see pywincalc.calc_thermal_ir, and methods
+        with a wavelength range that is not covered by the measured data of every layer are left out.
+        Errors from every other method are raised.
+
+        WinCalc solves the layers again for every method.  With max_workers above 1 the methods that are
+        not cached yet are solved at the same time on copies of the system that share its solid layers.
+        Results are cached the same as optical_method_results and color.
+        """
+        if methods is None:
+            standard_methods = self._optical_standard.methods
+            methods = [name for name in standard_methods if name not in _NON_GENERIC_METHODS]
+            if all(name in standard_methods for name in _TRISTIMULUS_METHODS):
+                methods.append("COLOR")
+            layer_wavelengths = [wavelengths for wavelengths in
+                                 (layer.optical_data.wavelengths() for layer in super().solid_layers()) if wavelengths]
+            methods = [method for method in methods
+                       if all(_covers(wavelengths, standard_methods[name]) for wavelengths in layer_wavelengths
+                              for name in (_TRISTIMULUS_METHODS if method == "COLOR" else (method,)))]
+        methods = list(methods)
+
+        def key(method):
+            if method == "COLOR":
+                return ("color", theta, phi) + _TRISTIMULUS_METHODS
+            return ("optical_method_results", method, theta, phi)
+
+        def calculate(glazing_system, method):
+            if method == "COLOR":
+                return glazing_system.color(theta, phi)
+            return glazing_system.optical_method_results(method, theta, phi)
+
+        futures = {}
+        missing = [method for method in dict.fromkeys(methods) if key(method) not in self._optical_results]
+        if max_workers > 1 and len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {method: executor.submit(calculate, self._optical_copy(), method) for method in missing}
+
+        results = {}
+        for method in methods:
+            if method in futures:
+                results[method] = self._cached(self._optical_results, key(method), futures.pop(method).result)
+            else:
+                results[method] = calculate(self, method)
+        return results
+
+    def optical_results_table(self, methods, theta=0, phi=0):
+        """Calculate optical results for each method and return them as columns.
+
+        Returns the same dict of numpy arrays as pywincalc.results_to_columns with one row per method plus
+        a "method" column with the method names.
+        """
+        methods = list(methods)
+        columns = results_to_columns([self.optical_method_results(method, theta, phi) for method in methods])
+        columns["method"] = methods
+        return columns
+
+    def u_angles(self, thetas, phis=()):
+        """Calculate the U-value at each incidence angle and return a numpy array with one value per theta.
+
+        phis can be empty (all 0), a single value used for every theta, or one value per theta.  Each
+        angle is cached the same as u.
+        """
+        import numpy
+
+        return numpy.array([self.u(theta, phi) for theta, phi in zip(*_incidence_angles(thetas, phis))])
+
+    def shgc_angles(self, thetas, phis=()):
+        """Calculate the SHGC at each incidence angle, see u_angles."""
+        import numpy
+
+        return numpy.array([self.shgc(theta, phi) for theta, phi in zip(*_incidence_angles(thetas, phis))])
+
+    def optical_method_results_angles(self, method_name, thetas, phis=()):
+        """Calculate optical results for the method at each incidence angle and return them as columns.
+
+        Returns the same dict of numpy arrays as pywincalc.results_to_columns with one row per angle plus
+        "theta" and "phi" columns.  phis can be empty (all 0), a single value used for every theta, or one
+        value per theta.  Each angle is cached the same as optical_method_results.
+        """
+        import numpy
+
+        thetas, phis = _incidence_angles(thetas, phis)
+        columns = results_to_columns([self.optical_method_results(method_name, theta, phi)
+                                      for theta, phi in zip(thetas, phis)])
+        columns["theta"] = numpy.array(thetas, dtype=float)
+        columns["phi"] = numpy.array(phis, dtype=float)
+        return columns
+
+    def color_angles(self, thetas, phis=(), tristimulus_x_method="COLOR_TRISTIMX",
+                     tristimulus_y_method="COLOR_TRISTIMY", tristimulus_z_method="COLOR_TRISTIMZ"):
+        """Calculate color results at each incidence angle and return them as columns.
+
+        Returns the same dict of numpy arrays as pywincalc.color_results_to_columns with one row per angle
+        plus "theta" and "phi" columns.  Each angle is cached the same as color.
+        """
+        import numpy
+
+        thetas, phis = _incidence_angles(thetas, phis)
+        columns = color_results_to_columns([self.color(theta, phi, tristimulus_x_method, tristimulus_y_method,
+                                                       tristimulus_z_method)
+                                            for theta, phi in zip(thetas, phis)])
+        columns["theta"] = numpy.array(thetas, dtype=float)
+        columns["phi"] = numpy.array(phis, dtype=float)
+        return columns
+
+    def environments(self, *args, **kwargs):
+        if not (args or kwargs):
+            return super().environments()
+        environments = args[0] if args else kwargs["environments"]
+        self._arguments["environment"] = environments
+        state = _environments_state(environments)
+        if state == _environments_state(super().environments()):
+            # Setting the same environments again would only throw away the current thermal solution
+            return
+        super().environments(environments)
+        # Optical results do not depend on the environments and are kept as they are
+        self._thermal_results = self._thermal_results_by_environment.setdefault(state, {})
+
+    def set_applied_loads(self, loads):
+        self._invalidate_thermal()
+        self._record("set_applied_loads", "set_applied_loads", loads)
+        super().set_applied_loads(loads)
+
+    def set_height(self, height_meters):
+        self._invalidate_thermal()
+        self._record("set_height", "set_height", height_meters)
+        super().set_height(height_meters)
+
+    def set_width(self, width_meters):
+        self._invalidate_thermal()
+        self._record("set_width", "set_width", width_meters)
+        super().set_width(width_meters)
+
+    def set_tilt(self, tilt_degrees):
+        self._invalidate_thermal()
+        self._record("set_tilt", "set_tilt", tilt_degrees)
+        super().set_tilt(tilt_degrees)
+
+    def enable_deflection(self, enable):
+        self._invalidate_thermal()
+        self._record("enable_deflection", "enable_deflection", enable)
+        super().enable_deflection(enable)
+
+    def set_deflection_properties(self, *args, **kwargs):
+        self._invalidate_thermal()
+        self._record("set_deflection_properties", "set_deflection_properties", *args, **kwargs)
+        super().set_deflection_properties(*args, **kwargs)
+
+    def _private_layer(self, layer_index, layer):
+        try:
+            return copy.copy(layer)
+        except TypeError:
+            pass
+        product = self._arguments["solid_layers"][layer_index]
+        if self._spectral_resampling is not None:
+            product = self._spectral_resampling[layer_index].product
+        if isinstance(product, ProductData):
+            # Converting the product again gives a layer no other system uses
+            return convert_to_solid_layer(product)
+        # A layer passed in directly that cannot be copied, e.g. with optical data defined in Python, is
+        # flipped in place
+        return layer
+
+    def flip_layer(self, layer_index, flipped):
+        if layer_index not in self._private_layers:
+            # Flipping changes the layer in place.  Flip a copy so layers shared with other systems, e.g. the
+            # layers of ProductData, resampled products, or layers passed in directly, stay the same.
+            layers = super().solid_layers()
+            layers[layer_index] = self._private_layer(layer_index, layers[layer_index])
+            super().solid_layers(layers)
+            self._private_layers.add(layer_index)
+        self._invalidate_all()
+        self._record(("flip_layer", layer_index), "flip_layer", layer_index, flipped)
+        super().flip_layer(layer_index, flipped)
+
+    def solid_layers(self, *args, **kwargs):
+        if not args and not kwargs:
+            return super().solid_layers()
+        self._invalidate_all()
+        layers = args[0] if args else kwargs.pop("solid_layers")
+        self._arguments["solid_layers"] = list(layers)
+        # New layers are not flipped
+        self._settings = {key: setting for key, setting in self._settings.items() if setting[0] != "flip_layer"}
+        layers = self._resample(layers, self._optical_standard)
+        self._private_layers = set()
+        return super().solid_layers(shared_layers.solid_layers(layers), *args[1:], **kwargs)
@@ -0,0 +1,140 @@
+"""Binary file format for BSDF products.
+
+BSDF XML files store their matrices as text which is slow to parse.  This format stores the same product
+data with the matrices as raw doubles so that loading a product only needs to copy the matrices and the
+matrices can be memory-mapped.
+
+Layout (all integers and doubles are little-endian):
+
+    offset  size  contents
+    0       8     magic bytes b"PWCBSDF\\0"
+    8       4     uint32 format version, currently 1
+    12      4     uint32 length N of the metadata in bytes
+    16      N     metadata, UTF-8 encoded JSON
+    ...           zero padding to the next multiple of 8 bytes
+    ...           matrix data
+
+The metadata is a JSON object with
+    "product": the ProductData fields other than measurements, e.g. "product_name", "thickness",
+               "emissivity_front".  Missing values are null.
+    "matrices": a list with one object for each matrix with keys
+        "band": "solar" or "visible"
+        "property": "transmittance_front", "transmittance_back", "reflectance_front" or "reflectance_back"
+        "row_angle_basis_name", "column_angle_basis_name": the names of the angle bases of the matrix
+        "offset": the offset of the matrix from the start of the matrix data in bytes, a multiple of 8
+        "rows", "columns": the shape of the matrix
+
+Each matrix is stored as rows * columns doubles in row-major order.
+"""
+import json
+import struct
+
+import numpy
+
+from wincalcbindings import BSDF, DualBandBSDF, ProductData, WavelengthBSDFs
+
+MAGIC = b"PWCBSDF\0"
+FORMAT_VERSION = 1
+BANDS = ("solar", "visible")
+PROPERTIES = ("transmittance_front", "transmittance_back", "reflectance_front", "reflectance_back")
+PRODUCT_FIELDS = ("product_name", "product_type", "product_subtype", "nfrc_id", "thickness", "conductivity",
+                  "coating_name", "coated_side", "ir_transmittance", "emissivity_front", "emissivity_back",
+                  "permeability_factor", "density", "youngs_modulus")
+
+_HEADER = struct.Struct("<8sII")
+
+
+def _aligned(offset):
+    return (offset + 7) // 8 * 8
+
+
+def write_bsdf_binary(product, path):
+    """Write a BSDF product, e.g. the result of parse_bsdf_xml_file, to a binary BSDF file."""
+    if not isinstance(product.measurements, DualBandBSDF):
+        raise ValueError("Only products with BSDF measurements can be written to a binary BSDF file.")
+    if product.composition is not None or product.pv_power_properties is not None:
+        raise ValueError("Products with composition or PV power properties cannot be written to a binary BSDF file.")
+
+    matrices = []
+    arrays = []
+    offset = 0
+    for band in BANDS:
+        bsdfs = getattr(product.measurements, band)
+        for bsdf_property in PROPERTIES:
+            bsdf = getattr(bsdfs, bsdf_property)
+            array = numpy.ascontiguousarray(bsdf.data_array, dtype="<f8")
+            matrices.append({"band": band, "property": bsdf_property,
+                             "row_angle_basis_name": bsdf.row_angle_basis_name,
+                             "column_angle_basis_name": bsdf.column_angle_basis_name,
+                             "offset": offset, "rows": array.shape[0], "columns": array.shape[1]})
+            arrays.append(array)
+            offset += array.nbytes
+
+    metadata = json.dumps({"product": {field: getattr(product, field) for field in PRODUCT_FIELDS},
+                           "matrices": matrices}).encode("utf-8")
+    data_offset = _aligned(_HEADER.size + len(metadata))
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(metadata)))
+        f.write(metadata)
+        f.write(b"\0" * (data_offset - _HEADER.size - len(metadata)))
+        for array in arrays:
+            f.write(array.tobytes())
+
+
+def _read_metadata(f):
+    magic, version, metadata_size = _HEADER.unpack(f.read(_HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("Not a binary BSDF file.")
+    if version != FORMAT_VERSION:
+        raise ValueError("Unsupported binary BSDF file version {v}.".format(v=version))
+    metadata = json.loads(f.read(metadata_size).decode("utf-8"))
+    return metadata, _aligned(_HEADER.size + metadata_size)
+
+
+def read_bsdf_arrays(path):
+    """Memory-map the matrices in a binary BSDF file without copying them.
+
+    Returns a tuple of the metadata dict and a dict mapping (band, property) to a read-only 2D numpy array
+    backed by the file.  Processes that map the same file share the same physical memory.
+    """
+    with open(path, "rb") as f:
+        metadata, data_offset = _read_metadata(f)
+    arrays = {}
+    for matrix in metadata["matrices"]:
+        arrays[(matrix["band"], matrix["property"])] = numpy.memmap(
+            path, dtype="<f8", mode="r", offset=data_offset + matrix["offset"],
+            shape=(matrix["rows"], matrix["columns"]))
+    return metadata, arrays
+
+
+def read_bsdf_binary(path):
+    """Load a product from a binary BSDF file.
+
+    Returns ProductData that can be used the same way as the result of parse_bsdf_xml_file.  The matrices
+    are copied from the memory-mapped file directly, no text is parsed.
+    """
+    metadata, arrays = read_bsdf_arrays(path)
+    product = ProductData()
+    for field in PRODUCT_FIELDS:
+        setattr(product, field, metadata["product"].get(field))
+
+    measurements = DualBandBSDF()
+    for band in BANDS:
+        bsdfs = WavelengthBSDFs()
+        for matrix in metadata["matrices"]:
+            if matrix["band"] != band:
+                continue
+            bsdf = BSDF()
+            bsdf.data_array = arrays[(band, matrix["property"])]
+            bsdf.row_angle_basis_name = matrix["row_angle_basis_name"]
+            bsdf.column_angle_basis_name = matrix["column_angle_basis_name"]
+            setattr(bsdfs, matrix["property"], bsdf)
+        setattr(measurements, band, bsdfs)
+    product.measurements = measurements
+    return product
+
+
+def convert_bsdf_xml(xml_path, binary_path):
+    """Parse a BSDF XML file and write it to a binary BSDF file."""
+    from . import parse_bsdf_xml_file
+    write_bsdf_binary(parse_bsdf_xml_file(xml_path), binary_path)
@@ -0,0 +1,222 @@
+"""On-disk caches of parsed data.
+
+Parsed optical standards are always cached, see pywincalc.standards.
+
+Parsed product files can also be cached by the hash of their contents.  This is off by default.  Turn it on
+with enable() or by setting the PYWINCALC_PRODUCT_CACHE environment variable to 1.  The total size of the
+cached products is limited and the least recently used products are removed when the limit is reached.
+"""
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from threading import Lock
+
+# Increase when the layout of cached files changes so old cache files are ignored
+CACHE_FORMAT_VERSION = 1
+
+PRODUCT_CACHE_NAME = "products"
+PRODUCT_CACHE_SUFFIX = ".product"
+DEFAULT_MAX_SIZE_BYTES = 1 << 30
+
+_product_cache = {
+    "enabled": os.environ.get("PYWINCALC_PRODUCT_CACHE", "0").lower() in ("1", "true", "yes", "on"),
+    "max_size_bytes": int(os.environ.get("PYWINCALC_PRODUCT_CACHE_MAX_SIZE", DEFAULT_MAX_SIZE_BYTES)),
+}
+_eviction_lock = Lock()
+
+
+def cache_dir():
+    """Return the directory pywincalc stores cached data in.
+
+    Set the PYWINCALC_CACHE_DIR environment variable to use a different directory.
+    """
+    directory = os.environ.get("PYWINCALC_CACHE_DIR")
+    if directory:
+        return Path(directory)
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(base) / "pywincalc"
+
+
+def file_hash(path):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def hash_text(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def fingerprint(paths, relative_to, modification_times=True):
+    """Return a list of (relative path, size, mtime_ns, sha256) for each file.
+
+    Without modification_times mtime_ns is None so the fingerprint only depends on the contents of the
+    files, e.g. for files that are copied when installed.
+    """
+    result = []
+    for path in paths:
+        stat = os.stat(path)
+        result.append((str(Path(path).relative_to(relative_to)), stat.st_size,
+                       stat.st_mtime_ns if modification_times else None, file_hash(path)))
+    return result
+
+
+def fingerprint_matches(expected, relative_to):
+    """Check if the files in a fingerprint are unchanged.
+
+    Files with the same size and modification time are assumed to be unchanged.  Otherwise, or if the
+    fingerprint has no modification times, the contents are hashed so copying or reinstalling files with
+    new modification times does not invalidate the cache.
+    """
+    for relative_path, size, mtime_ns, sha256 in expected:
+        path = Path(relative_to) / relative_path
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_size != size:
+            return False
+        if (mtime_ns is None or stat.st_mtime_ns != mtime_ns) and file_hash(path) != sha256:
+            return False
+    return True
+
+
+def read(cache_file, is_valid):
+    """Read the value stored in a cache file.
+
+    Cache files hold a pickled header followed by the pickled value.  is_valid is called with the header
+    and the value is only unpickled if it returns True.  Returns None if the file does not exist, cannot be
+    read, or is not valid.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            header = pickle.load(f)
+            if header.get("format") != CACHE_FORMAT_VERSION or not is_valid(header):
+                return None
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, TypeError, ValueError):
+        return None
+
+
+def write(cache_file, header, value):
+    """Write a value to a cache file, replacing it atomically.  Failing to write the cache is not an error."""
+    cache_file = Path(cache_file)
+    header = dict(header, format=CACHE_FORMAT_VERSION)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        f = tempfile.NamedTemporaryFile(dir=cache_file.parent, delete=False)
+    except OSError:
+        return False
+    try:
+        with f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, cache_file)
+    except (OSError, pickle.PicklingError, TypeError):
+        try:
+            os.unlink(f.name)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def enable(max_size_bytes=None):
+    """Cache parsed product files on disk.  max_size_bytes limits the total size of the cached products."""
+    _product_cache["enabled"] = True
+    if max_size_bytes is not None:
+        _product_cache["max_size_bytes"] = max_size_bytes
+
+
+def disable():
+    """Stop using the product cache.  Files already cached are kept, see clear."""
+    _product_cache["enabled"] = False
+
+
+def is_enabled():
+    return _product_cache["enabled"]
+
+
+def product_cache_dir():
+    return cache_dir() / PRODUCT_CACHE_NAME
+
+
+def _product_cache_files():
+    return list(product_cache_dir().glob("*/*" + PRODUCT_CACHE_SUFFIX))
+
+
+def size():
+    """Return the total size in bytes of the cached products."""
+    total = 0
+    for cache_file in _product_cache_files():
+        try:
+            total += cache_file.stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+def clear():
+    """Remove all cached products."""
+    for cache_file in _product_cache_files():
+        try:
+            cache_file.unlink()
+        except OSError:
+            pass
+
+
+def evict(max_size_bytes=None):
+    """Remove the least recently used cached products until their total size is at most max_size_bytes."""
+    if max_size_bytes is None:
+        max_size_bytes = _product_cache["max_size_bytes"]
+    with _eviction_lock:
+        entries = []
+        for cache_file in _product_cache_files():
+            try:
+                stat = cache_file.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, cache_file))
+        total = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, cache_file in sorted(entries, key=lambda entry: entry[0]):
+            if total <= max_size_bytes:
+                break
+            try:
+                cache_file.unlink()
+            except OSError:
+                continue
+            total -= entry_size
+
+
+def cached_parse(kind, path, parse):
+    """Return parse(path), reading the result from the product cache if the cache is enabled.
+
+    Results are stored by kind and the sha256 of the file contents so renaming or copying a file still uses
+    the cache and changing it does not.
+    """
+    if not _product_cache["enabled"]:
+        return parse(path)
+    content_hash = file_hash(path)
+    cache_file = product_cache_dir() / content_hash[:2] / (content_hash + "-" + kind + PRODUCT_CACHE_SUFFIX)
+    product = read(cache_file, lambda header: header.get("kind") == kind and header.get("sha256") == content_hash)
+    if product is not None:
+        try:
+            # Cached products are evicted least recently used first
+            os.utime(cache_file)
+        except OSError:
+            pass
+        return product
+    product = parse(path)
+    if write(cache_file, {"kind": kind, "sha256": content_hash}, product):
+        evict()
+    return product
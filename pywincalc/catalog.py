@@ -0,0 +1,279 @@
+"""A local SQLite index of products and their integrated optical properties.
+
+Filtering products by their optical properties normally means parsing every product and integrating its
+spectral data.  A Catalog does that once when a product is added and stores the results so that later
+queries only read the database:
+
+    catalog = pywincalc.catalog.Catalog("products.sqlite")
+    catalog.add_files(Path("products").glob("*.json"))
+    high_vt_low_e = catalog.query("tvis > 0.9 AND emissivity_back < 0.1")
+
+Each product is stored in the products table with the columns in PRODUCT_COLUMNS.  The integrated results
+in RESULT_COLUMNS are stored in the integrated_results table with one row per product and optical standard.
+query joins the two tables for one standard so conditions can use the columns of both.
+"""
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from wincalcbindings import (BSDFBasisType, BSDFHemisphere, DualBandBSDF, calc_thermal_ir,
+                             convert_to_solid_layer, parse_bsdf_xml_file, parse_json_file, parse_optics_file)
+
+from . import cache, standards
+
+PRODUCT_COLUMNS = ("product_name", "product_type", "product_subtype", "nfrc_id", "thickness", "coated_side",
+                   "emissivity_front", "emissivity_back")
+# Front transmittances and front and back reflectances are direct-hemispherical at normal incidence.  The
+# thermal IR results are the diffuse-diffuse transmittances and hemispheric emissivities from calc_thermal_ir.
+RESULT_COLUMNS = ("tsol", "rf_sol", "rb_sol", "tvis", "rf_vis", "rb_vis", "tir_front", "tir_back",
+                  "emissivity_front_hemispheric", "emissivity_back_hemispheric")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    source TEXT UNIQUE,
+    sha256 TEXT,
+    product_name TEXT,
+    product_type TEXT,
+    product_subtype TEXT,
+    nfrc_id INTEGER,
+    thickness REAL,
+    coated_side TEXT,
+    emissivity_front REAL,
+    emissivity_back REAL
+);
+CREATE TABLE IF NOT EXISTS integrated_results (
+    product_id INTEGER NOT NULL REFERENCES products(id) ON DELETE CASCADE,
+    standard TEXT NOT NULL,
+    tsol REAL,
+    rf_sol REAL,
+    rb_sol REAL,
+    tvis REAL,
+    rf_vis REAL,
+    rb_vis REAL,
+    tir_front REAL,
+    tir_back REAL,
+    emissivity_front_hemispheric REAL,
+    emissivity_back_hemispheric REAL,
+    PRIMARY KEY (product_id, standard)
+);
+CREATE INDEX IF NOT EXISTS integrated_results_tsol ON integrated_results (standard, tsol);
+CREATE INDEX IF NOT EXISTS integrated_results_tvis ON integrated_results (standard, tvis);
+CREATE INDEX IF NOT EXISTS products_emissivity_back ON products (emissivity_back);
+CREATE INDEX IF NOT EXISTS products_nfrc_id ON products (nfrc_id);
+"""
+
+
+def parse_product_file(path):
+    """Parse a product file, picking the parser from the file extension like parse_product_header."""
+    extension = os.path.splitext(os.fspath(path))[1].lower()
+    if extension == ".json":
+        return parse_json_file(str(path))
+    if extension == ".xml":
+        return parse_bsdf_xml_file(str(path))
+    return parse_optics_file(str(path))
+
+
+def integrated_results(product, optical_standard, bsdf_hemisphere=None):
+    """Calculate the values in RESULT_COLUMNS for a single product.
+
+    bsdf_hemisphere is only used for BSDF products and shades made from a material and a geometry.  Glazings
+    are always integrated without one since calculating a BSDF for a specular layer is much slower.  Results
+    that cannot be calculated for the product, e.g. thermal IR results for shades, are None.
+    """
+    from . import GlazingSystem
+
+    if not isinstance(product.measurements, DualBandBSDF) and product.composition is None:
+        bsdf_hemisphere = None
+    solid_layer = convert_to_solid_layer(product)
+    glazing_system = GlazingSystem(solid_layers=[solid_layer], optical_standard=optical_standard,
+                                   bsdf_hemisphere=bsdf_hemisphere)
+    results = dict.fromkeys(RESULT_COLUMNS)
+    for method, suffix in (("SOLAR", "sol"), ("PHOTOPIC", "vis")):
+        system_results = glazing_system.optical_method_results(method).system_results
+        results["t" + suffix] = system_results.front.transmittance.direct_hemispherical
+        results["rf_" + suffix] = system_results.front.reflectance.direct_hemispherical
+        results["rb_" + suffix] = system_results.back.reflectance.direct_hemispherical
+    try:
+        thermal_ir = calc_thermal_ir(optical_standard, solid_layer)
+    except RuntimeError:
+        return results
+    results["tir_front"] = thermal_ir.transmittance_front_diffuse_diffuse
+    results["tir_back"] = thermal_ir.transmittance_back_diffuse_diffuse
+    results["emissivity_front_hemispheric"] = thermal_ir.emissivity_front_hemispheric
+    results["emissivity_back_hemispheric"] = thermal_ir.emissivity_back_hemispheric
+    return results
+
+
+class CatalogImportError(Exception):
+    """Some files passed to Catalog.add_files could not be added.
+
+    failures maps the path of each file that could not be added to the exception raised for it.  added is
+    the number of the other files that were parsed and added.
+    """
+
+    def __init__(self, failures, added):
+        super().__init__("{n} files could not be added to the catalog: {f}".format(
+            n=len(failures), f=", ".join("{p} ({t}: {e})".format(p=path, t=type(e).__name__, e=e)
+                                         for path, e in failures.items())))
+        self.failures = failures
+        self.added = added
+
+
+class Catalog:
+    """Products and their integrated results for one or more optical standards, stored in SQLite.
+
+    path is the database file, ":memory:" keeps the catalog in memory.  standard_names are the optical
+    standards results are calculated for when products are added, by name or path, see pywincalc.standards.
+    BSDF products and shades are integrated using bsdf_hemisphere which defaults to the full Klems basis.
+    """
+
+    def __init__(self, path=":memory:", standard_names=(standards.DEFAULT_STANDARD,), bsdf_hemisphere=None):
+        self.path = path
+        self.standard_names = tuple(standard_names)
+        self._bsdf_hemisphere = bsdf_hemisphere
+        self._connection = sqlite3.connect(os.fspath(path))
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def _hemisphere(self):
+        if self._bsdf_hemisphere is None:
+            self._bsdf_hemisphere = BSDFHemisphere.create(BSDFBasisType.FULL)
+        return self._bsdf_hemisphere
+
+    def _rows(self, product, standard_names=None):
+        product_row = {column: getattr(product, column) for column in PRODUCT_COLUMNS}
+        result_rows = {name: integrated_results(product, standards.get(name), self._hemisphere())
+                       for name in (self.standard_names if standard_names is None else standard_names)}
+        return product_row, result_rows
+
+    def _insert_results(self, product_id, result_rows):
+        columns = ("product_id", "standard") + RESULT_COLUMNS
+        self._connection.executemany(
+            "INSERT INTO integrated_results ({c}) VALUES ({p})".format(c=", ".join(columns),
+                                                                      p=", ".join("?" * len(columns))),
+            [(product_id, name) + tuple(results[column] for column in RESULT_COLUMNS)
+             for name, results in result_rows.items()])
+
+    def _store(self, product_row, result_rows, source=None, sha256=None):
+        with self._connection:
+            if source is not None:
+                self._connection.execute("DELETE FROM products WHERE source = ?", (source,))
+            columns = ("source", "sha256") + PRODUCT_COLUMNS
+            cursor = self._connection.execute(
+                "INSERT INTO products ({c}) VALUES ({p})".format(c=", ".join(columns), p=", ".join("?" * len(columns))),
+                (source, sha256) + tuple(product_row[column] for column in PRODUCT_COLUMNS))
+            product_id = cursor.lastrowid
+            self._insert_results(product_id, result_rows)
+        return product_id
+
+    def add(self, product, source=None):
+        """Add parsed ProductData to the catalog and return its id.
+
+        If source is given it identifies the product, e.g. its file path, and replaces any product previously
+        added with the same source.
+        """
+        product_row, result_rows = self._rows(product)
+        return self._store(product_row, result_rows, source)
+
+    def _sources(self):
+        # The id, sha256 and the standards with results of every product added from a file, by source
+        sources = {source: (product_id, sha256, set()) for product_id, source, sha256 in self._connection.execute(
+            "SELECT id, source, sha256 FROM products WHERE source IS NOT NULL")}
+        for source, standard in self._connection.execute(
+                "SELECT products.source, integrated_results.standard FROM products JOIN integrated_results "
+                "ON integrated_results.product_id = products.id WHERE products.source IS NOT NULL"):
+            sources[source][2].add(standard)
+        return sources
+
+    def _file_rows(self, path, standard_names):
+        return self._rows(cache.cached_parse("product_file", path, parse_product_file), standard_names)
+
+    def add_files(self, paths, workers=None):
+        """Parse product files and add them to the catalog on a pool of threads.
+
+        Files are identified by their absolute path.  Files already in the catalog are only parsed again if
+        their contents have changed or if they have no results for some of the catalog's standard_names,
+        e.g. when an existing catalog is opened with another standard.  Only the missing results are then
+        calculated.  Returns the number of files that were parsed and added or integrated.  Every file that
+        can be added is added before CatalogImportError is raised for the files that could not be read,
+        parsed or integrated.
+        """
+        # Create the hemisphere before starting the threads that share it
+        self._hemisphere()
+        sources = self._sources()
+        failures = {}
+        hashes = {}
+        for path in paths:
+            path = str(Path(path).resolve())
+            try:
+                hashes[path] = cache.file_hash(path)
+            except OSError as e:
+                failures[path] = e
+        # The id of the product to add results to, None for files to add again, and the standards to integrate
+        work = {}
+        for path, sha256 in hashes.items():
+            product_id, known_sha256, known_standards = sources.get(path, (None, None, set()))
+            if known_sha256 != sha256:
+                work[path] = (None, self.standard_names)
+                continue
+            missing = tuple(name for name in self.standard_names if name not in known_standards)
+            if missing:
+                work[path] = (product_id, missing)
+        added = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._file_rows, path, standard_names): path
+                       for path, (_, standard_names) in work.items()}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    product_row, result_rows = future.result()
+                except Exception as e:
+                    failures[path] = e
+                    continue
+                product_id = work[path][0]
+                if product_id is None:
+                    self._store(product_row, result_rows, path, hashes[path])
+                else:
+                    with self._connection:
+                        self._insert_results(product_id, result_rows)
+                added += 1
+        if failures:
+            raise CatalogImportError(failures, added)
+        return added
+
+    def remove(self, product_id):
+        with self._connection:
+            self._connection.execute("DELETE FROM products WHERE id = ?", (product_id,))
+
+    def query(self, where=None, parameters=(), standard=standards.DEFAULT_STANDARD, order_by=None, limit=None):
+        """Return the products matching an SQL condition as a list of dicts.
+
+        where can use the columns in PRODUCT_COLUMNS and RESULT_COLUMNS as well as id and source, e.g.
+        "tvis > ? AND emissivity_back < ?" with parameters (0.9, 0.1).  Results are the ones calculated with
+        standard, which must be one of the catalog's standard_names.
+        """
+        sql = ("SELECT products.*, {r} FROM products JOIN integrated_results "
+               "ON integrated_results.product_id = products.id WHERE integrated_results.standard = ?").format(
+            r=", ".join("integrated_results." + column for column in RESULT_COLUMNS))
+        if where:
+            sql += " AND ({w})".format(w=where)
+        if order_by:
+            sql += " ORDER BY " + order_by
+        if limit is not None:
+            sql += " LIMIT {n:d}".format(n=limit)
+        return [dict(row) for row in self._connection.execute(sql, (standard,) + tuple(parameters))]
@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from wincalcbindings import (get_cma_window_double_vision_horizontal, get_cma_window_double_vision_vertical,
+                             get_cma_window_single_vision, get_spacer_keff, parse_thmx_file)
+
+from . import cache
+
+
+def compact_thmx(thmx):
+    """Remove the geometry from parsed thmx file contents.
+
+    The polygons and boundary condition polygons make up most of a parsed thmx file but CMA calculations only
+    use the U-factor results and the CMA options.  Returns thmx after modifying it.
+    """
+    thmx.polygons = []
+    thmx.boundary_condition_polygons = []
+    return thmx
+
+
+def _parse_compact_thmx(path):
+    return compact_thmx(parse_thmx_file(str(path)))
+
+
+class CMAFrameLibrary:
+    """Parsed THERM frame and spacer files for building CMA windows.
+
+    Each thmx file is parsed once and only the parts needed for CMA calculations are kept.  Frames are
+    looked up by the name of their file without the extension, e.g. library["sample-head_CMA"].  Spacer
+    effective conductivities are calculated once per spacer.
+    """
+
+    def __init__(self, frames=None):
+        self._frames = dict(frames or {})
+        self._spacer_keffs = {}
+
+    @classmethod
+    def from_directory(cls, directory, pattern="*.thmx", workers=None, cache_file=None):
+        """Parse all thmx files in directory matching pattern on a pool of threads.
+
+        If cache_file is given the compacted frames are saved there and reused by later calls for as long as
+        none of the thmx files have changed.  Set cache_file to True to store it in the pywincalc cache
+        directory.
+        """
+        directory = Path(directory).resolve()
+        paths = sorted(directory.glob(pattern))
+        if cache_file is True:
+            cache_file = cache.cache_dir() / "cma" / (cache.hash_text(str(directory) + "\n" + pattern) + ".frames")
+        if cache_file is not None:
+            frames = cache.read(cache_file, lambda header: header["files"] == [
+                str(path.relative_to(directory)) for path in paths] and cache.fingerprint_matches(
+                header["fingerprint"], directory))
+            if frames is not None:
+                return cls(frames)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            frames = dict(zip((path.stem for path in paths), executor.map(_parse_compact_thmx, paths)))
+
+        if cache_file is not None:
+            cache.write(cache_file, {"files": [str(path.relative_to(directory)) for path in paths],
+                                     "fingerprint": cache.fingerprint(paths, directory)}, frames)
+        return cls(frames)
+
+    @classmethod
+    def load(cls, path):
+        """Load a library saved with save."""
+        frames = cache.read(path, lambda header: header.get("kind") == "cma_frame_library")
+        if frames is None:
+            raise ValueError("{p} is not a saved CMA frame library.".format(p=path))
+        return cls(frames)
+
+    def save(self, path):
+        """Save the compacted frames so they can be loaded without parsing the thmx files again."""
+        if not cache.write(path, {"kind": "cma_frame_library"}, self._frames):
+            raise OSError("Could not save CMA frame library to {p}.".format(p=path))
+
+    def add(self, name, thmx):
+        """Add parsed thmx file contents, or the path to a thmx file, to the library."""
+        if isinstance(thmx, (str, Path)):
+            thmx = parse_thmx_file(str(thmx))
+        self._frames[name] = compact_thmx(thmx)
+        self._spacer_keffs.pop(name, None)
+
+    def names(self):
+        return sorted(self._frames)
+
+    def __getitem__(self, name):
+        return self._frames[name]
+
+    def __contains__(self, name):
+        return name in self._frames
+
+    def __len__(self):
+        return len(self._frames)
+
+    def spacer_keff(self, name):
+        """Effective conductivity of the spacer in the named thmx file."""
+        if name not in self._spacer_keffs:
+            self._spacer_keffs[name] = get_spacer_keff(self._frames[name])
+        return self._spacer_keffs[name]
+
+    def single_vision(self, top, bottom, left, right, width, height):
+        """Get the CMA window for a single vision window from the names of its frames."""
+        return get_cma_window_single_vision(self[top], self[bottom], self[left], self[right], width, height)
+
+    def double_vision_vertical(self, top, bottom, top_left, top_right, bottom_left, bottom_right, meeting_rail,
+                               width, height):
+        """Get the CMA window for a vertical double vision window from the names of its frames."""
+        return get_cma_window_double_vision_vertical(self[top], self[bottom], self[top_left], self[top_right],
+                                                     self[bottom_left], self[bottom_right], self[meeting_rail],
+                                                     width, height)
+
+    def double_vision_horizontal(self, top_left, top_right, bottom_left, bottom_right, left, right, meeting_rail,
+                                 width, height):
+        """Get the CMA window for a horizontal double vision window from the names of its frames."""
+        return get_cma_window_double_vision_horizontal(self[top_left], self[top_right], self[bottom_left],
+                                                       self[bottom_right], self[left], self[right],
+                                                       self[meeting_rail], width, height)
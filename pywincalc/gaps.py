@@ -0,0 +1,102 @@
+"""Gases and gap layers that can be pickled.
+
+Gases and gap layers are created in C++ and their state cannot be read back from Python.  Instead pywincalc
+keeps the arguments each of them was created with, the same way GlazingSystem keeps its constructor
+arguments, and pickles them as those arguments so they are created again when unpickled.  This covers
+gases made with create_gas or Layers.default_vacuum_mixture, custom GasData and GasCoefficients, and gap
+layers made with Layers.gap, Layers.create_pillar, forced_ventilation_gap or the IGUGapLayer,
+IGUVentilatedGapLayer and pillar layer constructors.  Glazing systems with gaps can therefore be sent to
+worker processes, see pywincalc.map_systems.
+
+A gas that was changed with add_gas_item or add_gas_items after it was created cannot be pickled and
+neither can gap layers made from it.
+"""
+import copyreg
+import functools
+import types
+import weakref
+from threading import Lock
+
+import wincalcbindings
+from wincalcbindings import (
+    AnnulusCylinderPillarLayer, CShapedCylinderPillarLayer, CylindricalPillarLayer, Gas, GasCoefficients, GasData,
+    HexagonPillarLayer, IGUGapLayer, IGUVentilatedGapLayer, LinearBearingPillarLayer, MeasuredPillarLayer,
+    PentagonPillarLayer, RectangularPillarLayer, SphericalPillarLayer, TriangularPillarLayer,
+    TruncatedConePillarLayer)
+
+_CLASSES = (GasCoefficients, GasData, IGUGapLayer, IGUVentilatedGapLayer, CylindricalPillarLayer,
+            SphericalPillarLayer, RectangularPillarLayer, TriangularPillarLayer, PentagonPillarLayer,
+            HexagonPillarLayer, LinearBearingPillarLayer, TruncatedConePillarLayer, AnnulusCylinderPillarLayer,
+            CShapedCylinderPillarLayer, MeasuredPillarLayer)
+
+# The name of the factory and the arguments each object was created with, keyed by the object so they are
+# dropped with it
+_arguments = weakref.WeakKeyDictionary()
+_factories = {}
+_lock = Lock()
+
+
+def _state(value):
+    # The only part of a gas that can be read back, used to tell whether it was changed after it was created
+    return value.total_percent() if isinstance(value, Gas) else None
+
+
+def _record(value, name, args, kwargs):
+    with _lock:
+        _arguments[value] = (name, args, kwargs, _state(value))
+
+
+def _keep_arguments(name, factory):
+    @functools.wraps(factory, assigned=("__name__", "__doc__"))
+    def create(*args, **kwargs):
+        value = factory(*args, **kwargs)
+        _record(value, name, args, kwargs)
+        return value
+
+    _factories[name] = create
+    return create
+
+
+def _keep_constructor_arguments(cls):
+    init = cls.__init__
+
+    @functools.wraps(init, assigned=("__name__", "__doc__"))
+    def __init__(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        _record(self, cls.__name__, args, kwargs)
+
+    cls.__init__ = __init__
+    _factories[cls.__name__] = cls
+
+
+def _create(name, args, kwargs):
+    return _factories[name](*args, **kwargs)
+
+
+def _reduce(value):
+    with _lock:
+        arguments = _arguments.get(value)
+    if arguments is None:
+        raise TypeError("cannot pickle a {t} that was not created with pywincalc".format(t=type(value).__name__))
+    name, args, kwargs, state = arguments
+    if _state(value) != state:
+        raise TypeError("cannot pickle a {t} that was changed after it was created".format(t=type(value).__name__))
+    return _create, (name, args, kwargs)
+
+
+for _cls in _CLASSES:
+    _keep_constructor_arguments(_cls)
+for _cls in (Gas,) + _CLASSES:
+    copyreg.pickle(_cls, _reduce)
+
+create_gas = _keep_arguments("create_gas", wincalcbindings.create_gas)
+forced_ventilation_gap = _keep_arguments("forced_ventilation_gap", wincalcbindings.forced_ventilation_gap)
+
+# The factories of wincalcbindings.Layers with those that create gases and gap layers keeping their arguments
+Layers = types.ModuleType("pywincalc.Layers", wincalcbindings.Layers.__doc__)
+for _name, _value in vars(wincalcbindings.Layers).items():
+    if not _name.startswith("__"):
+        setattr(Layers, _name, _value)
+for _name in ("gap", "forced_ventilation_gap", "create_pillar", "default_vacuum_mixture"):
+    setattr(Layers, _name, _keep_arguments("Layers." + _name, getattr(wincalcbindings.Layers, _name)))
+del _cls, _name, _value
@@ -0,0 +1,239 @@
+"""Read only the descriptive header of product files.
+
+parse_optics_file, parse_json and parse_bsdf_xml_file read all measured data in a file.  Listing or indexing
+products only needs a few fields from the start of each file, so these functions stop reading as soon as
+those fields have been found and do not create any measurement data.
+
+The values match the fields of the same name in the ProductData returned by the full parsers.
+"""
+import codecs
+import json
+import os
+import re
+import xml.etree.ElementTree as ElementTree
+from collections import namedtuple
+
+ProductHeader = namedtuple("ProductHeader", ["product_name", "product_type", "product_subtype", "nfrc_id",
+                                             "thickness", "coated_side", "emissivity_front", "emissivity_back"])
+ProductHeader.__new__.__defaults__ = (None,) * len(ProductHeader._fields)
+
+_OPTICS_FIELD = re.compile(r"^\{\s*([^}:]*?)\s*(?::\s*(.*?))?\s*\}\s*(.*?)\s*$")
+_EMISSIVITY = re.compile(r"Emis\s*=\s*(\S+)\s+(\S+)")
+# Every Optics file starts with this field, e.g. { Units, Wavelength Units } SI Microns
+_OPTICS_UNITS_FIELD = "units, wavelength units"
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _decode(line):
+    # Files exported from Optics on Windows are not always UTF-8
+    try:
+        return line.decode("utf-8")
+    except UnicodeDecodeError:
+        return line.decode("cp1252", errors="replace")
+
+
+def parse_optics_file_header(path):
+    """Read the header of an Optics file (.dat, .lof, .afg, ...).
+
+    Raises ValueError if the file does not start with the units field of an Optics header.
+    """
+    fields = {}
+    with open(path, "rb") as f:
+        for line in f:
+            line = _decode(line).strip()
+            if not line:
+                continue
+            match = _OPTICS_FIELD.match(line)
+            if match is None:
+                # The header ends at the first line of wavelength data
+                break
+            name, value, rest = match.groups()
+            fields[name.lower()] = value if value is not None else rest
+
+    if _OPTICS_UNITS_FIELD not in fields:
+        raise ValueError("{p} is not an Optics file.".format(p=os.fspath(path)))
+    emissivity = _EMISSIVITY.search(fields.get("emissivity, front back", ""))
+    return ProductHeader(product_name=fields.get("product name") or None,
+                         product_type="glazing",
+                         product_subtype=fields.get("type") or None,
+                         nfrc_id=_int(fields.get("nfrc id")),
+                         thickness=_float(fields.get("thickness")),
+                         coated_side=fields.get("coated side") or None,
+                         emissivity_front=_float(emissivity.group(1)) if emissivity else None,
+                         emissivity_back=_float(emissivity.group(2)) if emissivity else None)
+
+
+_json_decoder = json.JSONDecoder()
+_json_whitespace = re.compile(r"[ \t\n\r]*")
+_JSON_HEADER_MEMBERS = {"nfrc_id", "type", "subtype", "coated_side"}
+# v1 JSON has product_name and measured_data, v2 JSON has name and physical_properties
+_JSON_NAME_MEMBERS = {"measured_data": "product_name", "physical_properties": "name"}
+_JSON_MEASUREMENT_MEMBERS = {"measured_data": {"thickness", "emissivity_front", "emissivity_back"},
+                             "physical_properties": {"thickness", "predefined_emissivity_front",
+                                                     "predefined_emissivity_back"}}
+# The size of the first part of a JSON file that is read, each further part is twice as big as the last
+_JSON_CHUNK_SIZE = 64 * 1024
+
+
+def _json_header_complete(fields):
+    for measurements, name in _JSON_NAME_MEMBERS.items():
+        if measurements in fields:
+            return ((_JSON_HEADER_MEMBERS | {name}).issubset(fields) and
+                    _JSON_MEASUREMENT_MEMBERS[measurements].issubset(fields[measurements]))
+    return False
+
+
+def _read_json_object(text, index, fields, wanted, nested, complete):
+    """Decode the members in wanted and nested of the JSON object starting at text[index] into fields.
+
+    Objects in nested are read the same way with nested[key] as the members wanted from them.  Members can
+    be in any order.  Stops as soon as complete() is true.  Returns the index after the object, or None if
+    it stopped early.
+    """
+    if text[index] != "{":
+        raise ValueError("Expected a JSON object at position {i}.".format(i=index))
+    index = _json_whitespace.match(text, index + 1).end()
+    if text[index] == "}":
+        return index + 1
+    while True:
+        key, index = json.decoder.scanstring(text, index + 1)
+        index = _json_whitespace.match(text, index).end()
+        if text[index] != ":":
+            raise ValueError("Expected ':' at position {i}.".format(i=index))
+        index = _json_whitespace.match(text, index + 1).end()
+        if key in nested and text[index] == "{":
+            fields[key] = {}
+            index = _read_json_object(text, index, fields[key], nested[key], {}, complete)
+            if index is None:
+                return None
+        else:
+            value, index = _json_decoder.raw_decode(text, index)
+            index = _json_whitespace.match(text, index).end()
+            # A number at the end of a partly read text may have been cut off
+            if index == len(text):
+                raise ValueError("Unexpected end of JSON at position {i}.".format(i=index))
+            if key in wanted or key in nested:
+                fields[key] = value
+                if complete():
+                    return None
+        index = _json_whitespace.match(text, index).end()
+        if text[index] == "}":
+            return index + 1
+        if text[index] != ",":
+            raise ValueError("Expected ',' at position {i}.".format(i=index))
+        index = _json_whitespace.match(text, index + 1).end()
+
+
+def parse_json_header(product_json):
+    """Read the header of IGSDB JSON, v1 or v2, given as a str or bytes.
+
+    Reading stops once all header fields have been found.  Fields that come after the measured data are
+    still found but the measured data in front of them is decoded.
+    """
+    if isinstance(product_json, bytes):
+        product_json = product_json.decode("utf-8")
+    index = _json_whitespace.match(product_json).end()
+    fields = {}
+    _read_json_object(product_json, index, fields, _JSON_HEADER_MEMBERS | set(_JSON_NAME_MEMBERS.values()),
+                      _JSON_MEASUREMENT_MEMBERS, lambda: _json_header_complete(fields))
+    if fields.get("physical_properties") is not None:
+        properties = fields["physical_properties"]
+        emissivity_front = properties.get("predefined_emissivity_front")
+        emissivity_back = properties.get("predefined_emissivity_back")
+    else:
+        properties = fields.get("measured_data") or {}
+        emissivity_front = properties.get("emissivity_front")
+        emissivity_back = properties.get("emissivity_back")
+    return ProductHeader(product_name=fields.get("product_name") or fields.get("name") or None,
+                         product_type=fields.get("type"),
+                         product_subtype=fields.get("subtype"),
+                         nfrc_id=fields.get("nfrc_id"),
+                         thickness=properties.get("thickness"),
+                         coated_side=fields.get("coated_side"),
+                         emissivity_front=emissivity_front,
+                         emissivity_back=emissivity_back)
+
+
+def parse_json_file_header(path):
+    """Read the header of an IGSDB JSON file.
+
+    The file is read in parts of growing size until all header fields have been found, so usually only
+    the start of the file is read.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    text = ""
+    size = _JSON_CHUNK_SIZE
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(size)
+            text += decoder.decode(chunk, final=not chunk)
+            try:
+                return parse_json_header(text)
+            except (ValueError, IndexError):
+                # The header may continue in the part of the file that has not been read yet
+                if not chunk:
+                    raise
+            size *= 2
+
+
+_XML_MATERIAL_FIELDS = {"Name", "Thickness", "EmissivityFront", "EmissivityBack"}
+
+
+def _local_name(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def parse_bsdf_xml_file_header(path):
+    """Read the header of a BSDF XML file.  Only the Material element of the first layer is read."""
+    fields = {}
+    thickness_unit = None
+    in_material = False
+    with open(path, "rb") as f:
+        for event, element in ElementTree.iterparse(f, events=("start", "end")):
+            name = _local_name(element.tag)
+            if event == "start":
+                in_material = in_material or name == "Material"
+                if name in ("DataDefinition", "WavelengthData"):
+                    break
+            elif name == "Material":
+                break
+            elif in_material and name in _XML_MATERIAL_FIELDS:
+                fields[name] = (element.text or "").strip()
+                if name == "Thickness":
+                    thickness_unit = element.get("unit", "Millimeter").lower()
+
+    thickness = _float(fields.get("Thickness"))
+    if thickness is not None and thickness_unit == "meter":
+        thickness *= 1000
+    return ProductHeader(product_name=fields.get("Name") or None,
+                         product_type="",
+                         thickness=thickness,
+                         emissivity_front=_float(fields.get("EmissivityFront")),
+                         emissivity_back=_float(fields.get("EmissivityBack")))
+
+
+def parse_product_header(path):
+    """Read the header of a product file, picking the parser from the file extension.
+
+    .json files are read as IGSDB JSON, .xml files as BSDF XML and anything else as an Optics file.  Raises
+    ValueError for files that are none of these, e.g. THERM files.
+    """
+    extension = os.path.splitext(os.fspath(path))[1].lower()
+    if extension == ".json":
+        return parse_json_file_header(path)
+    if extension == ".xml":
+        return parse_bsdf_xml_file_header(path)
+    return parse_optics_file_header(path)
@@ -0,0 +1,359 @@
+"""Concurrent downloads from the IGSDB.
+
+IGSDBClient is an asyncio client for the IGSDB web API.  Requests share a pool of keep-alive connections,
+at most max_concurrency requests are in flight at once and requests that fail because of a connection
+error, rate limiting or a server error are retried with exponential backoff.  Responses are cached on
+disk with their ETag and revalidated with If-None-Match so unchanged products are not downloaded again.
+
+LocalIGSDBServer serves a catalog of product JSON files in the same way as the IGSDB so code using the
+client can be run and tested without network access or an API token.
+
+    async def download(ids):
+        async with pywincalc.igsdb.IGSDBClient(token=igsdb_api_token) as client:
+            return await client.get_products_data(ids)
+
+    products = asyncio.run(download([363, 18101, 15067]))
+"""
+import asyncio
+import email.utils
+import hashlib
+import http.client
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+from wincalcbindings import parse_json
+
+from . import cache
+
+DEFAULT_BASE_URL = "https://igsdb.lbl.gov/api/v1/"
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RESPONSE_CACHE_NAME = "igsdb"
+RESPONSE_CACHE_SUFFIX = ".response"
+
+
+class IGSDBError(Exception):
+    """A request to the IGSDB failed."""
+
+    def __init__(self, message, url=None, status=None):
+        super().__init__(message)
+        self.url = url
+        self.status = status
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections to one host that can be used from several threads.
+
+    At most size idle connections are kept.  Connections the server closes are discarded.
+    """
+
+    def __init__(self, base_url, size=8, timeout=30):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError("Unsupported URL scheme in {u}.".format(u=base_url))
+        self._connection_type = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._netloc = parts.netloc
+        self._size = size
+        self._timeout = timeout
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._connection_type(self._netloc, timeout=self._timeout)
+
+    def _release(self, connection):
+        with self._lock:
+            if len(self._idle) < self._size:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def request(self, method, path, headers):
+        """Send a request and return (status, headers, body)."""
+        connection = self._connection()
+        try:
+            connection.request(method, path, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+        except Exception:
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+        return response.status, {k.lower(): v for k, v in response.getheaders()}, body
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+class ResponseCache:
+    """Response bodies stored on disk with their ETag, by URL."""
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory is not None else cache.cache_dir() / RESPONSE_CACHE_NAME
+
+    def _cache_file(self, url):
+        url_hash = cache.hash_text(url)
+        return self.directory / url_hash[:2] / (url_hash + RESPONSE_CACHE_SUFFIX)
+
+    def get(self, url):
+        """Return (etag, body) cached for url or None."""
+        return cache.read(self._cache_file(url), lambda header: header.get("url") == url)
+
+    def put(self, url, etag, body):
+        cache.write(self._cache_file(url), {"url": url}, (etag, body))
+
+    def clear(self):
+        for cache_file in self.directory.glob("*/*" + RESPONSE_CACHE_SUFFIX):
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+
+
+def _retry_after(headers):
+    """Seconds to wait from a Retry-After header or None."""
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(email.utils.parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class IGSDBClient:
+    """asyncio client for the IGSDB.
+
+    token is an IGSDB API token, it is not needed for a LocalIGSDBServer.  cache can be True to cache
+    responses in the pywincalc cache directory, a directory to cache them in, or False to not cache them.
+    Requests are retried max_retries times waiting backoff_seconds, then twice as long and so on, or as long
+    as the server asks for with a Retry-After header.  The client should be closed when it is no longer
+    needed, e.g. by using it with async with or awaiting aclose.
+    """
+
+    def __init__(self, token=None, base_url=DEFAULT_BASE_URL, max_concurrency=8, max_retries=3,
+                 backoff_seconds=0.5, timeout=30, cache=True):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.base_url = base_url if base_url.endswith("/") else base_url + "/"
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._headers = {"Accept": "application/json"}
+        if token is not None:
+            self._headers["Authorization"] = "Token {token}".format(token=token)
+        if cache is True:
+            self._cache = ResponseCache()
+        elif cache:
+            self._cache = ResponseCache(cache)
+        else:
+            self._cache = None
+        self._pool = ConnectionPool(self.base_url, size=max_concurrency, timeout=timeout)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="pywincalc-igsdb")
+        self._max_concurrency = max_concurrency
+        # Created in the loop that uses it, see _loop_semaphore
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def close(self):
+        """Close the client, waiting for requests that are still running."""
+        self._executor.shutdown(wait=True)
+        self._pool.close()
+
+    async def aclose(self):
+        """Close the client without blocking the event loop while requests that are still running finish."""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def _loop_semaphore(self):
+        # Before Python 3.10 asyncio primitives are bound to the event loop when they are created so the
+        # semaphore is created in the running loop, and again if the client is used from another loop.
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def get(self, path):
+        """GET path relative to base_url and return the response body.
+
+        A cached response is returned without downloading it again if the server reports it has not changed.
+        """
+        url = urljoin(self.base_url, path)
+        parts = urlsplit(url)
+        request_path = parts.path + ("?" + parts.query if parts.query else "")
+        headers = dict(self._headers)
+        cached = self._cache.get(url) if self._cache is not None else None
+        if cached is not None and cached[0]:
+            headers["If-None-Match"] = cached[0]
+
+        loop = asyncio.get_running_loop()
+        async with self._loop_semaphore():
+            for attempt in range(self.max_retries + 1):
+                delay = None
+                try:
+                    status, response_headers, body = await loop.run_in_executor(
+                        self._executor, self._pool.request, "GET", request_path, headers)
+                except (OSError, http.client.HTTPException) as e:
+                    error = IGSDBError("Request to {u} failed: {e}".format(u=url, e=e), url)
+                else:
+                    if status == 304 and cached is not None:
+                        return cached[1]
+                    if 200 <= status < 300:
+                        if self._cache is not None and response_headers.get("etag"):
+                            self._cache.put(url, response_headers["etag"], body)
+                        return body
+                    error = IGSDBError("Request to {u} returned HTTP {s}.".format(u=url, s=status), url, status)
+                    if status not in RETRY_STATUSES:
+                        raise error
+                    delay = _retry_after(response_headers)
+                if attempt == self.max_retries:
+                    raise error
+                await asyncio.sleep(delay if delay is not None else self.backoff_seconds * 2 ** attempt)
+
+    async def get_product(self, product_id):
+        """Return the IGSDB JSON of a product as bytes."""
+        return await self.get("products/{id}".format(id=product_id))
+
+    async def get_products(self, product_ids):
+        """Return the IGSDB JSON of several products, downloaded concurrently, in the order of product_ids."""
+        return await asyncio.gather(*(self.get_product(product_id) for product_id in product_ids))
+
+    async def get_product_data(self, product_id):
+        """Download a product and parse it with parse_json."""
+        product_json = await self.get_product(product_id)
+        return await asyncio.get_running_loop().run_in_executor(None, parse_json, product_json.decode("utf-8"))
+
+    async def get_products_data(self, product_ids):
+        """Download several products concurrently and parse them with parse_json."""
+        return await asyncio.gather(*(self.get_product_data(product_id) for product_id in product_ids))
+
+
+def _etag(body):
+    return '"{h}"'.format(h=hashlib.sha256(body).hexdigest())
+
+
+def load_catalog(directory):
+    """Read the product JSON files in directory into a catalog for LocalIGSDBServer.
+
+    Products are served by their "product_id" or, if they do not have one, by the name of their file without
+    the extension.
+    """
+    catalog = {}
+    for path in sorted(Path(directory).glob("*.json")):
+        body = path.read_bytes()
+        product_id = json.loads(body.decode("utf-8")).get("product_id")
+        catalog[str(product_id if product_id is not None else path.stem)] = body
+    return catalog
+
+
+class LocalIGSDBServer:
+    """A local stand-in for the IGSDB serving products from a catalog.
+
+    catalog is a dict mapping product ids to product JSON or a directory of product JSON files, see
+    load_catalog.  Products are served at <url>products/<id> with an ETag.  The first failures requests are
+    answered with HTTP 503 which can be used to check retrying.  Use port=0 to pick a free port.
+
+        with LocalIGSDBServer("products") as server:
+            client = IGSDBClient(base_url=server.url, cache=False)
+    """
+
+    def __init__(self, catalog, host="127.0.0.1", port=0, failures=0):
+        if not isinstance(catalog, dict):
+            catalog = load_catalog(catalog)
+        self.catalog = {str(product_id): body.encode("utf-8") if isinstance(body, str) else body
+                        for product_id, body in catalog.items()}
+        self.failures = failures
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return "http://{h}:{p}/api/v1/".format(h=host, p=port)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                    fail = server.failures > 0
+                    if fail:
+                        server.failures -= 1
+                prefix = "/api/v1/products/"
+                product_id = self.path[len(prefix):].strip("/") if self.path.startswith(prefix) else None
+                if fail:
+                    self._respond(503, b'{"detail": "Service unavailable."}', {"Retry-After": "0"})
+                elif product_id not in server.catalog:
+                    self._respond(404, b'{"detail": "Not found."}')
+                else:
+                    body = server.catalog[product_id]
+                    etag = _etag(body)
+                    if self.headers.get("If-None-Match") == etag:
+                        self._respond(304, b"", {"ETag": etag})
+                    else:
+                        self._respond(200, body, {"ETag": etag})
+
+            def _respond(self, status, body, headers=None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if status != 304:
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """Serve requests on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="pywincalc-local-igsdb",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,153 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from wincalcbindings import color_results_to_columns, parse_json, parse_json_file
+
+
+def _metric_name(metric):
+    if isinstance(metric, str):
+        return metric
+    return metric.__name__
+
+
+def _evaluate_metrics(glazing_system, metrics):
+    results = {}
+    for metric in metrics:
+        if isinstance(metric, str):
+            results[metric] = getattr(glazing_system, metric)()
+        else:
+            results[_metric_name(metric)] = metric(glazing_system)
+    return results
+
+
+def evaluate_many(systems, metrics=("u", "shgc"), max_workers=None):
+    """Evaluate metrics for a list of glazing systems on a pool of threads.
+
+    The GlazingSystem calculation methods release the GIL while WinCalc is solving so the systems are
+    calculated concurrently.
+
+    metrics is a list where each item is either the name of a GlazingSystem method that can be called
+    without arguments (e.g. "u", "shgc", "relative_heat_gain") or a function that takes a glazing system
+    and returns a result.  Results for functions are stored under the function's __name__.
+
+    Returns a list of dicts, one per system in the same order as systems, mapping each metric name to
+    its result.
+
+    Threads using the same GlazingSystem wait for each other so each distinct system is evaluated by a
+    single worker.  Systems that appear more than once in the list are only evaluated once.
+    """
+    systems = list(systems)
+    metrics = list(metrics)
+    unique_systems = {}
+    for glazing_system in systems:
+        unique_systems.setdefault(id(glazing_system), glazing_system)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {key: executor.submit(_evaluate_metrics, glazing_system, metrics)
+                   for key, glazing_system in unique_systems.items()}
+        results = {key: future.result() for key, future in futures.items()}
+
+    return [dict(results[id(glazing_system)]) for glazing_system in systems]
+
+
+def color_many(systems, theta=0, phi=0, max_workers=None):
+    """Calculate color results for many glazing systems on a pool of threads.
+
+    Returns the results as a dict of numpy arrays with one value per system in the same order as systems,
+    see pywincalc.color_results_to_columns.
+    """
+    def color(glazing_system):
+        return glazing_system.color(theta, phi)
+
+    results = evaluate_many(systems, metrics=[color], max_workers=max_workers)
+    return color_results_to_columns([result["color"] for result in results])
+
+
+def map_systems(fn, configs, processes=None):
+    """Call fn(config) for each config on a pool of processes.
+
+    This is for sweeps where calculations in threads are not enough, e.g. when a large part of the
+    work is done in Python.  Each config is pickled and sent to a worker process where fn builds a
+    glazing system from it and returns the results.  Products, product data, environments, optical
+    standards, BSDF hemispheres, gases, gap layers and glazing systems can all be pickled and so can be
+    part of a config, see pywincalc.gaps for which gases and gap layers can be pickled.
+
+    fn must be picklable, i.e. a function defined at the top level of a module, and so must its result.
+
+    Returns a list of results in the same order as configs.
+    """
+    configs = list(configs)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(fn, configs))
+
+
+def _json_records(paths_or_bytes):
+    if hasattr(paths_or_bytes, "read"):
+        records = paths_or_bytes
+    elif isinstance(paths_or_bytes, (str, os.PathLike)) and Path(paths_or_bytes).suffix == ".jsonl":
+        with open(paths_or_bytes, "rb") as jsonl:
+            yield from _json_records(jsonl)
+        return
+    else:
+        yield from paths_or_bytes
+        return
+    # A JSONL stream with one record per line
+    for line in records:
+        if line.strip():
+            yield line
+
+
+def _parse_json_record(record):
+    if isinstance(record, (bytes, bytearray, memoryview)):
+        return parse_json(bytes(record).decode("utf-8"))
+    if isinstance(record, str) and record.lstrip().startswith("{"):
+        return parse_json(record)
+    return parse_json_file(os.fspath(record))
+
+
+def _completed(pending):
+    # Pop the futures that have finished, in input order, and yield their index and result
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in sorted(done, key=pending.get):
+        yield pending.pop(future), future.result()
+
+
+def parse_json_many(paths_or_bytes, workers=None, ordered=False):
+    """Parse many IGSDB JSON products on a pool of threads, yielding (index, ProductData) as they are parsed.
+
+    paths_or_bytes is either
+        - an iterable where each item is a path to a JSON file, a str containing JSON, or bytes
+          containing UTF-8 JSON, or
+        - a JSONL stream (an open file or the path to a .jsonl file) with one product per line.
+
+    index is the position of the record in paths_or_bytes.  Products are yielded in the order they finish
+    parsing so one slow record does not hold back the others.  With ordered=True only the ProductData are
+    yielded, in input order.
+
+    The parsers release the GIL so records are parsed concurrently.  Only a few records per worker are
+    read ahead of the ones being yielded so arbitrarily large streams can be parsed without reading them
+    into memory first.  An error parsing a record is raised when that record would have been yielded.
+    """
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) + 4)
+    max_pending = 4 * workers
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        if ordered:
+            pending = deque()
+            for record in _json_records(paths_or_bytes):
+                pending.append(executor.submit(_parse_json_record, record))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+            return
+        # The index of each record being parsed, by its future
+        pending = {}
+        for index, record in enumerate(_json_records(paths_or_bytes)):
+            pending[executor.submit(_parse_json_record, record)] = index
+            if len(pending) >= max_pending:
+                yield from _completed(pending)
+        while pending:
+            yield from _completed(pending)
@@ -0,0 +1,150 @@
+"""Adaptive wavelength resampling of measured spectra with a bound on the integration error.
+
+Measured spectra often have several hundred to more than 2000 wavelengths while the integrated SOLAR and
+PHOTOPIC results of a layer converge with far fewer.  resample picks a subset of the measured wavelengths
+for a product so that the data between the kept wavelengths is replaced by straight lines.  Wavelengths are
+added where the weighted difference between the full and the resampled data is largest until the error
+bound of every method is within the tolerance.
+
+The bound holds for every transmittance and reflectance of the layer on its own: for a method with
+normalized weights w mapped onto the measured wavelengths, see pywincalc.weighting, the integrated value
+changes by at most sum(w * |full - resampled|).  Layers in a glazing system are combined at every
+wavelength, so results of systems with several layers are not bounded but stay close, see readme.md.
+
+Data no method weighs, e.g. the infrared data used for emissivities, is kept as it is.  Resampled products
+are cached per product, tolerance, standard and methods, and the solid layers made from them are shared
+like any other ProductData, see pywincalc.shared_layers.
+"""
+import copy
+import weakref
+from collections import namedtuple
+from threading import Lock
+
+import numpy
+
+from wincalcbindings import (OpticalStandard, ProductData, ProductDataOpticalAndThermal, ProductDataOpticalNBand,
+                             wavelength_data_from_arrays, wavelength_data_to_arrays)
+
+from . import standards, weighting
+
+DEFAULT_METHODS = ("SOLAR", "PHOTOPIC")
+
+# error_bounds and errors are dicts of the largest bound and the largest actual difference of the integrated
+# transmittances and reflectances for each method.  They are empty for products that were not resampled.
+Resampling = namedtuple("Resampling", ["product", "number_of_wavelengths", "original_number_of_wavelengths",
+                                       "error_bounds", "errors"])
+
+# Keyed by the product object so resampled products are dropped with their product
+_resampled = weakref.WeakKeyDictionary()
+_lock = Lock()
+
+
+def _standard(standard):
+    if isinstance(standard, OpticalStandard):
+        return standard
+    return standards.get(standard)
+
+
+def _interpolate(wavelengths, values, kept):
+    return numpy.array([numpy.interp(wavelengths, wavelengths[kept], row[kept]) for row in values])
+
+
+def select_wavelengths(wavelengths, values, method_weights, tolerance):
+    """Return the indexes of the wavelengths to keep and the error bound of each row of method_weights.
+
+    values has one row per property and method_weights one row per method, both with a value per
+    wavelength.  Wavelengths outside of the range weighted by any method are always kept.  The bound of
+    each method is the largest over all properties of numpy.dot(weights, |values - resampled values|).
+    """
+    wavelengths = numpy.asarray(wavelengths, dtype=float)
+    values = numpy.asarray(values, dtype=float)
+    method_weights = numpy.asarray(method_weights, dtype=float)
+    if tolerance < 0:
+        raise ValueError("The tolerance must not be negative.")
+    weighted = numpy.flatnonzero(method_weights.any(axis=0))
+    keep = numpy.ones(len(wavelengths), dtype=bool)
+    if len(weighted) == 0:
+        return numpy.flatnonzero(keep), numpy.zeros(len(method_weights))
+    first, last = weighted[0], weighted[-1]
+    keep[first + 1:last] = False
+
+    while True:
+        kept = numpy.flatnonzero(keep)
+        deviation = numpy.abs(values - _interpolate(wavelengths, values, kept))
+        bounds = method_weights @ deviation.T
+        over = bounds > tolerance
+        if not over.any():
+            return kept, bounds.max(axis=1)
+        # Add the largest weighted deviation of every method and property still over the tolerance
+        for method, row in zip(*numpy.nonzero(over)):
+            keep[numpy.argmax(method_weights[method] * deviation[row])] = True
+
+
+def _resample_arrays(arrays, tolerance, standard, methods):
+    wavelengths = arrays["wavelengths"]
+    names = [name for name in arrays if name != "wavelengths"]
+    values = numpy.array([arrays[name] for name in names])
+    method_weights = numpy.array([weighting.kernel(method, standard).weights_for(wavelengths)
+                                  for method in methods])
+    kept, bounds = select_wavelengths(wavelengths, values, method_weights, tolerance)
+    errors = numpy.abs(method_weights @ (_interpolate(wavelengths, values, kept) - values).T).max(axis=1)
+    resampled = {name: arrays[name][kept] for name in arrays}
+    return resampled, dict(zip(methods, bounds.tolist())), dict(zip(methods, errors.tolist()))
+
+
+def _resample(product, tolerance, standard, methods):
+    if isinstance(product, ProductDataOpticalAndThermal):
+        optical = resample(product.optical_data, tolerance, standard, methods)
+        return optical._replace(product=ProductDataOpticalAndThermal(optical.product, product.thermal_data))
+
+    measurements = product.measurements if isinstance(product, ProductData) else product.wavelength_data
+    arrays = wavelength_data_to_arrays(measurements)
+    resampled_arrays, bounds, errors = _resample_arrays(arrays, tolerance, standard, methods)
+    resampled = copy.copy(product)
+    if isinstance(product, ProductData):
+        resampled.measurements = wavelength_data_from_arrays(**resampled_arrays)
+    else:
+        resampled.wavelength_data = wavelength_data_from_arrays(**resampled_arrays)
+    return Resampling(resampled, len(resampled_arrays["wavelengths"]), len(arrays["wavelengths"]), bounds, errors)
+
+
+def _can_resample(product):
+    if isinstance(product, ProductData):
+        return isinstance(product.measurements, list) and product.composition is None
+    if isinstance(product, ProductDataOpticalAndThermal):
+        return isinstance(product.optical_data, ProductDataOpticalNBand)
+    return isinstance(product, ProductDataOpticalNBand)
+
+
+def resample(product, tolerance=1e-3, standard=standards.DEFAULT_STANDARD, methods=DEFAULT_METHODS):
+    """Return a Resampling with a copy of product measured at fewer wavelengths.
+
+    product is ProductData, ProductDataOpticalNBand or ProductDataOpticalAndThermal with n-band optical
+    data.  The integrated transmittances and reflectances of the product for each of methods change by at
+    most tolerance.  Other products, e.g. BSDF or shading products, are returned unchanged.  Raises
+    ValueError if the measurements do not cover the range of a method or a method cannot be precomputed,
+    see pywincalc.weighting.
+    """
+    if not _can_resample(product):
+        return Resampling(product, None, None, {}, {})
+    standard = _standard(standard)
+    key = (tolerance, standard, tuple(methods))
+    with _lock:
+        resampled = _resampled.setdefault(product, {})
+        result = resampled.get(key)
+    if result is None:
+        result = _resample(product, tolerance, standard, tuple(methods))
+        with _lock:
+            result = resampled.setdefault(key, result)
+    return result
+
+
+def size():
+    """Return the number of resampled products that are cached."""
+    with _lock:
+        return sum(len(resampled) for resampled in _resampled.values())
+
+
+def clear():
+    with _lock:
+        _resampled.clear()
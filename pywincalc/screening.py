@@ -0,0 +1,188 @@
+"""Condensed product spectra for fast screening of many glazing systems.
+
+A glazing system solves its layers at every measured wavelength, several hundred for most glazings.
+condensed_product replaces the measurements of a product with a few bands: a UV band, number_visible_bands
+bands across the PHOTOPIC range and number_solar_bands bands with equal solar energy across the rest of
+the SOLAR range.  Values change linearly across each band.  In the visible bands the values at both ends
+are chosen to keep the SOLAR and PHOTOPIC integrals of the band, elsewhere to keep its SOLAR integral and
+first moment, using the standard's weighting kernels, see pywincalc.weighting.  The SOLAR and PHOTOPIC
+results of a single layer therefore stay close to the full calculation and mostly the interaction between
+layers is approximated.  Data outside of the SOLAR range, e.g. the infrared data used for emissivities, is
+kept as it is.
+
+Condensed products are cached per product, standard and band counts, and the solid layers made from them
+are shared like any other ProductData, see pywincalc.shared_layers.  Systems made with glazing_system
+from the same products therefore condense and convert each product only once.
+
+See readme.md for the accuracy and speed of screening systems compared with the full calculation.
+"""
+import copy
+import weakref
+from threading import Lock
+
+import numpy
+
+from wincalcbindings import OpticalStandard, ProductData, wavelength_data_from_arrays, wavelength_data_to_arrays
+
+from . import standards, weighting
+
+# Half of the width of the gap between two bands in microns
+GAP_HALF_WIDTH = 1e-4
+
+# Keyed by the ProductData object so condensed products are dropped with their product
+_condensed = weakref.WeakKeyDictionary()
+_lock = Lock()
+
+
+def _standard(standard):
+    if isinstance(standard, OpticalStandard):
+        return standard
+    return standards.get(standard)
+
+
+def band_edges(standard=standards.DEFAULT_STANDARD, number_visible_bands=5, number_solar_bands=10):
+    """Return the edges of the condensed bands in microns.
+
+    The visible bands split the PHOTOPIC range evenly.  The solar bands split the SOLAR range above it
+    into bands with equal solar energy.  Raises ValueError if the standard's SOLAR or PHOTOPIC weighting
+    kernel cannot be precomputed.
+    """
+    if number_visible_bands < 1 or number_solar_bands < 1:
+        raise ValueError("There must be at least one visible and one solar band.")
+    standard = _standard(standard)
+    solar = weighting.kernel("SOLAR", standard)
+    photopic = weighting.kernel("PHOTOPIC", standard)
+    visible_edges = numpy.linspace(photopic.min_wavelength, photopic.max_wavelength, number_visible_bands + 1)
+
+    infrared = (solar.wavelengths > photopic.max_wavelength) & (solar.wavelengths < solar.max_wavelength)
+    energy = numpy.cumsum(solar.weights[infrared])
+    if len(energy) == 0 or not energy[-1] > 0:
+        solar_edges = numpy.linspace(photopic.max_wavelength, solar.max_wavelength, number_solar_bands + 1)
+    else:
+        targets = energy[-1] * numpy.arange(1, number_solar_bands) / number_solar_bands
+        inner = solar.wavelengths[infrared][numpy.searchsorted(energy, targets)]
+        solar_edges = numpy.concatenate(([photopic.max_wavelength], inner, [solar.max_wavelength]))
+
+    edges = numpy.concatenate(([solar.min_wavelength], visible_edges, solar_edges[1:]))
+    # Equal energy edges can fall on the same source wavelength when there are many solar bands
+    return numpy.unique(edges)
+
+
+def _band_values(values, t, constraint_weights):
+    """Return the values at the start and end of a band that give the same weighted sums as values.
+
+    values are assumed to change linearly across the band.  t is the position of each measured wavelength
+    in the band from 0 to 1.  If the two constraints cannot be solved the band has one constant value.
+    """
+    rows = numpy.array([[numpy.dot(weights, 1 - t), numpy.dot(weights, t)] for weights in constraint_weights])
+    if numpy.linalg.cond(rows) < 1e6:
+        ends = numpy.linalg.solve(rows, [numpy.dot(weights, values) for weights in constraint_weights])
+        if ends.min() >= min(0.0, values.min()) and ends.max() <= max(1.0, values.max()):
+            return ends
+    weights = constraint_weights[0]
+    value = numpy.average(values, weights=weights) if weights.sum() > 0 else values.mean()
+    return numpy.array([value, value])
+
+
+def _condense_arrays(arrays, edges, solar_weights, photopic_weights, photopic_range):
+    wavelengths = arrays["wavelengths"]
+    names = [name for name in arrays if name != "wavelengths"]
+    condensed = {name: [] for name in names}
+    condensed_wavelengths = []
+
+    def keep(points):
+        condensed_wavelengths.extend(wavelengths[points])
+        for name in names:
+            condensed[name].extend(arrays[name][points])
+
+    # Data outside of the bands, e.g. the infrared data used for emissivities, is kept as it is
+    keep(wavelengths < edges[0] - weighting.WAVELENGTH_TOLERANCE)
+    band = numpy.searchsorted(edges, wavelengths, side="right") - 1
+    # The last edge belongs to the last band
+    band[numpy.abs(wavelengths - edges[-1]) <= weighting.WAVELENGTH_TOLERANCE] = len(edges) - 2
+    for index in range(len(edges) - 1):
+        in_band = band == index
+        if not in_band.any():
+            continue
+        start, end = edges[index], edges[index + 1]
+        t = (wavelengths[in_band] - start) / (end - start)
+        solar = solar_weights[in_band]
+        if start >= photopic_range[0] - weighting.WAVELENGTH_TOLERANCE and \
+                end <= photopic_range[1] + weighting.WAVELENGTH_TOLERANCE:
+            # Keep both the SOLAR and the PHOTOPIC integral of the band
+            constraint_weights = (solar, photopic_weights[in_band])
+        else:
+            # Keep the SOLAR integral and how the values change across the band
+            constraint_weights = (solar, solar * t)
+        half_width = min(GAP_HALF_WIDTH, (end - start) / 4)
+        condensed_wavelengths.extend((start if index == 0 else start + half_width,
+                                      end if index == len(edges) - 2 else end - half_width))
+        for name in names:
+            condensed[name].extend(_band_values(arrays[name][in_band], t, constraint_weights))
+    keep(wavelengths > edges[-1] + weighting.WAVELENGTH_TOLERANCE)
+    condensed = {name: numpy.array(values) for name, values in condensed.items()}
+    condensed["wavelengths"] = numpy.array(condensed_wavelengths)
+    return condensed
+
+
+def _condense(product, standard, number_visible_bands, number_solar_bands):
+    arrays = wavelength_data_to_arrays(product.measurements)
+    wavelengths = arrays["wavelengths"]
+    solar = weighting.kernel("SOLAR", standard)
+    photopic = weighting.kernel("PHOTOPIC", standard)
+    edges = band_edges(standard, number_visible_bands, number_solar_bands)
+    condensed_arrays = _condense_arrays(arrays, edges, solar.weights_for(wavelengths),
+                                        photopic.weights_for(wavelengths),
+                                        (photopic.min_wavelength, photopic.max_wavelength))
+    condensed = copy.copy(product)
+    condensed.measurements = wavelength_data_from_arrays(**condensed_arrays)
+    return condensed
+
+
+def condensed_product(product, standard=standards.DEFAULT_STANDARD, number_visible_bands=5, number_solar_bands=10):
+    """Return a copy of product with its measurements condensed into bands.
+
+    Condensed products are kept for every product, standard and number of bands they were requested for.
+    Products without wavelength measurements, e.g. BSDF or shading products, and products made from a
+    composition are returned unchanged.  Raises ValueError if the measurements do not cover the
+    standard's SOLAR range.
+    """
+    if not isinstance(product, ProductData) or not isinstance(product.measurements, list) or \
+            product.composition is not None:
+        return product
+    standard = _standard(standard)
+    key = (standard, number_visible_bands, number_solar_bands)
+    with _lock:
+        condensed = _condensed.setdefault(product, {})
+        result = condensed.get(key)
+        if result is None:
+            result = _condense(product, standard, number_visible_bands, number_solar_bands)
+            condensed[key] = result
+        return result
+
+
+def glazing_system(solid_layers, gap_layers=[], optical_standard=None, number_visible_bands=5,
+                   number_solar_bands=10, **kwargs):
+    """Return a GlazingSystem made from the condensed solid layers for fast screening.
+
+    Takes the same arguments as GlazingSystem.  Results are approximate: use them to pick candidates from
+    a large number of systems and calculate the candidates again with a normal GlazingSystem.
+    """
+    from . import GlazingSystem
+
+    if optical_standard is None:
+        optical_standard = standards.get()
+    layers = [condensed_product(layer, optical_standard, number_visible_bands, number_solar_bands)
+              for layer in solid_layers]
+    return GlazingSystem(solid_layers=layers, gap_layers=gap_layers, optical_standard=optical_standard, **kwargs)
+
+
+def size():
+    """Return the number of condensed products that are cached."""
+    with _lock:
+        return sum(len(condensed) for condensed in _condensed.values())
+
+
+def clear():
+    with _lock:
+        _condensed.clear()
@@ -0,0 +1,50 @@
+"""Solid layers shared by all glazing systems made from the same products.
+
+A glazing system made from parsed ProductData converts every product into a solid layer and keeps its own
+copy of the converted optical data.  Sweeps that make many systems from a few hundred products would
+convert and store the same products over and over again.  GlazingSystem instead converts each ProductData
+once, the first time it is used, and all systems made from it hold a reference to the same solid layer.
+Memory use and setup time then depend on the number of distinct products, not the number of systems.
+
+Shared layers are never modified.  Flipping a shared layer in a glazing system gives that system its own
+copy of the layer first.  Products are assumed not to change once they have been used in a glazing
+system.  Call clear() after modifying a product that has already been used so it is converted again.
+"""
+import weakref
+from threading import Lock
+
+from wincalcbindings import ProductData, convert_to_solid_layer
+
+# Keyed by the ProductData object so layers are dropped when their product is garbage collected
+_solid_layers = weakref.WeakKeyDictionary()
+_lock = Lock()
+
+
+def solid_layer(product):
+    """Return the shared solid layer for product, converting it the first time it is requested.
+
+    Anything other than ProductData, e.g. a layer that has already been converted, is returned unchanged.
+    """
+    if not isinstance(product, ProductData):
+        return product
+    with _lock:
+        layer = _solid_layers.get(product)
+        if layer is None:
+            layer = convert_to_solid_layer(product)
+            _solid_layers[product] = layer
+        return layer
+
+
+def solid_layers(products):
+    return [solid_layer(product) for product in products]
+
+
+def size():
+    """Return the number of products with a shared solid layer."""
+    with _lock:
+        return len(_solid_layers)
+
+
+def clear():
+    with _lock:
+        _solid_layers.clear()
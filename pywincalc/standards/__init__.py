@@ -0,0 +1,137 @@
+"""Process-wide registry of parsed optical standards.
+
+Standards are only parsed the first time they are used.  After that the same parsed OpticalStandard is
+returned to every caller so it should not be modified.  Use pywincalc.load_standard to get a copy that
+can be modified.
+
+Parsed standards are also kept in a binary cache on disk so new processes do not have to parse the
+standard and the spectrum files it references again.  The cache is checked against the size, modification
+time and hash of the .std file and the files it references.  The standards distributed with pywincalc are
+cached when the package is built, see build_cache, and their cache is only checked against the size and
+hash because installing the package changes the modification times.
+"""
+import re
+from pathlib import Path
+from threading import Lock
+
+from wincalcbindings import load_standard as _load_standard
+
+from .. import cache as _cache
+
+standard_path = Path(__file__).parent
+DEFAULT_STANDARD = "W5_NFRC_2003"
+CACHE_SUFFIX = ".stdcache"
+
+_REFERENCED_FILE = re.compile(r"^\s*(?:Source Spectrum|Detector Spectrum|Wavelength Set)\s*:\s*(.+?)\s*$")
+
+_standards = {}
+_lock = Lock()
+
+
+def path(name):
+    """Return the path of a standard.
+
+    name is either the name of one of the standards distributed with pywincalc, with or without the .std
+    extension, or the path to a .std file.
+    """
+    standard_file = Path(name)
+    if standard_file.suffix != ".std":
+        standard_file = standard_file.with_name(standard_file.name + ".std")
+    if standard_file.parent == Path(".") and not standard_file.exists():
+        standard_file = standard_path / standard_file
+    return standard_file.resolve()
+
+
+def names():
+    """Return the names of the standards distributed with pywincalc."""
+    return sorted(standard_file.stem for standard_file in standard_path.glob("*.std"))
+
+
+def get(name=DEFAULT_STANDARD):
+    """Return the parsed optical standard, parsing it the first time it is requested.
+
+    Standards are cached by their resolved path so the same file is only parsed once per process.
+    """
+    standard_file = path(name)
+    key = str(standard_file)
+    with _lock:
+        standard = _standards.get(key)
+        if standard is None:
+            if not standard_file.exists():
+                raise FileNotFoundError("Optical standard not found: {p}".format(p=standard_file))
+            standard = load(standard_file)
+            _standards[key] = standard
+    return standard
+
+
+def clear():
+    """Remove all parsed standards from the registry."""
+    with _lock:
+        _standards.clear()
+
+
+def referenced_files(standard_file):
+    """Return the .std file and the spectrum and wavelength set files it references."""
+    standard_file = Path(standard_file)
+    files = [standard_file]
+    with open(standard_file, errors="replace") as f:
+        for line in f:
+            match = _REFERENCED_FILE.match(line)
+            if match:
+                # Values like None, Source or Data are keywords and not files
+                referenced = standard_file.parent / match.group(1)
+                if referenced.is_file() and referenced not in files:
+                    files.append(referenced)
+    return files
+
+
+def _prebuilt_cache_file(standard_file):
+    return standard_file.with_suffix(CACHE_SUFFIX)
+
+
+def _user_cache_file(standard_file):
+    return _cache.cache_dir() / "standards" / (_cache.hash_text(str(standard_file)) + CACHE_SUFFIX)
+
+
+def _read_cache(cache_file, standard_file):
+    return _cache.read(cache_file, lambda header: _cache.fingerprint_matches(header["files"], standard_file.parent))
+
+
+def _write_cache(cache_file, standard_file, standard, modification_times=True):
+    files = _cache.fingerprint(referenced_files(standard_file), standard_file.parent, modification_times)
+    return _cache.write(cache_file, {"files": files}, standard)
+
+
+def load(name, use_cache=True):
+    """Parse a standard, or read it from the binary cache if none of its files have changed.
+
+    Unlike get the standard is not kept in the registry and a new OpticalStandard is returned every call.
+    """
+    standard_file = path(name)
+    if use_cache:
+        for cache_file in (_prebuilt_cache_file(standard_file), _user_cache_file(standard_file)):
+            standard = _read_cache(cache_file, standard_file)
+            if standard is not None:
+                return standard
+    standard = _load_standard(str(standard_file))
+    if use_cache:
+        _write_cache(_user_cache_file(standard_file), standard_file, standard)
+    return standard
+
+
+def build_cache(directory=standard_path):
+    """Write a binary cache file next to each .std file in directory.
+
+    This is run when pywincalc is built so the distributed standards never need to be parsed.  The cache
+    files do not depend on the modification times of the standard files so they stay valid when the
+    package is installed.  Returns the paths of the cache files written.  Raises OSError if a cache file
+    cannot be written.
+    """
+    written = []
+    for standard_file in sorted(Path(directory).glob("*.std")):
+        standard_file = standard_file.resolve()
+        cache_file = _prebuilt_cache_file(standard_file)
+        if not _write_cache(cache_file, standard_file, _load_standard(str(standard_file)), modification_times=False):
+            raise OSError("Could not write the cache of {s} to {c}".format(s=standard_file, c=cache_file))
+        written.append(cache_file)
+    return written
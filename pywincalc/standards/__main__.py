@@ -0,0 +1,8 @@
+"""Build the binary cache for the standards distributed with pywincalc: python -m pywincalc.standards"""
+import sys
+
+from . import build_cache, standard_path
+
+directory = sys.argv[1] if len(sys.argv) > 1 else standard_path
+for cache_file in build_cache(directory):
+    print("Wrote {f}".format(f=cache_file))
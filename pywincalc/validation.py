@@ -0,0 +1,286 @@
+"""Check many product files without stopping at the first bad one.
+
+validate_products parses every file in a pool of worker processes, catches parse errors and checks the
+parsed data for values that are probably wrong.  The report lists the problems found in each file and how
+long each phase took:
+    read: BSDF XML files are checked to be well-formed XML with a WindowElement root before they are given
+          to the BSDF XML parser, which ends the process on some malformed files instead of raising
+    parse: parsing the file into ProductData
+    check: checking the parsed data, see check_product
+
+The parsers also end the process on some well-formed files with bad data, e.g. BSDF XML files with too few
+values in their ScatteringData.  Each worker process validates one file at a time so when a process ends
+the file it was validating is reported with a parse error and a new process takes over.
+"""
+import math
+import multiprocessing
+import os
+import queue
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from xml.parsers import expat
+
+import numpy
+
+from wincalcbindings import DualBandBSDF, wavelength_data_to_arrays
+
+from .catalog import parse_product_file
+
+Issue = namedtuple("Issue", ["code", "message"])
+ProductValidation = namedtuple("ProductValidation", ["path", "errors", "warnings", "phase_seconds", "product"])
+
+PHASES = ("read", "parse", "check")
+
+
+def _out_of_range(arrays, name, tolerance):
+    values = arrays[name]
+    bad = (values < -tolerance) | (values > 1 + tolerance) | ~numpy.isfinite(values)
+    if bad.any():
+        index = int(numpy.argmax(bad))
+        return Issue("value_out_of_range", "{n} is {v} at {w} microns, {c} values are outside [0, 1].".format(
+            n=name, v=values[index], w=arrays["wavelengths"][index], c=int(bad.sum())))
+    return None
+
+
+def _check_wavelength_data(wavelength_data, tolerance):
+    warnings = []
+    arrays = wavelength_data_to_arrays(wavelength_data)
+    wavelengths = arrays["wavelengths"]
+    if len(wavelengths) == 0:
+        return [Issue("no_measurements", "There are no wavelength measurements.")]
+
+    not_increasing = numpy.diff(wavelengths) <= 0
+    if not_increasing.any():
+        index = int(numpy.argmax(not_increasing)) + 1
+        warnings.append(Issue("non_monotonic_wavelengths", "Wavelength {w} microns follows {p} microns.".format(
+            w=wavelengths[index], p=wavelengths[index - 1])))
+
+    prefixes = ("", "diffuse_") if "diffuse_transmittance_front" in arrays else ("",)
+    for prefix in prefixes:
+        for name in ("transmittance_front", "transmittance_back", "reflectance_front", "reflectance_back"):
+            issue = _out_of_range(arrays, prefix + name, tolerance)
+            if issue is not None:
+                warnings.append(issue)
+
+    for side in ("front", "back"):
+        total = sum(arrays[prefix + measured + "_" + side] for prefix in prefixes
+                    for measured in ("transmittance", "reflectance"))
+        above_one = total > 1 + tolerance
+        if above_one.any():
+            index = int(numpy.argmax(total))
+            warnings.append(Issue("transmittance_plus_reflectance_above_one",
+                                  "T + R {s} is {v:.4f} at {w} microns, above 1 at {c} wavelengths.".format(
+                                      s=side, v=total[index], w=wavelengths[index], c=int(above_one.sum()))))
+    return warnings
+
+
+def _check_bsdf(measurements):
+    warnings = []
+    for band in ("solar", "visible"):
+        bsdfs = getattr(measurements, band)
+        for name in ("transmittance_front", "transmittance_back", "reflectance_front", "reflectance_back"):
+            bsdf = getattr(bsdfs, name)
+            if bsdf is None:
+                continue
+            values = numpy.asarray(bsdf.data_array)
+            if not numpy.isfinite(values).all():
+                warnings.append(Issue("non_finite_values", "The {b} {n} BSDF has values that are not finite.".format(
+                    b=band, n=name)))
+            elif (values < 0).any():
+                warnings.append(Issue("negative_values", "The {b} {n} BSDF has {c} negative values.".format(
+                    b=band, n=name, c=int((values < 0).sum()))))
+    return warnings
+
+
+def check_product(product, tolerance=0.005):
+    """Return a list of Issues for values in parsed ProductData that are probably wrong.
+
+    Transmittances and reflectances more than tolerance outside of [0, 1], or adding up to more than
+    1 + tolerance, are reported.
+    """
+    warnings = []
+    if product.thickness is not None and not product.thickness > 0:
+        warnings.append(Issue("invalid_thickness", "Thickness is {t}.".format(t=product.thickness)))
+    for name in ("emissivity_front", "emissivity_back", "ir_transmittance"):
+        value = getattr(product, name)
+        if value is not None and not (0 <= value <= 1):
+            warnings.append(Issue("value_out_of_range", "{n} is {v}.".format(n=name, v=value)))
+
+    measurements = product.measurements
+    if isinstance(measurements, DualBandBSDF):
+        warnings.extend(_check_bsdf(measurements))
+    elif isinstance(measurements, list):
+        warnings.extend(_check_wavelength_data(measurements, tolerance))
+    return warnings
+
+
+def check_bsdf_xml(path):
+    """Raise ValueError if path is not well-formed XML with a WindowElement root element."""
+    parser = expat.ParserCreate(namespace_separator="}")
+    root = []
+
+    def start_element(name, attributes):
+        if not root:
+            root.append(name)
+            if name.rsplit("}", 1)[-1] != "WindowElement":
+                raise ValueError("The root element is {n}, not WindowElement.".format(n=name))
+
+    parser.StartElementHandler = start_element
+    try:
+        with open(path, "rb") as f:
+            parser.ParseFile(f)
+    except expat.ExpatError as e:
+        raise ValueError("Not well-formed XML: {e}".format(e=expat.ErrorString(e.code))) from e
+
+
+def _validate(path, parse, tolerance, keep_products):
+    phase_seconds = dict.fromkeys(PHASES, 0.0)
+    product = None
+    errors = []
+    warnings = []
+    for phase in PHASES:
+        start = time.perf_counter()
+        try:
+            if phase == "read":
+                if path.lower().endswith(".xml"):
+                    check_bsdf_xml(path)
+            elif phase == "parse":
+                product = parse(path)
+            else:
+                warnings = check_product(product, tolerance)
+        except Exception as e:
+            # Whatever goes wrong with one file must not stop the others
+            errors.append(Issue(phase + "_error", "{t}: {e}".format(t=type(e).__name__, e=e)))
+        phase_seconds[phase] = time.perf_counter() - start
+        if errors:
+            break
+    return ProductValidation(path, errors, warnings, phase_seconds, product if keep_products else None)
+
+
+class _WorkerProcesses:
+    """Single process pools that validate one file at a time so a file that ends its process is known.
+
+    Processes are started with spawn since they are started from the threads of validate_products.
+    """
+
+    def __init__(self, count):
+        self._context = multiprocessing.get_context("spawn")
+        self._idle = queue.SimpleQueue()
+        for _ in range(count):
+            self._idle.put(None)
+        self._count = count
+
+    def validate(self, path, *args):
+        executor = self._idle.get()
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=1, mp_context=self._context)
+        start = time.perf_counter()
+        try:
+            return executor.submit(_validate, path, *args).result()
+        except BrokenProcessPool:
+            executor.shutdown()
+            executor = None
+            phase_seconds = dict.fromkeys(PHASES, 0.0)
+            phase_seconds["parse"] = time.perf_counter() - start
+            return ProductValidation(path, [Issue("parse_error", "The worker process validating the file ended.")],
+                                     [], phase_seconds, None)
+        finally:
+            self._idle.put(executor)
+
+    def close(self):
+        for _ in range(self._count):
+            executor = self._idle.get()
+            if executor is not None:
+                executor.shutdown()
+
+
+class ValidationReport:
+    """Results of validate_products.
+
+    results has a ProductValidation for every file in the order they were given.  Files with errors could
+    not be parsed or checked, files with warnings were parsed but have suspicious data.
+    """
+
+    def __init__(self, results, wall_seconds):
+        self.results = results
+        self.wall_seconds = wall_seconds
+
+    def __len__(self):
+        return len(self.results)
+
+    @property
+    def errors(self):
+        return [result for result in self.results if result.errors]
+
+    @property
+    def warnings(self):
+        return [result for result in self.results if result.warnings]
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    @property
+    def files_per_second(self):
+        return len(self.results) / self.wall_seconds if self.wall_seconds > 0 else math.inf
+
+    @property
+    def phase_seconds(self):
+        """Total time spent in each phase summed over all workers."""
+        return {phase: sum(result.phase_seconds[phase] for result in self.results) for phase in PHASES}
+
+    def summary(self):
+        phases = self.phase_seconds
+        lines = ["{n} files in {t:.2f}s ({r:.1f} files/s): {e} with errors, {w} with warnings".format(
+            n=len(self.results), t=self.wall_seconds, r=self.files_per_second, e=len(self.errors),
+            w=len(self.warnings)),
+            "Time per phase: " + ", ".join("{p} {t:.2f}s".format(p=phase, t=phases[phase]) for phase in PHASES)]
+        for result in self.results:
+            for severity, issues in (("error", result.errors), ("warning", result.warnings)):
+                for issue in issues:
+                    lines.append("{p}: {s} {c}: {m}".format(p=result.path, s=severity, c=issue.code, m=issue.message))
+        return "\n".join(lines)
+
+
+def validate_products(paths, workers=None, tolerance=0.005, time_limit_seconds=None, keep_products=False,
+                      parse=parse_product_file):
+    """Parse and check product files in a pool of worker processes and return a ValidationReport.
+
+    Errors in one file never stop the others, even if the parser ends the worker process.  Files are parsed
+    with parse, by default based on their extension like pywincalc.parse_product_header.  parse must be
+    picklable, i.e. a function defined at the top level of a module.  See check_product for the checks and
+    tolerance.  Scripts that call validate_products need an if __name__ == "__main__" guard since the
+    worker processes import the main module.
+
+    If time_limit_seconds is given no new files are started once it has passed and the files that were not
+    validated are reported with a "time_limit" error.  keep_products keeps the parsed ProductData in the
+    results.
+    """
+    paths = [os.fspath(path) for path in paths]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    max_pending = 4 * workers
+    start = time.perf_counter()
+    results = []
+    skipped = []
+    processes = _WorkerProcesses(workers)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for index, path in enumerate(paths):
+                if time_limit_seconds is not None and time.perf_counter() - start > time_limit_seconds:
+                    skipped = paths[index:]
+                    break
+                pending.append(executor.submit(processes.validate, path, parse, tolerance, keep_products))
+                if len(pending) >= max_pending:
+                    results.append(pending.popleft().result())
+            while pending:
+                results.append(pending.popleft().result())
+    finally:
+        processes.close()
+    results.extend(ProductValidation(path, [Issue("time_limit", "Not validated, the time limit was reached.")], [],
+                                     dict.fromkeys(PHASES, 0.0), None) for path in skipped)
+    return ValidationReport(results, time.perf_counter() - start)
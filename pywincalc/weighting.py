@@ -0,0 +1,224 @@
+"""Precomputed spectral weighting kernels for the methods of an optical standard.
+
+Integrating a spectral property for a method of an optical standard interpolates the source and detector
+spectra onto the method's wavelength set, multiplies them and integrates the property weighted by the
+result between the method's minimum and maximum wavelength.  None of that depends on the product, so
+kernel() does it once per standard and method and keeps the normalized weights.  Integrating a property
+is then a single dot product with the weights, see WeightingKernel.integrate.
+
+Weights are further mapped onto the wavelengths of the measured data, so products measured at the same
+wavelengths, e.g. all products in an IGSDB download, are integrated by one matrix product, see
+integrate_products.
+
+Only methods with source and detector spectra read from files, a wavelength set from a file or from the
+source spectrum, numeric wavelength boundaries and the trapezoidal integration rule can be precomputed.
+"""
+import weakref
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+import numpy
+
+from wincalcbindings import (IntegrationRuleType, OpticalStandard, SpectrumType, WavelengthBoundaryType,
+                             WavelengthSetType, wavelength_data_to_arrays)
+
+from . import standards
+
+PROPERTIES = ("transmittance_front", "transmittance_back", "reflectance_front", "reflectance_back")
+
+# Tolerance used to compare wavelengths in microns
+WAVELENGTH_TOLERANCE = 1e-6
+
+# Number of measured wavelength sets the weights of each kernel are kept for, least recently used first out
+MAX_GRIDS_PER_KERNEL = 256
+
+IntegratedProperties = namedtuple("IntegratedProperties", PROPERTIES)
+
+# Keyed by the standard object so kernels are dropped with their standard
+_kernels = weakref.WeakKeyDictionary()
+_lock = Lock()
+
+
+class WeightingKernel:
+    """Normalized weights of one method of an optical standard.
+
+    wavelengths is the method's wavelength set and weights add up to 1 so the integrated value of a
+    property sampled at wavelengths is numpy.dot(weights, values).
+    """
+
+    def __init__(self, method_name, wavelengths, weights, min_wavelength, max_wavelength):
+        self.method_name = method_name
+        self.wavelengths = wavelengths
+        self.weights = weights
+        self.min_wavelength = min_wavelength
+        self.max_wavelength = max_wavelength
+        self._weights_by_grid = OrderedDict()
+        self._lock = Lock()
+
+    def __repr__(self):
+        return "WeightingKernel({m!r}, {n} wavelengths from {lo} to {hi})".format(
+            m=self.method_name, n=len(self.wavelengths), lo=self.min_wavelength, hi=self.max_wavelength)
+
+    def weights_for(self, wavelengths):
+        """Return the weights for a property measured at wavelengths instead of at the method's wavelengths.
+
+        Measured values are linearly interpolated onto the method's wavelengths and held constant past the
+        measured range.  Weights are kept for the last MAX_GRIDS_PER_KERNEL sets of wavelengths they were
+        requested for.  Raises ValueError if the measurements do not cover the method's wavelength range.
+        """
+        grid = numpy.ascontiguousarray(wavelengths, dtype=float)
+        key = grid.tobytes()
+        with self._lock:
+            weights = self._weights_by_grid.get(key)
+            if weights is not None:
+                self._weights_by_grid.move_to_end(key)
+                return weights
+        weights = self._map_to_grid(grid)
+        with self._lock:
+            weights = self._weights_by_grid.setdefault(key, weights)
+            while len(self._weights_by_grid) > MAX_GRIDS_PER_KERNEL:
+                self._weights_by_grid.popitem(last=False)
+        return weights
+
+    def _map_to_grid(self, grid):
+        if len(grid) == 0 or grid[0] > self.min_wavelength + WAVELENGTH_TOLERANCE or \
+                grid[-1] < self.max_wavelength - WAVELENGTH_TOLERANCE:
+            raise ValueError("Measured data from {lo} to {hi} does not cover the {m} range from {a} to {b}.".format(
+                lo=grid[0] if len(grid) else None, hi=grid[-1] if len(grid) else None, m=self.method_name,
+                a=self.min_wavelength, b=self.max_wavelength))
+        if numpy.any(numpy.diff(grid) <= 0):
+            raise ValueError("Wavelengths must be increasing.")
+        # Spread the weight at each method wavelength over the two measured wavelengths around it
+        upper = numpy.clip(numpy.searchsorted(grid, self.wavelengths, side="right"), 1, len(grid) - 1)
+        lower = upper - 1
+        fraction = numpy.clip((self.wavelengths - grid[lower]) / (grid[upper] - grid[lower]), 0, 1) \
+            if len(grid) > 1 else numpy.zeros(len(self.wavelengths))
+        weights = numpy.zeros(len(grid))
+        numpy.add.at(weights, lower, self.weights * (1 - fraction))
+        numpy.add.at(weights, upper, self.weights * fraction)
+        return weights
+
+    def integrate(self, wavelengths, values):
+        """Integrate values measured at wavelengths.
+
+        values can have any number of leading dimensions, the last one is wavelength.  A value is returned
+        for each row.
+        """
+        return numpy.asarray(values, dtype=float) @ self.weights_for(wavelengths)
+
+
+def _spectrum_values(spectrum, description):
+    if spectrum.type != SpectrumType.FILE:
+        raise ValueError("The {d} is {t} and only spectra read from files can be precomputed.".format(
+            d=description, t=spectrum.type))
+    values = numpy.array(spectrum.values, dtype=float).reshape(-1, 2)
+    return values[:, 0], values[:, 1]
+
+
+def _boundary(boundary, description):
+    if boundary.type != WavelengthBoundaryType.NUMBER:
+        raise ValueError("The {d} depends on the measured wavelengths and cannot be precomputed.".format(
+            d=description))
+    return boundary.value
+
+
+def _build_kernel(method_name, method):
+    if method.integration_rule.type != IntegrationRuleType.TRAPEZOIDAL:
+        raise ValueError("Method {m} uses the {r} integration rule, only trapezoidal can be precomputed.".format(
+            m=method_name, r=method.integration_rule.type))
+    source_wavelengths, source = _spectrum_values(method.source_spectrum, "source spectrum of " + method_name)
+    if method.wavelength_set.type == WavelengthSetType.SOURCE:
+        wavelengths = source_wavelengths
+    elif method.wavelength_set.type == WavelengthSetType.FILE:
+        wavelengths = numpy.array(method.wavelength_set.values, dtype=float)
+    else:
+        raise ValueError("Method {m} uses the wavelengths of the measured data and cannot be precomputed.".format(
+            m=method_name))
+    min_wavelength = _boundary(method.min_wavelength, "minimum wavelength of " + method_name)
+    max_wavelength = _boundary(method.max_wavelength, "maximum wavelength of " + method_name)
+
+    weighting = numpy.interp(wavelengths, source_wavelengths, source)
+    if method.detector_spectrum.type != SpectrumType.NONE:
+        detector_wavelengths, detector = _spectrum_values(method.detector_spectrum,
+                                                          "detector spectrum of " + method_name)
+        weighting = weighting * numpy.interp(wavelengths, detector_wavelengths, detector)
+
+    # Trapezoidal rule over every interval that starts in [min_wavelength, max_wavelength)
+    # so the last interval may end past max_wavelength, the same as the standard's integration
+    starts = wavelengths[:-1]
+    included = (starts >= min_wavelength - WAVELENGTH_TOLERANCE) & (starts < max_wavelength - WAVELENGTH_TOLERANCE)
+    half_widths = numpy.where(included, numpy.diff(wavelengths) / 2, 0)
+    weights = numpy.zeros(len(wavelengths))
+    weights[:-1] += weighting[:-1] * half_widths
+    weights[1:] += weighting[1:] * half_widths
+    total = weights.sum()
+    if not total > 0:
+        raise ValueError("Method {m} has no weight between {a} and {b}.".format(
+            m=method_name, a=min_wavelength, b=max_wavelength))
+    return WeightingKernel(method_name, wavelengths, weights / total, min_wavelength, max_wavelength)
+
+
+def kernel(method_name, standard=standards.DEFAULT_STANDARD):
+    """Return the weighting kernel of a method, building it the first time it is requested.
+
+    standard is either a parsed OpticalStandard or anything pywincalc.standards.get accepts.  Kernels are
+    kept as long as the standard they were built for.  Raises ValueError for methods that cannot be
+    precomputed, see the module documentation.
+    """
+    if not isinstance(standard, OpticalStandard):
+        standard = standards.get(standard)
+    with _lock:
+        kernels = _kernels.setdefault(standard, {})
+        built = kernels.get(method_name)
+        if built is None:
+            methods = standard.methods
+            if method_name not in methods:
+                raise ValueError("Method {m} is not in optical standard {s}.".format(m=method_name, s=standard.name))
+            built = _build_kernel(method_name, methods[method_name])
+            kernels[method_name] = built
+        return built
+
+
+def integrate_product(product, method_name, standard=standards.DEFAULT_STANDARD):
+    """Return the integrated direct transmittances and reflectances of a product at normal incidence.
+
+    product is ProductData with wavelength measurements, e.g. from parse_optics_file or parse_json.
+    The results are those of a glazing system with only that product calculated with the full
+    wavelength range.
+    """
+    return integrate_products([product], method_name, standard)[0]
+
+
+def integrate_products(products, method_name, standard=standards.DEFAULT_STANDARD):
+    """Return integrate_product for every product.
+
+    Products measured at the same wavelengths are integrated together with one matrix product.
+    """
+    method_kernel = kernel(method_name, standard)
+    groups = {}
+    for index, product in enumerate(products):
+        if not isinstance(product.measurements, list):
+            raise ValueError("Product {p} does not have wavelength measurements.".format(p=product.product_name))
+        arrays = wavelength_data_to_arrays(product.measurements)
+        wavelengths = arrays["wavelengths"]
+        group = groups.setdefault(wavelengths.tobytes(), (wavelengths, [], []))
+        group[1].append(index)
+        group[2].append([arrays[name] for name in PROPERTIES])
+
+    results = [None] * len(products)
+    for wavelengths, indexes, values in groups.values():
+        integrated = method_kernel.integrate(wavelengths, numpy.array(values))
+        for index, row in zip(indexes, integrated):
+            results[index] = IntegratedProperties(*row.tolist())
+    return results
+
+
+def size():
+    """Return the number of kernels that have been built."""
+    with _lock:
+        return sum(len(kernels) for kernels in _kernels.values())
+
+
+def clear():
+    with _lock:
+        _kernels.clear()
@@ -31,6 +31,20 @@ class CMakeBuild(build_ext):
         for ext in self.extensions:
             self.build_extension(ext)
 
+        self.build_standards_cache()
+
+    def build_standards_cache(self):
+        # Parse the optical standards distributed with pywincalc now so the package ships their binary cache
+        # and they never need to be parsed at runtime.  This imports pywincalc so its runtime requirements
+        # are also build requirements, see pyproject.toml.
+        cwd = os.path.dirname(os.path.abspath(__file__)) if self.inplace else os.path.abspath(self.build_lib)
+        env = os.environ.copy()
+        env['PYTHONPATH'] = os.pathsep.join(p for p in [cwd, env.get('PYTHONPATH')] if p)
+        try:
+            subprocess.check_call([sys.executable, '-m', 'pywincalc.standards'], cwd=cwd, env=env)
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise RuntimeError("Could not build the optical standards cache: {e}".format(e=e))
+
     def build_extension(self, ext):
         extdir = os.path.abspath(os.path.dirname(self.get_ext_fullpath(ext.name)))
         cmake_args = ['-DCMAKE_LIBRARY_OUTPUT_DIRECTORY=' + extdir,
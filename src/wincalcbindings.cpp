@@ -1,4 +1,13 @@
+#include <algorithm>
+#include <chrono>
+#include <cstring>
+#include <map>
+#include <mutex>
+#include <tuple>
+#include <variant>
+
 #include <pybind11/iostream.h>
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <wincalc/wincalc.h>
@@ -7,17 +16,69 @@ namespace py = pybind11;
 
 using namespace pybind11::literals;
 
+using Matrix_Array =
+    py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+// Copy a matrix stored as a list of rows into a single 2D numpy array.
+py::array_t<double>
+matrix_to_array(std::vector<std::vector<double>> const &matrix) {
+  auto const rows = matrix.size();
+  auto const columns = rows == 0 ? 0 : matrix.front().size();
+  py::array_t<double> result(
+      std::vector<py::ssize_t>{static_cast<py::ssize_t>(rows),
+                               static_cast<py::ssize_t>(columns)});
+  auto *data = result.mutable_data();
+  for (auto const &row : matrix) {
+    if (row.size() != columns) {
+      throw std::invalid_argument("All matrix rows must have the same size.");
+    }
+    data = std::copy(row.begin(), row.end(), data);
+  }
+  return result;
+}
+
+py::object
+matrix_to_array(std::optional<std::vector<std::vector<double>>> const &matrix) {
+  if (!matrix) {
+    return py::none();
+  }
+  return matrix_to_array(matrix.value());
+}
+
+// Copy each row of a 2D numpy array directly from the array's buffer.
+std::vector<std::vector<double>> array_to_matrix(Matrix_Array const &array) {
+  if (array.ndim() != 2) {
+    throw std::invalid_argument("Expected a 2D array.");
+  }
+  auto const rows = array.shape(0);
+  auto const columns = array.shape(1);
+  auto const *data = array.data();
+  std::vector<std::vector<double>> matrix;
+  matrix.reserve(rows);
+  for (py::ssize_t row = 0; row < rows; ++row) {
+    matrix.emplace_back(data + row * columns, data + (row + 1) * columns);
+  }
+  return matrix;
+}
+
 template <typename T>
 void declare_wce_optical_result_simple(py::module &m, std::string typestr) {
   using Class = wincalc::WCE_Optical_Result_Simple<T>;
   std::string pyclass_name = std::string("OpticalResultFluxType") + typestr;
-  py::class_<Class>(m, pyclass_name.c_str(), py::buffer_protocol(),
-                    py::dynamic_attr())
+  py::class_<Class> optical_result(m, pyclass_name.c_str(),
+                                   py::buffer_protocol(), py::dynamic_attr());
+  optical_result
       .def_readwrite("direct_direct", &Class::direct_direct)
       .def_readwrite("direct_diffuse", &Class::direct_diffuse)
       .def_readwrite("diffuse_diffuse", &Class::diffuse_diffuse)
       .def_readwrite("direct_hemispherical", &Class::direct_hemispherical)
       .def_readwrite("matrix", &Class::matrix);
+  if constexpr (std::is_same_v<T, double>) {
+    optical_result.def_property_readonly(
+        "matrix_array",
+        [](Class const &self) { return matrix_to_array(self.matrix); },
+        "The matrix as a 2D numpy array or None if there is no matrix.");
+  }
 }
 
 template <typename T>
@@ -71,6 +132,16 @@ void declare_wce_optical_result_by_side(py::module &m, std::string typestr) {
       .def_readwrite("back", &Class::back);
 }
 
+// Results are plain values so copy.copy and copy.deepcopy both copy all of
+// them.
+template <typename Class> void def_copy(py::class_<Class> &cls) {
+  cls.def("__copy__", [](Class const &self) { return Class(self); })
+      .def(
+          "__deepcopy__",
+          [](Class const &self, py::dict const &) { return Class(self); },
+          py::arg("memo"));
+}
+
 template <typename T>
 void declare_wce_optical_results_template(py::module &m, std::string typestr) {
   using Class = wincalc::WCE_Optical_Results_Template<T>;
@@ -83,13 +154,15 @@ void declare_wce_optical_results_template(py::module &m, std::string typestr) {
   declare_wce_optical_result_by_side<wincalc::WCE_Optical_Result_Layer<T>>(
       m, typestr + "_Layer");
   std::string pyclass_name = std::string("OpticalResults") + typestr;
-  py::class_<Class>(m, pyclass_name.c_str(), py::buffer_protocol(),
-                    py::dynamic_attr())
+  py::class_<Class> results(m, pyclass_name.c_str(), py::buffer_protocol(),
+                            py::dynamic_attr());
+  results
       .def_readwrite("system_results", &Class::system_results,
                      "Results for the entire system.")
       .def_readwrite("layer_results", &Class::layer_results,
                      "A list of results where each item in the list contains "
                      "the results for one layer in the system.");
+  def_copy(results);
 }
 
 template <>
@@ -102,11 +175,12 @@ void declare_wce_optical_results_template<wincalc::Color_Result>(
   declare_wce_optical_result_by_side<wincalc::WCE_Optical_Transmission_Result<
       wincalc::WCE_Optical_Result_Simple<wincalc::Color_Result>>>(m, typestr);
   std::string pyclass_name = std::string("OpticalResults") + typestr;
-  py::class_<Class>(m, pyclass_name.c_str(), py::buffer_protocol(),
-                    py::dynamic_attr())
-      .def_readwrite("system_results", &Class::system_results,
-                     "Results for the entire system.  Layer results for colors "
-                     "are not currently supported.");
+  py::class_<Class> results(m, pyclass_name.c_str(), py::buffer_protocol(),
+                            py::dynamic_attr());
+  results.def_readwrite("system_results", &Class::system_results,
+                        "Results for the entire system.  Layer results for "
+                        "colors are not currently supported.");
+  def_copy(results);
 }
 
 class Py_Product_Data_Optical : public wincalc::Product_Data_Optical //_Base
@@ -120,6 +194,69 @@ public:
   }
 };
 
+std::shared_ptr<wincalc::Product_Data_Optical>
+copy_optical_data(std::shared_ptr<wincalc::Product_Data_Optical> const &data);
+
+// Copy optical data as the first of Types it is an instance of, most derived
+// types first.  Returns nullptr if it is none of them.
+template <typename Type, typename... Types>
+std::shared_ptr<wincalc::Product_Data_Optical> copy_optical_data_as(
+    std::shared_ptr<wincalc::Product_Data_Optical> const &data) {
+  if (auto typed = std::dynamic_pointer_cast<Type>(data)) {
+    auto copy = std::make_shared<Type>(*typed);
+    if constexpr (std::is_base_of_v<wincalc::Product_Data_Optical_With_Material,
+                                    Type>) {
+      // The copy shares the material, and flipping the copy flips the
+      // material too, so copy the material as well.
+      copy->material_optical_data =
+          copy_optical_data(typed->material_optical_data);
+      if (typed->material_optical_data && !copy->material_optical_data) {
+        return nullptr;
+      }
+    }
+    return copy;
+  }
+  if constexpr (sizeof...(Types) > 0) {
+    return copy_optical_data_as<Types...>(data);
+  } else {
+    return nullptr;
+  }
+}
+
+// Copy optical data and the material it is made of.  Returns nullptr if the
+// data or its material cannot be copied, e.g. optical data defined in Python.
+std::shared_ptr<wincalc::Product_Data_Optical>
+copy_optical_data(std::shared_ptr<wincalc::Product_Data_Optical> const &data) {
+  if (!data) {
+    return nullptr;
+  }
+  return copy_optical_data_as<
+      wincalc::Product_Data_Optical_Venetian,
+      wincalc::Product_Data_Optical_Woven_Shade,
+      wincalc::Product_Data_Optical_Perforated_Screen,
+      wincalc::Product_Data_Optical_With_Material,
+      wincalc::Product_Data_Dual_Band_Optical_BSDF,
+      wincalc::Product_Data_Dual_Band_Optical_Hemispheric,
+      wincalc::Product_Data_N_Band_Optical>(data);
+}
+
+// A solid layer holds its optical and thermal data by shared pointer and
+// Glazing_System::flip_layer flips that data in place.  Copying a layer
+// copies both so the copy can be flipped without flipping the layer.  Raises
+// TypeError if the optical data cannot be copied.
+wincalc::Product_Data_Optical_Thermal
+copy_solid_layer(wincalc::Product_Data_Optical_Thermal const &layer) {
+  auto optical_data = copy_optical_data(layer.optical_data);
+  if (layer.optical_data && !optical_data) {
+    throw py::type_error("Cannot copy optical data of this type.");
+  }
+  auto thermal_data =
+      layer.thermal_data
+          ? std::make_shared<wincalc::Product_Data_Thermal>(*layer.thermal_data)
+          : nullptr;
+  return wincalc::Product_Data_Optical_Thermal(optical_data, thermal_data);
+}
+
 class Py_UniversalSupportPillar
     : public Tarcog::ISO15099::UniversalSupportPillar {
 public:
@@ -132,6 +269,959 @@ protected:
   }
 };
 
+// Glazing_System with a mutex.  Calculations release the GIL so two Python
+// threads using the same system would otherwise race in WinCalc's solver
+// state.  Every bound method holds the mutex so the second thread waits.
+class Locked_Glazing_System : public wincalc::Glazing_System {
+public:
+  using wincalc::Glazing_System::Glazing_System;
+
+  mutable std::mutex mutex;
+};
+
+// Call a Glazing_System method without the GIL and with the system's mutex
+// held.  Results are copied while the mutex is held.
+template <typename Result, typename... Args>
+auto locked(Result (wincalc::Glazing_System::*method)(Args...)) {
+  return [method](Locked_Glazing_System &self, Args... args) {
+    py::gil_scoped_release release;
+    std::lock_guard<std::mutex> lock(self.mutex);
+    return std::decay_t<Result>((self.*method)(std::forward<Args>(args)...));
+  };
+}
+
+template <typename Result, typename... Args>
+auto locked(Result (wincalc::Glazing_System::*method)(Args...) const) {
+  return [method](Locked_Glazing_System const &self, Args... args) {
+    py::gil_scoped_release release;
+    std::lock_guard<std::mutex> lock(self.mutex);
+    return std::decay_t<Result>((self.*method)(std::forward<Args>(args)...));
+  };
+}
+
+template <typename Class, typename Member>
+using member_type_t =
+    std::decay_t<decltype(std::declval<Class const &>().*std::declval<Member>())>;
+
+void check_pickle_state(py::tuple const &state, size_t size) {
+  if (state.size() != size) {
+    throw std::runtime_error("Invalid pickle state.");
+  }
+}
+
+template <typename Class, typename... Members, size_t... Index>
+Class construct_from_pickle_state(py::tuple const &state,
+                                  std::index_sequence<Index...>) {
+  return Class(state[Index].template cast<member_type_t<Class, Members>>()...);
+}
+
+// Pickle a class as the tuple of members that are also, in order, the
+// arguments of one of its constructors.
+template <typename Class, typename... Members>
+auto pickle_constructor_members(Members... members) {
+  return py::pickle(
+      [members...](Class const &self) {
+        return py::make_tuple((self.*members)...);
+      },
+      [](py::tuple const &state) {
+        check_pickle_state(state, sizeof...(Members));
+        return construct_from_pickle_state<Class, Members...>(
+            state, std::index_sequence_for<Members...>{});
+      });
+}
+
+// Pickle a default constructible class as the tuple of its members.
+template <typename Class, typename... Members>
+auto pickle_members(Members... members) {
+  return py::pickle(
+      [members...](Class const &self) {
+        return py::make_tuple((self.*members)...);
+      },
+      [members...](py::tuple const &state) {
+        check_pickle_state(state, sizeof...(Members));
+        Class result;
+        size_t index = 0;
+        ((result.*members =
+              state[index++].template cast<member_type_t<Class, Members>>()),
+         ...);
+        return result;
+      });
+}
+
+// Packed binary pickle state.  Values are written in native byte order so the
+// state is for processes of the same build, e.g. the workers of
+// pywincalc.map_systems, not for storage.
+struct State_Writer {
+  std::string bytes;
+
+  void write(void const *value, size_t size) {
+    bytes.append(static_cast<char const *>(value), size);
+  }
+};
+
+class State_Reader {
+public:
+  explicit State_Reader(std::string const &bytes)
+      : position(bytes.data()), end(bytes.data() + bytes.size()) {}
+
+  void read(void *value, size_t size) {
+    if (static_cast<size_t>(end - position) < size) {
+      throw std::runtime_error("Invalid pickle state.");
+    }
+    std::memcpy(value, position, size);
+    position += size;
+  }
+
+  bool at_end() const { return position == end; }
+
+private:
+  char const *position;
+  char const *end;
+};
+
+// unpack is overloaded on Tag<T> to return a T
+template <typename T> struct Tag {};
+
+template <typename T>
+std::enable_if_t<std::is_arithmetic_v<T> || std::is_enum_v<T>>
+pack(State_Writer &state, T value) {
+  state.write(&value, sizeof(T));
+}
+
+template <typename T>
+std::enable_if_t<std::is_arithmetic_v<T> || std::is_enum_v<T>, T>
+unpack(State_Reader &state, Tag<T>) {
+  T value;
+  state.read(&value, sizeof(T));
+  return value;
+}
+
+void pack(State_Writer &state, std::string const &value) {
+  pack(state, uint64_t(value.size()));
+  state.write(value.data(), value.size());
+}
+
+std::string unpack(State_Reader &state, Tag<std::string>) {
+  std::string value(unpack(state, Tag<uint64_t>{}), '\0');
+  state.read(value.data(), value.size());
+  return value;
+}
+
+template <typename T>
+void pack(State_Writer &state, std::optional<T> const &value) {
+  pack(state, value.has_value());
+  if (value) {
+    pack(state, *value);
+  }
+}
+
+template <typename T>
+std::optional<T> unpack(State_Reader &state, Tag<std::optional<T>>) {
+  if (!unpack(state, Tag<bool>{})) {
+    return std::nullopt;
+  }
+  return unpack(state, Tag<T>{});
+}
+
+template <typename T>
+void pack(State_Writer &state, std::vector<T> const &values) {
+  pack(state, uint64_t(values.size()));
+  for (auto const &value : values) {
+    pack(state, value);
+  }
+}
+
+template <typename T>
+std::vector<T> unpack(State_Reader &state, Tag<std::vector<T>>) {
+  auto const size = unpack(state, Tag<uint64_t>{});
+  std::vector<T> values;
+  for (uint64_t i = 0; i < size; ++i) {
+    values.push_back(unpack(state, Tag<T>{}));
+  }
+  return values;
+}
+
+template <typename Key, typename Value>
+void pack(State_Writer &state, std::map<Key, Value> const &values) {
+  pack(state, uint64_t(values.size()));
+  for (auto const &[key, value] : values) {
+    pack(state, key);
+    pack(state, value);
+  }
+}
+
+template <typename Key, typename Value>
+std::map<Key, Value> unpack(State_Reader &state, Tag<std::map<Key, Value>>) {
+  auto const size = unpack(state, Tag<uint64_t>{});
+  std::map<Key, Value> values;
+  for (uint64_t i = 0; i < size; ++i) {
+    auto key = unpack(state, Tag<Key>{});
+    values.emplace(std::move(key), unpack(state, Tag<Value>{}));
+  }
+  return values;
+}
+
+template <typename... Types>
+void pack(State_Writer &state, std::variant<Types...> const &value) {
+  pack(state, uint64_t(value.index()));
+  std::visit([&state](auto const &alternative) { pack(state, alternative); },
+             value);
+}
+
+template <typename Variant, typename First, typename... Rest>
+Variant unpack_alternative(State_Reader &state, uint64_t index) {
+  if (index == 0) {
+    return unpack(state, Tag<First>{});
+  }
+  if constexpr (sizeof...(Rest) == 0) {
+    throw std::runtime_error("Invalid pickle state.");
+  } else {
+    return unpack_alternative<Variant, Rest...>(state, index - 1);
+  }
+}
+
+template <typename... Types>
+std::variant<Types...> unpack(State_Reader &state,
+                              Tag<std::variant<Types...>>) {
+  return unpack_alternative<std::variant<Types...>, Types...>(
+      state, unpack(state, Tag<uint64_t>{}));
+}
+
+template <typename T>
+void pack(State_Writer &state, std::shared_ptr<T> const &value) {
+  pack(state, value != nullptr);
+  if (value) {
+    pack(state, *value);
+  }
+}
+
+template <typename T>
+std::shared_ptr<T> unpack(State_Reader &state, Tag<std::shared_ptr<T>>) {
+  if (!unpack(state, Tag<bool>{})) {
+    return nullptr;
+  }
+  return std::make_shared<T>(unpack(state, Tag<T>{}));
+}
+
+template <typename Class, typename... Members>
+void pack_members(State_Writer &state, Class const &value, Members... members) {
+  (pack(state, value.*members), ...);
+}
+
+// Unpack the members that are, in order, the arguments of one of the
+// constructors of the class.
+template <typename Class, typename... Members>
+Class unpack_constructor_members(State_Reader &state, Members...) {
+  // Braced initialization unpacks the members in order
+  std::tuple<member_type_t<Class, Members>...> arguments{
+      unpack(state, Tag<member_type_t<Class, Members>>{})...};
+  return std::make_from_tuple<Class>(std::move(arguments));
+}
+
+template <typename Class, typename... Members>
+Class unpack_members(State_Reader &state, Members... members) {
+  Class result;
+  ((result.*members = unpack(state, Tag<member_type_t<Class, Members>>{})),
+   ...);
+  return result;
+}
+
+void pack(State_Writer &state,
+          OpticsParser::MeasurementComponent const &value) {
+  pack_members(state, value, &OpticsParser::MeasurementComponent::tf,
+               &OpticsParser::MeasurementComponent::tb,
+               &OpticsParser::MeasurementComponent::rf,
+               &OpticsParser::MeasurementComponent::rb);
+}
+
+OpticsParser::MeasurementComponent
+unpack(State_Reader &state, Tag<OpticsParser::MeasurementComponent>) {
+  return unpack_constructor_members<OpticsParser::MeasurementComponent>(
+      state, &OpticsParser::MeasurementComponent::tf,
+      &OpticsParser::MeasurementComponent::tb,
+      &OpticsParser::MeasurementComponent::rf,
+      &OpticsParser::MeasurementComponent::rb);
+}
+
+void pack(State_Writer &state, OpticsParser::PVWavelengthData const &value) {
+  pack_members(state, value, &OpticsParser::PVWavelengthData::eqef,
+               &OpticsParser::PVWavelengthData::eqeb);
+}
+
+OpticsParser::PVWavelengthData unpack(State_Reader &state,
+                                      Tag<OpticsParser::PVWavelengthData>) {
+  return unpack_constructor_members<OpticsParser::PVWavelengthData>(
+      state, &OpticsParser::PVWavelengthData::eqef,
+      &OpticsParser::PVWavelengthData::eqeb);
+}
+
+void pack(State_Writer &state, OpticsParser::WLData const &value) {
+  pack_members(state, value, &OpticsParser::WLData::wavelength,
+               &OpticsParser::WLData::directComponent,
+               &OpticsParser::WLData::diffuseComponent,
+               &OpticsParser::WLData::pvComponent);
+}
+
+OpticsParser::WLData unpack(State_Reader &state, Tag<OpticsParser::WLData>) {
+  auto result = unpack_constructor_members<OpticsParser::WLData>(
+      state, &OpticsParser::WLData::wavelength,
+      &OpticsParser::WLData::directComponent,
+      &OpticsParser::WLData::diffuseComponent);
+  result.pvComponent =
+      unpack(state, Tag<decltype(OpticsParser::WLData::pvComponent)>{});
+  return result;
+}
+
+void pack(State_Writer &state, OpticsParser::BSDF const &value) {
+  pack_members(state, value, &OpticsParser::BSDF::data,
+               &OpticsParser::BSDF::rowAngleBasisName,
+               &OpticsParser::BSDF::columnAngleBasisName);
+}
+
+OpticsParser::BSDF unpack(State_Reader &state, Tag<OpticsParser::BSDF>) {
+  return unpack_members<OpticsParser::BSDF>(
+      state, &OpticsParser::BSDF::data, &OpticsParser::BSDF::rowAngleBasisName,
+      &OpticsParser::BSDF::columnAngleBasisName);
+}
+
+void pack(State_Writer &state, OpticsParser::WavelengthBSDFs const &value) {
+  pack_members(state, value, &OpticsParser::WavelengthBSDFs::tf,
+               &OpticsParser::WavelengthBSDFs::tb,
+               &OpticsParser::WavelengthBSDFs::rf,
+               &OpticsParser::WavelengthBSDFs::rb);
+}
+
+OpticsParser::WavelengthBSDFs unpack(State_Reader &state,
+                                     Tag<OpticsParser::WavelengthBSDFs>) {
+  return unpack_members<OpticsParser::WavelengthBSDFs>(
+      state, &OpticsParser::WavelengthBSDFs::tf,
+      &OpticsParser::WavelengthBSDFs::tb, &OpticsParser::WavelengthBSDFs::rf,
+      &OpticsParser::WavelengthBSDFs::rb);
+}
+
+void pack(State_Writer &state, OpticsParser::DualBandBSDF const &value) {
+  pack_members(state, value, &OpticsParser::DualBandBSDF::solar,
+               &OpticsParser::DualBandBSDF::visible);
+}
+
+OpticsParser::DualBandBSDF unpack(State_Reader &state,
+                                  Tag<OpticsParser::DualBandBSDF>) {
+  return unpack_members<OpticsParser::DualBandBSDF>(
+      state, &OpticsParser::DualBandBSDF::solar,
+      &OpticsParser::DualBandBSDF::visible);
+}
+
+void pack(State_Writer &state, OpticsParser::PVPowerProperty const &value) {
+  pack_members(state, value, &OpticsParser::PVPowerProperty::jsc,
+               &OpticsParser::PVPowerProperty::voc,
+               &OpticsParser::PVPowerProperty::ff);
+}
+
+OpticsParser::PVPowerProperty unpack(State_Reader &state,
+                                     Tag<OpticsParser::PVPowerProperty>) {
+  return unpack_constructor_members<OpticsParser::PVPowerProperty>(
+      state, &OpticsParser::PVPowerProperty::jsc,
+      &OpticsParser::PVPowerProperty::voc, &OpticsParser::PVPowerProperty::ff);
+}
+
+// Product geometries are packed after a tag for their type
+enum class Geometry_Type : uint8_t { NONE, VENETIAN, WOVEN, PERFORATED };
+
+#define VENETIAN_GEOMETRY_MEMBERS                                              \
+  &OpticsParser::VenetianGeometry::slatWidth,                                  \
+      &OpticsParser::VenetianGeometry::slatSpacing,                            \
+      &OpticsParser::VenetianGeometry::slatCurvature,                          \
+      &OpticsParser::VenetianGeometry::slatTilt,                               \
+      &OpticsParser::VenetianGeometry::tiltChoice,                             \
+      &OpticsParser::VenetianGeometry::numberSegments
+#define WOVEN_GEOMETRY_MEMBERS                                                 \
+  &OpticsParser::WovenGeometry::threadDiameter,                                \
+      &OpticsParser::WovenGeometry::threadSpacing,                             \
+      &OpticsParser::WovenGeometry::shadeThickness
+#define PERFORATED_GEOMETRY_MEMBERS                                            \
+  &OpticsParser::PerforatedGeometry::spacingX,                                 \
+      &OpticsParser::PerforatedGeometry::spacingY,                             \
+      &OpticsParser::PerforatedGeometry::dimensionX,                           \
+      &OpticsParser::PerforatedGeometry::dimensionY,                           \
+      &OpticsParser::PerforatedGeometry::perforationType
+
+void pack(State_Writer &state,
+          std::shared_ptr<OpticsParser::ProductGeometry> const &value) {
+  if (!value) {
+    pack(state, Geometry_Type::NONE);
+  } else if (auto venetian =
+                 std::dynamic_pointer_cast<OpticsParser::VenetianGeometry>(
+                     value)) {
+    pack(state, Geometry_Type::VENETIAN);
+    pack_members(state, *venetian, VENETIAN_GEOMETRY_MEMBERS);
+  } else if (auto woven =
+                 std::dynamic_pointer_cast<OpticsParser::WovenGeometry>(
+                     value)) {
+    pack(state, Geometry_Type::WOVEN);
+    pack_members(state, *woven, WOVEN_GEOMETRY_MEMBERS);
+  } else if (auto perforated =
+                 std::dynamic_pointer_cast<OpticsParser::PerforatedGeometry>(
+                     value)) {
+    pack(state, Geometry_Type::PERFORATED);
+    pack_members(state, *perforated, PERFORATED_GEOMETRY_MEMBERS);
+  } else {
+    throw std::runtime_error("Cannot pickle an unknown product geometry.");
+  }
+}
+
+std::shared_ptr<OpticsParser::ProductGeometry>
+unpack(State_Reader &state,
+       Tag<std::shared_ptr<OpticsParser::ProductGeometry>>) {
+  switch (unpack(state, Tag<Geometry_Type>{})) {
+  case Geometry_Type::NONE:
+    return nullptr;
+  case Geometry_Type::VENETIAN:
+    return std::make_shared<OpticsParser::VenetianGeometry>(
+        unpack_constructor_members<OpticsParser::VenetianGeometry>(
+            state, VENETIAN_GEOMETRY_MEMBERS));
+  case Geometry_Type::WOVEN:
+    return std::make_shared<OpticsParser::WovenGeometry>(
+        unpack_constructor_members<OpticsParser::WovenGeometry>(
+            state, WOVEN_GEOMETRY_MEMBERS));
+  case Geometry_Type::PERFORATED:
+    return std::make_shared<OpticsParser::PerforatedGeometry>(
+        unpack_constructor_members<OpticsParser::PerforatedGeometry>(
+            state, PERFORATED_GEOMETRY_MEMBERS));
+  }
+  throw std::runtime_error("Invalid pickle state.");
+}
+
+void pack(State_Writer &state,
+          OpticsParser::CompositionInformation const &value) {
+  pack_members(state, value, &OpticsParser::CompositionInformation::material,
+               &OpticsParser::CompositionInformation::geometry);
+}
+
+OpticsParser::CompositionInformation
+unpack(State_Reader &state, Tag<OpticsParser::CompositionInformation>) {
+  return unpack_constructor_members<OpticsParser::CompositionInformation>(
+      state, &OpticsParser::CompositionInformation::material,
+      &OpticsParser::CompositionInformation::geometry);
+}
+
+// Accessor for a member of ProductData that is not callable if the version of
+// OpticsParser in use does not have the member.
+#define PRODUCT_DATA_MEMBER(name)                                              \
+  [](auto &product) -> decltype((product.name)) { return product.name; }
+
+// Every member of ProductData, including the ones without Python attributes,
+// in the order they are packed.
+auto product_data_members() {
+  return std::make_tuple(
+      PRODUCT_DATA_MEMBER(productName), PRODUCT_DATA_MEMBER(productType),
+      PRODUCT_DATA_MEMBER(productSubtype), PRODUCT_DATA_MEMBER(nfrcid),
+      PRODUCT_DATA_MEMBER(manufacturer), PRODUCT_DATA_MEMBER(material),
+      PRODUCT_DATA_MEMBER(thickness), PRODUCT_DATA_MEMBER(conductivity),
+      PRODUCT_DATA_MEMBER(coatingName), PRODUCT_DATA_MEMBER(coatedSide),
+      PRODUCT_DATA_MEMBER(substrateFilename), PRODUCT_DATA_MEMBER(appearance),
+      PRODUCT_DATA_MEMBER(acceptance), PRODUCT_DATA_MEMBER(fileName),
+      PRODUCT_DATA_MEMBER(dataFileName), PRODUCT_DATA_MEMBER(unitSystem),
+      PRODUCT_DATA_MEMBER(wavelengthUnit), PRODUCT_DATA_MEMBER(IRTransmittance),
+      PRODUCT_DATA_MEMBER(frontEmissivity), PRODUCT_DATA_MEMBER(backEmissivity),
+      PRODUCT_DATA_MEMBER(frontEmissivitySource),
+      PRODUCT_DATA_MEMBER(backEmissivitySource),
+      PRODUCT_DATA_MEMBER(measurements), PRODUCT_DATA_MEMBER(extrapolation),
+      PRODUCT_DATA_MEMBER(aercAcceptance), PRODUCT_DATA_MEMBER(specularity),
+      PRODUCT_DATA_MEMBER(permeabilityFactor),
+      PRODUCT_DATA_MEMBER(opticalOpenness), PRODUCT_DATA_MEMBER(density),
+      PRODUCT_DATA_MEMBER(youngsModulus),
+      PRODUCT_DATA_MEMBER(pvPowerProperties), PRODUCT_DATA_MEMBER(composition));
+}
+
+void pack(State_Writer &state, OpticsParser::ProductData const &value) {
+  std::apply(
+      [&](auto... members) {
+        auto pack_member = [&](auto member) {
+          if constexpr (std::is_invocable_v<
+                            decltype(member),
+                            OpticsParser::ProductData const &>) {
+            pack(state, member(value));
+          }
+        };
+        (pack_member(members), ...);
+      },
+      product_data_members());
+}
+
+OpticsParser::ProductData unpack(State_Reader &state,
+                                 Tag<OpticsParser::ProductData>) {
+  OpticsParser::ProductData result;
+  std::apply(
+      [&](auto... members) {
+        auto unpack_member = [&](auto member) {
+          if constexpr (std::is_invocable_v<decltype(member),
+                                            OpticsParser::ProductData &>) {
+            auto &value = member(result);
+            value = unpack(state, Tag<std::decay_t<decltype(value)>>{});
+          }
+        };
+        (unpack_member(members), ...);
+      },
+      product_data_members());
+  return result;
+}
+
+// Pickle a class as the packed bytes of its complete state
+template <typename Class> auto pickle_packed() {
+  return py::pickle(
+      [](Class const &self) {
+        State_Writer state;
+        pack(state, self);
+        return py::bytes(state.bytes);
+      },
+      [](py::bytes const &bytes) {
+        std::string const data = bytes;
+        State_Reader state(data);
+        auto result = unpack(state, Tag<Class>{});
+        if (!state.at_end()) {
+          throw std::runtime_error("Invalid pickle state.");
+        }
+        return result;
+      });
+}
+
+SingleLayerOptics::BSDFBasis
+bsdf_basis(SingleLayerOptics::BSDFHemisphere const &hemisphere) {
+  // The hemisphere does not keep the basis it was created from but each
+  // basis has a distinct number of patches.
+  auto const patches =
+      hemisphere.getDirections(SingleLayerOptics::BSDFDirection::Incoming)
+          .lambdaVector()
+          .size();
+  switch (patches) {
+  case 7:
+    return SingleLayerOptics::BSDFBasis::Small;
+  case 41:
+    return SingleLayerOptics::BSDFBasis::Quarter;
+  case 73:
+    return SingleLayerOptics::BSDFBasis::Half;
+  case 145:
+    return SingleLayerOptics::BSDFBasis::Full;
+  default:
+    throw std::runtime_error("Unsupported BSDF basis with " +
+                             std::to_string(patches) + " patches.");
+  }
+}
+
+using Optical_Flux_Result = wincalc::WCE_Optical_Result_Simple<double>;
+using Optical_Transmission_Result =
+    wincalc::WCE_Optical_Transmission_Result<Optical_Flux_Result>;
+using Optical_Absorptance_Result =
+    wincalc::WCE_Optical_Result_Absorptance<double>;
+using Optical_Layer_Result = wincalc::WCE_Optical_Result_Layer<double>;
+
+template <typename Side_Result>
+std::vector<std::pair<
+    std::string, Side_Result wincalc::WCE_Optical_Result_By_Side<Side_Result>::*>>
+optical_result_sides() {
+  return {{"front", &wincalc::WCE_Optical_Result_By_Side<Side_Result>::front},
+          {"back", &wincalc::WCE_Optical_Result_By_Side<Side_Result>::back}};
+}
+
+// Flatten optical results into one numpy array per value so large numbers of
+// results can be exported without walking the nested result objects in Python.
+// System values are 1D arrays with one value per result.  Layer values are 2D
+// arrays with one row per result and one column per layer, padded with NaN for
+// results with fewer layers.
+py::dict optical_results_to_columns(
+    std::vector<wincalc::WCE_Optical_Results_Template<double>> const &results) {
+  std::vector<std::pair<std::string, double Optical_Flux_Result::*>> const
+      fluxes{{"direct_direct", &Optical_Flux_Result::direct_direct},
+             {"direct_diffuse", &Optical_Flux_Result::direct_diffuse},
+             {"diffuse_diffuse", &Optical_Flux_Result::diffuse_diffuse},
+             {"direct_hemispherical",
+              &Optical_Flux_Result::direct_hemispherical}};
+  std::vector<std::pair<std::string,
+                        Optical_Flux_Result Optical_Transmission_Result::*>> const
+      properties{{"transmittance", &Optical_Transmission_Result::transmittance},
+                 {"reflectance", &Optical_Transmission_Result::reflectance}};
+  std::vector<std::pair<std::string, double Optical_Absorptance_Result::*>> const
+      absorptances{
+          {"total_direct", &Optical_Absorptance_Result::total_direct},
+          {"total_diffuse", &Optical_Absorptance_Result::total_diffuse},
+          {"heat_direct", &Optical_Absorptance_Result::heat_direct},
+          {"heat_diffuse", &Optical_Absorptance_Result::heat_diffuse},
+          {"electricity_direct",
+           &Optical_Absorptance_Result::electricity_direct},
+          {"electricity_diffuse",
+           &Optical_Absorptance_Result::electricity_diffuse}};
+
+  auto const result_count = static_cast<py::ssize_t>(results.size());
+  size_t layer_count = 0;
+  for (auto const &result : results) {
+    layer_count = std::max(layer_count, result.layer_results.size());
+  }
+
+  py::dict columns;
+  py::array_t<int> number_of_layers(result_count);
+  auto *number_of_layers_data = number_of_layers.mutable_data();
+  for (size_t i = 0; i < results.size(); ++i) {
+    number_of_layers_data[i] =
+        static_cast<int>(results[i].layer_results.size());
+  }
+  columns["number_of_layers"] = number_of_layers;
+
+  for (auto const &[side_name, side] :
+       optical_result_sides<Optical_Transmission_Result>()) {
+    for (auto const &[property_name, property] : properties) {
+      for (auto const &[flux_name, flux] : fluxes) {
+        py::array_t<double> column(result_count);
+        auto *data = column.mutable_data();
+        for (size_t i = 0; i < results.size(); ++i) {
+          data[i] = results[i].system_results.*side.*property.*flux;
+        }
+        columns[py::str("system_" + side_name + "_" + property_name + "_" +
+                        flux_name)] = column;
+      }
+    }
+  }
+
+  for (auto const &[side_name, side] :
+       optical_result_sides<Optical_Layer_Result>()) {
+    for (auto const &[absorptance_name, absorptance] : absorptances) {
+      py::array_t<double> column(std::vector<py::ssize_t>{
+          result_count, static_cast<py::ssize_t>(layer_count)});
+      auto *data = column.mutable_data();
+      std::fill(data, data + results.size() * layer_count,
+                std::numeric_limits<double>::quiet_NaN());
+      for (size_t i = 0; i < results.size(); ++i) {
+        auto const &layer_results = results[i].layer_results;
+        for (size_t layer = 0; layer < layer_results.size(); ++layer) {
+          data[i * layer_count + layer] =
+              (layer_results[layer].*side).absorptance.*absorptance;
+        }
+      }
+      columns[py::str("layer_" + side_name + "_absorptance_" +
+                      absorptance_name)] = column;
+    }
+  }
+  return columns;
+}
+
+using Color_Results =
+    wincalc::WCE_Optical_Results_Template<wincalc::Color_Result>;
+using Color_Flux_Result =
+    wincalc::WCE_Optical_Result_Simple<wincalc::Color_Result>;
+using Color_Transmission_Result =
+    wincalc::WCE_Optical_Transmission_Result<Color_Flux_Result>;
+
+// Add one column per side, property, flux and value of one component of the
+// color results, e.g. system_front_transmittance_direct_hemispherical_lab_L
+template <typename Component, typename Value>
+void add_color_columns(
+    py::dict &columns, std::vector<Color_Results> const &results,
+    std::string const &component_name,
+    Component wincalc::Color_Result::*component,
+    std::vector<std::pair<std::string, Value Component::*>> const &values) {
+  std::vector<std::pair<std::string,
+                        wincalc::Color_Result Color_Flux_Result::*>> const
+      fluxes{{"direct_direct", &Color_Flux_Result::direct_direct},
+             {"direct_diffuse", &Color_Flux_Result::direct_diffuse},
+             {"diffuse_diffuse", &Color_Flux_Result::diffuse_diffuse},
+             {"direct_hemispherical",
+              &Color_Flux_Result::direct_hemispherical}};
+  std::vector<std::pair<std::string,
+                        Color_Flux_Result Color_Transmission_Result::*>> const
+      properties{{"transmittance", &Color_Transmission_Result::transmittance},
+                 {"reflectance", &Color_Transmission_Result::reflectance}};
+
+  auto const result_count = static_cast<py::ssize_t>(results.size());
+  for (auto const &[side_name, side] :
+       optical_result_sides<Color_Transmission_Result>()) {
+    for (auto const &[property_name, property] : properties) {
+      for (auto const &[flux_name, flux] : fluxes) {
+        for (auto const &[value_name, value] : values) {
+          py::array_t<Value> column(result_count);
+          auto *data = column.mutable_data();
+          for (size_t i = 0; i < results.size(); ++i) {
+            auto const &color =
+                results[i].system_results.*side.*property.*flux;
+            data[i] = color.*component.*value;
+          }
+          columns[py::str("system_" + side_name + "_" + property_name + "_" +
+                          flux_name + "_" + component_name + "_" +
+                          value_name)] = column;
+        }
+      }
+    }
+  }
+}
+
+// Flatten color results the same way as optical_results_to_columns.  Every
+// value is a 1D array with one value per result.
+py::dict color_results_to_columns(std::vector<Color_Results> const &results) {
+  using Trichromatic_Value = decltype(wincalc::Trichromatic::X);
+  using Lab_Value = decltype(wincalc::Lab::L);
+  using RGB_Value = decltype(wincalc::WinCalc_RGB::R);
+  py::dict columns;
+  add_color_columns<wincalc::Trichromatic, Trichromatic_Value>(
+      columns, results, "trichromatic", &wincalc::Color_Result::trichromatic,
+      {{"X", &wincalc::Trichromatic::X},
+       {"Y", &wincalc::Trichromatic::Y},
+       {"Z", &wincalc::Trichromatic::Z}});
+  add_color_columns<wincalc::Lab, Lab_Value>(
+      columns, results, "lab", &wincalc::Color_Result::lab,
+      {{"L", &wincalc::Lab::L},
+       {"a", &wincalc::Lab::a},
+       {"b", &wincalc::Lab::b}});
+  add_color_columns<wincalc::WinCalc_RGB, RGB_Value>(
+      columns, results, "rgb", &wincalc::Color_Result::rgb,
+      {{"R", &wincalc::WinCalc_RGB::R},
+       {"G", &wincalc::WinCalc_RGB::G},
+       {"B", &wincalc::WinCalc_RGB::B}});
+  return columns;
+}
+
+using Series_Array =
+    py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+std::vector<double> series_values(Series_Array const &series,
+                                  std::string const &name) {
+  if (series.ndim() != 1) {
+    throw std::invalid_argument(name + " must be a 1D array.");
+  }
+  return std::vector<double>(series.data(), series.data() + series.size());
+}
+
+// Calculate thermal results for each time step of a series of boundary
+// conditions.  The glazing system's environments are used as a template and
+// are restored when the series has been calculated.  The radiation
+// temperatures are the template's unless a series is given for them.
+py::dict simulate_timeseries(
+    Locked_Glazing_System &system, Series_Array const &outside_temperatures,
+    Series_Array const &inside_temperatures, Series_Array const &wind_speeds,
+    Series_Array const &solar_radiation, double theta, double phi,
+    std::optional<Series_Array> const &outside_radiation_temperatures,
+    std::optional<Series_Array> const &inside_radiation_temperatures) {
+  auto const outside = series_values(outside_temperatures, "outside_temps");
+  auto const inside = series_values(inside_temperatures, "inside_temps");
+  auto const wind = series_values(wind_speeds, "wind_speeds");
+  auto const solar = series_values(solar_radiation, "solar_radiation");
+  std::optional<std::vector<double>> outside_radiation;
+  if (outside_radiation_temperatures) {
+    outside_radiation = series_values(*outside_radiation_temperatures,
+                                      "outside_radiation_temps");
+  }
+  std::optional<std::vector<double>> inside_radiation;
+  if (inside_radiation_temperatures) {
+    inside_radiation =
+        series_values(*inside_radiation_temperatures, "inside_radiation_temps");
+  }
+  auto const steps = outside.size();
+  if (inside.size() != steps || wind.size() != steps || solar.size() != steps ||
+      (outside_radiation && outside_radiation->size() != steps) ||
+      (inside_radiation && inside_radiation->size() != steps)) {
+    throw std::invalid_argument("All time series must have the same length.");
+  }
+
+  std::vector<double> u(steps);
+  std::vector<double> shgc(steps);
+  std::vector<double> heat_flux(steps);
+  std::vector<std::vector<double>> layer_temperatures(steps);
+  double elapsed_seconds = 0;
+  {
+    py::gil_scoped_release release;
+    std::lock_guard<std::mutex> lock(system.mutex);
+    auto const original_environments = system.environments();
+    auto const start = std::chrono::steady_clock::now();
+    try {
+      auto environments = original_environments;
+      for (size_t step = 0; step < steps; ++step) {
+        environments.outside.air_temperature = outside[step];
+        if (outside_radiation) {
+          environments.outside.radiation_temperature =
+              (*outside_radiation)[step];
+        }
+        environments.outside.air_speed = wind[step];
+        environments.outside.direct_solar_radiation = solar[step];
+        environments.inside.air_temperature = inside[step];
+        if (inside_radiation) {
+          environments.inside.radiation_temperature = (*inside_radiation)[step];
+        }
+        system.environments(environments);
+        u[step] = system.u(theta, phi);
+        shgc[step] = system.shgc(theta, phi);
+        heat_flux[step] =
+            u[step] * (outside[step] - inside[step]) + shgc[step] * solar[step];
+        layer_temperatures[step] = system.layer_temperatures(
+            Tarcog::ISO15099::System::SHGC, theta, phi);
+      }
+    } catch (...) {
+      system.environments(original_environments);
+      throw;
+    }
+    system.environments(original_environments);
+    elapsed_seconds = std::chrono::duration<double>(
+                          std::chrono::steady_clock::now() - start)
+                          .count();
+  }
+
+  py::dict results;
+  results["u"] = py::array_t<double>(steps, u.data());
+  results["shgc"] = py::array_t<double>(steps, shgc.data());
+  results["heat_flux"] = py::array_t<double>(steps, heat_flux.data());
+  results["layer_temperatures"] = matrix_to_array(layer_temperatures);
+  results["steps"] = steps;
+  results["wall_time_seconds"] = elapsed_seconds;
+  return results;
+}
+
+double const *wavelength_column(Series_Array const &column,
+                                py::ssize_t wavelength_count,
+                                std::string const &name) {
+  if (column.ndim() != 1 || column.size() != wavelength_count) {
+    throw std::invalid_argument(
+        name + " must be a 1D array with one value per wavelength.");
+  }
+  return column.data();
+}
+
+// Build n-band wavelength data from one array per measured value.  The
+// diffuse columns must be given all together or not at all and so must the
+// PV EQE columns.
+std::vector<OpticsParser::WLData> wavelength_data_from_arrays(
+    Series_Array const &wavelengths, Series_Array const &transmittance_front,
+    Series_Array const &transmittance_back,
+    Series_Array const &reflectance_front,
+    Series_Array const &reflectance_back,
+    std::optional<Series_Array> const &diffuse_transmittance_front,
+    std::optional<Series_Array> const &diffuse_transmittance_back,
+    std::optional<Series_Array> const &diffuse_reflectance_front,
+    std::optional<Series_Array> const &diffuse_reflectance_back,
+    std::optional<Series_Array> const &eqe_front,
+    std::optional<Series_Array> const &eqe_back) {
+  if (wavelengths.ndim() != 1) {
+    throw std::invalid_argument("wavelengths must be a 1D array.");
+  }
+  auto const count = wavelengths.size();
+  auto const *wl = wavelengths.data();
+  auto const *tf =
+      wavelength_column(transmittance_front, count, "transmittance_front");
+  auto const *tb =
+      wavelength_column(transmittance_back, count, "transmittance_back");
+  auto const *rf =
+      wavelength_column(reflectance_front, count, "reflectance_front");
+  auto const *rb =
+      wavelength_column(reflectance_back, count, "reflectance_back");
+
+  auto const diffuse_columns =
+      diffuse_transmittance_front.has_value() +
+      diffuse_transmittance_back.has_value() +
+      diffuse_reflectance_front.has_value() +
+      diffuse_reflectance_back.has_value();
+  if (diffuse_columns != 0 && diffuse_columns != 4) {
+    throw std::invalid_argument(
+        "Either all or none of the diffuse columns must be given.");
+  }
+  if (eqe_front.has_value() != eqe_back.has_value()) {
+    throw std::invalid_argument(
+        "Either both or neither of eqe_front and eqe_back must be given.");
+  }
+  double const *diffuse_tf = nullptr;
+  double const *diffuse_tb = nullptr;
+  double const *diffuse_rf = nullptr;
+  double const *diffuse_rb = nullptr;
+  if (diffuse_columns == 4) {
+    diffuse_tf = wavelength_column(*diffuse_transmittance_front, count,
+                                   "diffuse_transmittance_front");
+    diffuse_tb = wavelength_column(*diffuse_transmittance_back, count,
+                                   "diffuse_transmittance_back");
+    diffuse_rf = wavelength_column(*diffuse_reflectance_front, count,
+                                   "diffuse_reflectance_front");
+    diffuse_rb = wavelength_column(*diffuse_reflectance_back, count,
+                                   "diffuse_reflectance_back");
+  }
+  double const *eqef = nullptr;
+  double const *eqeb = nullptr;
+  if (eqe_front.has_value()) {
+    eqef = wavelength_column(*eqe_front, count, "eqe_front");
+    eqeb = wavelength_column(*eqe_back, count, "eqe_back");
+  }
+
+  std::vector<OpticsParser::WLData> result;
+  result.reserve(count);
+  for (py::ssize_t i = 0; i < count; ++i) {
+    std::optional<OpticsParser::MeasurementComponent> diffuse;
+    if (diffuse_tf != nullptr) {
+      diffuse = OpticsParser::MeasurementComponent(
+          diffuse_tf[i], diffuse_tb[i], diffuse_rf[i], diffuse_rb[i]);
+    }
+    result.emplace_back(
+        wl[i], OpticsParser::MeasurementComponent(tf[i], tb[i], rf[i], rb[i]),
+        diffuse);
+    if (eqef != nullptr) {
+      result.back().pvComponent =
+          OpticsParser::PVWavelengthData(eqef[i], eqeb[i]);
+    }
+  }
+  return result;
+}
+
+template <typename Value>
+py::array_t<double>
+wavelength_data_column(std::vector<OpticsParser::WLData> const &data,
+                       Value value) {
+  py::array_t<double> result(static_cast<py::ssize_t>(data.size()));
+  auto *out = result.mutable_data();
+  for (auto const &row : data) {
+    *out++ = value(row);
+  }
+  return result;
+}
+
+// The reverse of wavelength_data_from_arrays.  The keys are the names of the
+// arguments of wavelength_data_from_arrays.  Diffuse and PV EQE columns are
+// only included if every wavelength has them.
+py::dict
+wavelength_data_to_arrays(std::vector<OpticsParser::WLData> const &data) {
+  using WLData = OpticsParser::WLData;
+  py::dict result;
+  result["wavelengths"] = wavelength_data_column(
+      data, [](WLData const &row) { return row.wavelength; });
+  result["transmittance_front"] = wavelength_data_column(
+      data, [](WLData const &row) { return row.directComponent.tf; });
+  result["transmittance_back"] = wavelength_data_column(
+      data, [](WLData const &row) { return row.directComponent.tb; });
+  result["reflectance_front"] = wavelength_data_column(
+      data, [](WLData const &row) { return row.directComponent.rf; });
+  result["reflectance_back"] = wavelength_data_column(
+      data, [](WLData const &row) { return row.directComponent.rb; });
+
+  auto const has_diffuse =
+      !data.empty() &&
+      std::all_of(data.begin(), data.end(), [](WLData const &row) {
+        return row.diffuseComponent.has_value();
+      });
+  if (has_diffuse) {
+    result["diffuse_transmittance_front"] = wavelength_data_column(
+        data, [](WLData const &row) { return row.diffuseComponent->tf; });
+    result["diffuse_transmittance_back"] = wavelength_data_column(
+        data, [](WLData const &row) { return row.diffuseComponent->tb; });
+    result["diffuse_reflectance_front"] = wavelength_data_column(
+        data, [](WLData const &row) { return row.diffuseComponent->rf; });
+    result["diffuse_reflectance_back"] = wavelength_data_column(
+        data, [](WLData const &row) { return row.diffuseComponent->rb; });
+  }
+
+  auto const has_pv =
+      !data.empty() &&
+      std::all_of(data.begin(), data.end(), [](WLData const &row) {
+        return row.pvComponent.has_value();
+      });
+  if (has_pv) {
+    result["eqe_front"] = wavelength_data_column(
+        data, [](WLData const &row) { return row.pvComponent->eqef; });
+    result["eqe_back"] = wavelength_data_column(
+        data, [](WLData const &row) { return row.pvComponent->eqeb; });
+  }
+  return result;
+}
+
 PYBIND11_MODULE(wincalcbindings, m) {
   m.doc() = "Python bindings for WinCalc";
 
@@ -212,7 +1302,11 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("height", &Tarcog::ISO15099::PillarData::height)
       .def_readwrite("material_conductivity",
                      &Tarcog::ISO15099::PillarData::materialConductivity)
-      .def_readwrite("cell_area", &Tarcog::ISO15099::PillarData::cellArea);
+      .def_readwrite("cell_area", &Tarcog::ISO15099::PillarData::cellArea)
+      .def(pickle_constructor_members<Tarcog::ISO15099::PillarData>(
+          &Tarcog::ISO15099::PillarData::height,
+          &Tarcog::ISO15099::PillarData::materialConductivity,
+          &Tarcog::ISO15099::PillarData::cellArea));
 
   py::class_<Tarcog::ISO15099::CylindricalPillar, Tarcog::ISO15099::PillarData,
              std::shared_ptr<Tarcog::ISO15099::CylindricalPillar>>(
@@ -220,7 +1314,12 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def(py::init<double, double, double, double>(), py::arg("height"),
            py::arg("material_conductivity"), py::arg("cell_area"),
            py::arg("radius"))
-      .def_readwrite("radius", &Tarcog::ISO15099::CylindricalPillar::radius);
+      .def_readwrite("radius", &Tarcog::ISO15099::CylindricalPillar::radius)
+      .def(pickle_constructor_members<Tarcog::ISO15099::CylindricalPillar>(
+          &Tarcog::ISO15099::CylindricalPillar::height,
+          &Tarcog::ISO15099::CylindricalPillar::materialConductivity,
+          &Tarcog::ISO15099::CylindricalPillar::cellArea,
+          &Tarcog::ISO15099::CylindricalPillar::radius));
 
   py::class_<Tarcog::ISO15099::CylindricalPillarLayer,
              Tarcog::ISO15099::UniversalSupportPillar,
@@ -237,7 +1336,12 @@ PYBIND11_MODULE(wincalcbindings, m) {
            py::arg("material_conductivity"), py::arg("cell_area"),
            py::arg("radius_of_contact"))
       .def_readwrite("radius_of_contact",
-                     &Tarcog::ISO15099::SphericalPillar::radiusOfContact);
+                     &Tarcog::ISO15099::SphericalPillar::radiusOfContact)
+      .def(pickle_constructor_members<Tarcog::ISO15099::SphericalPillar>(
+          &Tarcog::ISO15099::SphericalPillar::height,
+          &Tarcog::ISO15099::SphericalPillar::materialConductivity,
+          &Tarcog::ISO15099::SphericalPillar::cellArea,
+          &Tarcog::ISO15099::SphericalPillar::radiusOfContact));
 
   py::class_<Tarcog::ISO15099::SphericalPillarLayer,
              Tarcog::ISO15099::UniversalSupportPillar,
@@ -254,7 +1358,13 @@ PYBIND11_MODULE(wincalcbindings, m) {
            py::arg("height"), py::arg("material_conductivity"),
            py::arg("cell_area"), py::arg("length"), py::arg("width"))
       .def_readwrite("length", &Tarcog::ISO15099::RectangularPillar::length)
-      .def_readwrite("width", &Tarcog::ISO15099::RectangularPillar::width);
+      .def_readwrite("width", &Tarcog::ISO15099::RectangularPillar::width)
+      .def(pickle_constructor_members<Tarcog::ISO15099::RectangularPillar>(
+          &Tarcog::ISO15099::RectangularPillar::height,
+          &Tarcog::ISO15099::RectangularPillar::materialConductivity,
+          &Tarcog::ISO15099::RectangularPillar::cellArea,
+          &Tarcog::ISO15099::RectangularPillar::length,
+          &Tarcog::ISO15099::RectangularPillar::width));
 
   py::class_<Tarcog::ISO15099::RectangularPillarLayer,
              Tarcog::ISO15099::UniversalSupportPillar,
@@ -269,14 +1379,24 @@ PYBIND11_MODULE(wincalcbindings, m) {
              std::shared_ptr<Tarcog::ISO15099::PolygonalPillar>>(m, "PolygonalPillar")
       .def(py::init<double, double, double, double>(), py::arg("height"),
            py::arg("material_conductivity"), py::arg("cell_area"), py::arg("length"))
-	  .def_readwrite("legnth", &Tarcog::ISO15099::PolygonalPillar::length);
+	  .def_readwrite("legnth", &Tarcog::ISO15099::PolygonalPillar::length)
+      .def(pickle_constructor_members<Tarcog::ISO15099::PolygonalPillar>(
+          &Tarcog::ISO15099::PolygonalPillar::height,
+          &Tarcog::ISO15099::PolygonalPillar::materialConductivity,
+          &Tarcog::ISO15099::PolygonalPillar::cellArea,
+          &Tarcog::ISO15099::PolygonalPillar::length));
 	  
   py::class_<Tarcog::ISO15099::TriangularPillar,
              Tarcog::ISO15099::PolygonalPillar, 
              Tarcog::ISO15099::PillarData,
              std::shared_ptr<Tarcog::ISO15099::TriangularPillar>>(m, "TriangularPillar")
       .def(py::init<double, double, double, double>(), py::arg("height"),
-           py::arg("material_conductivity"), py::arg("cell_area"), py::arg("length"));
+           py::arg("material_conductivity"), py::arg("cell_area"), py::arg("length"))
+      .def(pickle_constructor_members<Tarcog::ISO15099::TriangularPillar>(
+          &Tarcog::ISO15099::TriangularPillar::height,
+          &Tarcog::ISO15099::TriangularPillar::materialConductivity,
+          &Tarcog::ISO15099::TriangularPillar::cellArea,
+          &Tarcog::ISO15099::TriangularPillar::length));
 
   py::class_<Tarcog::ISO15099::TriangularPillarLayer,
              Tarcog::ISO15099::UniversalSupportPillar,
@@ -291,7 +1411,12 @@ PYBIND11_MODULE(wincalcbindings, m) {
              Tarcog::ISO15099::PillarData,
              std::shared_ptr<Tarcog::ISO15099::PentagonPillar>>(m, "PentagonPillar")
       .def(py::init<double, double, double, double>(), py::arg("height"),
-           py::arg("material_conductivity"), py::arg("cell_area"), py::arg("length"));		   
+           py::arg("material_conductivity"), py::arg("cell_area"), py::arg("length"))
+      .def(pickle_constructor_members<Tarcog::ISO15099::PentagonPillar>(
+          &Tarcog::ISO15099::PentagonPillar::height,
+          &Tarcog::ISO15099::PentagonPillar::materialConductivity,
+          &Tarcog::ISO15099::PentagonPillar::cellArea,
+          &Tarcog::ISO15099::PentagonPillar::length));		   
 
   py::class_<Tarcog::ISO15099::PentagonPillarLayer,
              Tarcog::ISO15099::UniversalSupportPillar,
@@ -306,7 +1431,12 @@ PYBIND11_MODULE(wincalcbindings, m) {
              Tarcog::ISO15099::PillarData,
              std::shared_ptr<Tarcog::ISO15099::HexagonPillar>>(m, "HexagonPillar")
       .def(py::init<double, double, double, double>(), py::arg("height"),
-           py::arg("material_conductivity"), py::arg("cell_area"), py::arg("length"));
+           py::arg("material_conductivity"), py::arg("cell_area"), py::arg("length"))
+      .def(pickle_constructor_members<Tarcog::ISO15099::HexagonPillar>(
+          &Tarcog::ISO15099::HexagonPillar::height,
+          &Tarcog::ISO15099::HexagonPillar::materialConductivity,
+          &Tarcog::ISO15099::HexagonPillar::cellArea,
+          &Tarcog::ISO15099::HexagonPillar::length));
 
   py::class_<Tarcog::ISO15099::HexagonPillarLayer,
              Tarcog::ISO15099::UniversalSupportPillar,
@@ -324,7 +1454,13 @@ PYBIND11_MODULE(wincalcbindings, m) {
            py::arg("height"), py::arg("material_conductivity"),
            py::arg("cell_area"), py::arg("length"), py::arg("width"))
       .def_readwrite("length", &Tarcog::ISO15099::LinearBearingPillar::length)
-      .def_readwrite("width", &Tarcog::ISO15099::LinearBearingPillar::width);
+      .def_readwrite("width", &Tarcog::ISO15099::LinearBearingPillar::width)
+      .def(pickle_constructor_members<Tarcog::ISO15099::LinearBearingPillar>(
+          &Tarcog::ISO15099::LinearBearingPillar::height,
+          &Tarcog::ISO15099::LinearBearingPillar::materialConductivity,
+          &Tarcog::ISO15099::LinearBearingPillar::cellArea,
+          &Tarcog::ISO15099::LinearBearingPillar::length,
+          &Tarcog::ISO15099::LinearBearingPillar::width));
 
   py::class_<Tarcog::ISO15099::LinearBearingPillarLayer,
              Tarcog::ISO15099::UniversalSupportPillar,
@@ -344,7 +1480,13 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("radius_1",
                      &Tarcog::ISO15099::TruncatedConePillar::radius1)
       .def_readwrite("radius_2",
-                     &Tarcog::ISO15099::TruncatedConePillar::radius2);
+                     &Tarcog::ISO15099::TruncatedConePillar::radius2)
+      .def(pickle_constructor_members<Tarcog::ISO15099::TruncatedConePillar>(
+          &Tarcog::ISO15099::TruncatedConePillar::height,
+          &Tarcog::ISO15099::TruncatedConePillar::materialConductivity,
+          &Tarcog::ISO15099::TruncatedConePillar::cellArea,
+          &Tarcog::ISO15099::TruncatedConePillar::radius1,
+          &Tarcog::ISO15099::TruncatedConePillar::radius2));
 
   py::class_<Tarcog::ISO15099::TruncatedConePillarLayer,
              Tarcog::ISO15099::UniversalSupportPillar,
@@ -365,7 +1507,13 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("inner_radius",
                      &Tarcog::ISO15099::AnnulusCylinderPillar::innerRadius)
       .def_readwrite("outer_radius",
-                     &Tarcog::ISO15099::AnnulusCylinderPillar::outerRadius);
+                     &Tarcog::ISO15099::AnnulusCylinderPillar::outerRadius)
+      .def(pickle_constructor_members<Tarcog::ISO15099::AnnulusCylinderPillar>(
+          &Tarcog::ISO15099::AnnulusCylinderPillar::height,
+          &Tarcog::ISO15099::AnnulusCylinderPillar::materialConductivity,
+          &Tarcog::ISO15099::AnnulusCylinderPillar::cellArea,
+          &Tarcog::ISO15099::AnnulusCylinderPillar::innerRadius,
+          &Tarcog::ISO15099::AnnulusCylinderPillar::outerRadius));
 
   py::class_<Tarcog::ISO15099::AnnulusCylinderPillarLayer,
              Tarcog::ISO15099::UniversalSupportPillar,
@@ -388,7 +1536,14 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("outer_radius",
                      &Tarcog::ISO15099::CShapedCylinderPillar::outerRadius)
 	  .def_readwrite("fraction_covered",
-                     &Tarcog::ISO15099::CShapedCylinderPillar::fractionCovered);
+                     &Tarcog::ISO15099::CShapedCylinderPillar::fractionCovered)
+      .def(pickle_constructor_members<Tarcog::ISO15099::CShapedCylinderPillar>(
+          &Tarcog::ISO15099::CShapedCylinderPillar::height,
+          &Tarcog::ISO15099::CShapedCylinderPillar::materialConductivity,
+          &Tarcog::ISO15099::CShapedCylinderPillar::cellArea,
+          &Tarcog::ISO15099::CShapedCylinderPillar::innerRadius,
+          &Tarcog::ISO15099::CShapedCylinderPillar::outerRadius,
+          &Tarcog::ISO15099::CShapedCylinderPillar::fractionCovered));
 					 
   py::class_<Tarcog::ISO15099::CShapedCylinderPillarLayer,
              Tarcog::ISO15099::UniversalSupportPillar,
@@ -404,7 +1559,11 @@ PYBIND11_MODULE(wincalcbindings, m) {
            py::arg("conductivity"), py::arg("emissivity"))
       .def_readwrite("thickness", &Tarcog::ISO15099::Glass::thickness)
       .def_readwrite("conductivity", &Tarcog::ISO15099::Glass::conductivity)
-      .def_readwrite("emissivity", &Tarcog::ISO15099::Glass::emissivity);
+      .def_readwrite("emissivity", &Tarcog::ISO15099::Glass::emissivity)
+      .def(pickle_constructor_members<Tarcog::ISO15099::Glass>(
+          &Tarcog::ISO15099::Glass::thickness,
+          &Tarcog::ISO15099::Glass::conductivity,
+          &Tarcog::ISO15099::Glass::emissivity));
 
   py::class_<Tarcog::ISO15099::PillarMeasurement,
              std::shared_ptr<Tarcog::ISO15099::PillarMeasurement>>(
@@ -423,7 +1582,14 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("temperature_surface_4",
                      &Tarcog::ISO15099::PillarMeasurement::temperatureSurface4)
       .def_readwrite("glass_1", &Tarcog::ISO15099::PillarMeasurement::glass1)
-      .def_readwrite("glass_2", &Tarcog::ISO15099::PillarMeasurement::glass2);
+      .def_readwrite("glass_2", &Tarcog::ISO15099::PillarMeasurement::glass2)
+      .def(pickle_constructor_members<Tarcog::ISO15099::PillarMeasurement>(
+          &Tarcog::ISO15099::PillarMeasurement::totalThickness,
+          &Tarcog::ISO15099::PillarMeasurement::conductivity,
+          &Tarcog::ISO15099::PillarMeasurement::temperatureSurface1,
+          &Tarcog::ISO15099::PillarMeasurement::temperatureSurface4,
+          &Tarcog::ISO15099::PillarMeasurement::glass1,
+          &Tarcog::ISO15099::PillarMeasurement::glass2));
 
   py::class_<Tarcog::ISO15099::MeasuredPillarLayer,
              Tarcog::ISO15099::CIGUGapLayer,
@@ -486,13 +1652,21 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("reflectance_front",
                      &OpticsParser::MeasurementComponent::rf)
       .def_readwrite("reflectance_back",
-                     &OpticsParser::MeasurementComponent::rb);
+                     &OpticsParser::MeasurementComponent::rb)
+      .def(pickle_constructor_members<OpticsParser::MeasurementComponent>(
+          &OpticsParser::MeasurementComponent::tf,
+          &OpticsParser::MeasurementComponent::tb,
+          &OpticsParser::MeasurementComponent::rf,
+          &OpticsParser::MeasurementComponent::rb));
 
   py::class_<OpticsParser::PVWavelengthData>(m, "PVWavelengthData")
       .def(py::init<double, double>(), py::arg("eqe_front"),
            py::arg("eqe_back"))
       .def_readwrite("eqq_front", &OpticsParser::PVWavelengthData::eqef)
-      .def_readwrite("eqe_back", &OpticsParser::PVWavelengthData::eqeb);
+      .def_readwrite("eqe_back", &OpticsParser::PVWavelengthData::eqeb)
+      .def(pickle_constructor_members<OpticsParser::PVWavelengthData>(
+          &OpticsParser::PVWavelengthData::eqef,
+          &OpticsParser::PVWavelengthData::eqeb));
 
   py::class_<OpticsParser::WLData>(m, "WavelengthData")
       .def(py::init<double, OpticsParser::MeasurementComponent,
@@ -518,7 +1692,40 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("direct_component", &OpticsParser::WLData::directComponent)
       .def_readwrite("diffuse_component",
                      &OpticsParser::WLData::diffuseComponent)
-      .def_readwrite("pv_component", &OpticsParser::WLData::pvComponent);
+      .def_readwrite("pv_component", &OpticsParser::WLData::pvComponent)
+      .def(py::pickle(
+          [](OpticsParser::WLData const &self) {
+            return py::make_tuple(self.wavelength, self.directComponent,
+                                  self.diffuseComponent, self.pvComponent);
+          },
+          [](py::tuple const &state) {
+            check_pickle_state(state, 4);
+            OpticsParser::WLData result(
+                state[0].cast<double>(),
+                state[1].cast<OpticsParser::MeasurementComponent>(),
+                state[2].cast<
+                    std::optional<OpticsParser::MeasurementComponent>>());
+            result.pvComponent =
+                state[3].cast<decltype(OpticsParser::WLData::pvComponent)>();
+            return result;
+          }));
+
+  m.def("wavelength_data_from_arrays", &wavelength_data_from_arrays,
+        "Create a list of WavelengthData from 1D arrays with one value per "
+        "wavelength.  Wavelengths are in microns.",
+        py::arg("wavelengths"), py::arg("transmittance_front"),
+        py::arg("transmittance_back"), py::arg("reflectance_front"),
+        py::arg("reflectance_back"),
+        py::arg("diffuse_transmittance_front") = py::none(),
+        py::arg("diffuse_transmittance_back") = py::none(),
+        py::arg("diffuse_reflectance_front") = py::none(),
+        py::arg("diffuse_reflectance_back") = py::none(),
+        py::arg("eqe_front") = py::none(), py::arg("eqe_back") = py::none());
+
+  m.def("wavelength_data_to_arrays", &wavelength_data_to_arrays,
+        "Convert a list of WavelengthData, e.g. the measurements of a parsed "
+        "optics file, to a dict of 1D arrays.",
+        py::arg("wavelength_data"));
 
   py::class_<OpticsParser::ProductGeometry,
              std::shared_ptr<OpticsParser::ProductGeometry>>(m,
@@ -538,7 +1745,14 @@ PYBIND11_MODULE(wincalcbindings, m) {
                      &OpticsParser::VenetianGeometry::slatCurvature)
       .def_readwrite("slat_tilt", &OpticsParser::VenetianGeometry::slatTilt)
       .def_readwrite("number_segments",
-                     &OpticsParser::VenetianGeometry::numberSegments);
+                     &OpticsParser::VenetianGeometry::numberSegments)
+      .def(pickle_constructor_members<OpticsParser::VenetianGeometry>(
+          &OpticsParser::VenetianGeometry::slatWidth,
+          &OpticsParser::VenetianGeometry::slatSpacing,
+          &OpticsParser::VenetianGeometry::slatCurvature,
+          &OpticsParser::VenetianGeometry::slatTilt,
+          &OpticsParser::VenetianGeometry::tiltChoice,
+          &OpticsParser::VenetianGeometry::numberSegments));
 
   py::class_<OpticsParser::WovenGeometry, OpticsParser::ProductGeometry,
              std::shared_ptr<OpticsParser::WovenGeometry>>(
@@ -549,7 +1763,11 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("thread_spacing",
                      &OpticsParser::WovenGeometry::threadSpacing)
       .def_readwrite("shade_thickness",
-                     &OpticsParser::WovenGeometry::shadeThickness);
+                     &OpticsParser::WovenGeometry::shadeThickness)
+      .def(pickle_constructor_members<OpticsParser::WovenGeometry>(
+          &OpticsParser::WovenGeometry::threadDiameter,
+          &OpticsParser::WovenGeometry::threadSpacing,
+          &OpticsParser::WovenGeometry::shadeThickness));
 
   py::class_<OpticsParser::PerforatedGeometry, OpticsParser::ProductGeometry,
              std::shared_ptr<OpticsParser::PerforatedGeometry>>(
@@ -565,34 +1783,67 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("dimension_y",
                      &OpticsParser::PerforatedGeometry::dimensionY)
       .def_readwrite("perforation_type",
-                     &OpticsParser::PerforatedGeometry::perforationType);
+                     &OpticsParser::PerforatedGeometry::perforationType)
+      .def(pickle_constructor_members<OpticsParser::PerforatedGeometry>(
+          &OpticsParser::PerforatedGeometry::spacingX,
+          &OpticsParser::PerforatedGeometry::spacingY,
+          &OpticsParser::PerforatedGeometry::dimensionX,
+          &OpticsParser::PerforatedGeometry::dimensionY,
+          &OpticsParser::PerforatedGeometry::perforationType));
 
   py::class_<OpticsParser::BSDF>(m, "BSDF")
+      .def(py::init<>())
       .def_readwrite("data", &OpticsParser::BSDF::data)
+      .def_property(
+          "data_array",
+          [](OpticsParser::BSDF const &self) {
+            return matrix_to_array(self.data);
+          },
+          [](OpticsParser::BSDF &self, Matrix_Array const &data) {
+            self.data = array_to_matrix(data);
+          },
+          "The BSDF data as a 2D numpy array.")
       .def_readwrite("row_angle_basis_name",
                      &OpticsParser::BSDF::rowAngleBasisName)
       .def_readwrite("column_angle_basis_name",
-                     &OpticsParser::BSDF::columnAngleBasisName);
+                     &OpticsParser::BSDF::columnAngleBasisName)
+      .def(pickle_members<OpticsParser::BSDF>(
+          &OpticsParser::BSDF::data, &OpticsParser::BSDF::rowAngleBasisName,
+          &OpticsParser::BSDF::columnAngleBasisName));
 
   py::class_<OpticsParser::WavelengthBSDFs>(m, "WavelengthBSDFs")
+      .def(py::init<>())
       .def_readwrite("transmittance_front", &OpticsParser::WavelengthBSDFs::tf)
       .def_readwrite("transmittance_back", &OpticsParser::WavelengthBSDFs::tb)
       .def_readwrite("reflectance_front", &OpticsParser::WavelengthBSDFs::rf)
-      .def_readwrite("reflectance_back", &OpticsParser::WavelengthBSDFs::rb);
+      .def_readwrite("reflectance_back", &OpticsParser::WavelengthBSDFs::rb)
+      .def(pickle_members<OpticsParser::WavelengthBSDFs>(
+          &OpticsParser::WavelengthBSDFs::tf, &OpticsParser::WavelengthBSDFs::tb,
+          &OpticsParser::WavelengthBSDFs::rf,
+          &OpticsParser::WavelengthBSDFs::rb));
 
   py::class_<OpticsParser::DualBandBSDF>(m, "DualBandBSDF")
+      .def(py::init<>())
       .def_readwrite("solar", &OpticsParser::DualBandBSDF::solar)
-      .def_readwrite("visible", &OpticsParser::DualBandBSDF::visible);
+      .def_readwrite("visible", &OpticsParser::DualBandBSDF::visible)
+      .def(pickle_members<OpticsParser::DualBandBSDF>(
+          &OpticsParser::DualBandBSDF::solar,
+          &OpticsParser::DualBandBSDF::visible));
 
   py::class_<OpticsParser::PVPowerProperty>(m, "PVPowerProperty")
       .def(py::init<double, double, double>(), py::arg("jsc"), py::arg("voc"),
            py::arg("ff"))
       .def_readwrite("jsc", &OpticsParser::PVPowerProperty::jsc)
       .def_readwrite("voc", &OpticsParser::PVPowerProperty::voc)
-      .def_readwrite("ff", &OpticsParser::PVPowerProperty::ff);
+      .def_readwrite("ff", &OpticsParser::PVPowerProperty::ff)
+      .def(pickle_constructor_members<OpticsParser::PVPowerProperty>(
+          &OpticsParser::PVPowerProperty::jsc,
+          &OpticsParser::PVPowerProperty::voc,
+          &OpticsParser::PVPowerProperty::ff));
 
   py::class_<OpticsParser::ProductData,
              std::shared_ptr<OpticsParser::ProductData>>(m, "ProductData")
+      .def(py::init<>())
       .def_readwrite("product_name", &OpticsParser::ProductData::productName)
       .def_readwrite("product_type", &OpticsParser::ProductData::productType)
       .def_readwrite("product_subtype",
@@ -616,7 +1867,8 @@ PYBIND11_MODULE(wincalcbindings, m) {
                      &OpticsParser::ProductData::youngsModulus)
       .def_readwrite("pv_power_properties",
                      &OpticsParser::ProductData::pvPowerProperties)
-      .def_readwrite("composition", &OpticsParser::ProductData::composition);
+      .def_readwrite("composition", &OpticsParser::ProductData::composition)
+      .def(pickle_packed<OpticsParser::ProductData>());
 
   py::class_<OpticsParser::CompositionInformation,
              std::shared_ptr<OpticsParser::CompositionInformation>>(
@@ -627,7 +1879,10 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("material",
                      &OpticsParser::CompositionInformation::material)
       .def_readwrite("geometry",
-                     &OpticsParser::CompositionInformation::geometry);
+                     &OpticsParser::CompositionInformation::geometry)
+      .def(pickle_constructor_members<OpticsParser::CompositionInformation>(
+          &OpticsParser::CompositionInformation::material,
+          &OpticsParser::CompositionInformation::geometry));
 
   py::enum_<window_standards::Spectrum_Type>(m, "SpectrumType",
                                              py::arithmetic())
@@ -643,7 +1898,12 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("t", &window_standards::Spectrum::t)
       .def_readwrite("a", &window_standards::Spectrum::a)
       .def_readwrite("b", &window_standards::Spectrum::b)
-      .def_readwrite("values", &window_standards::Spectrum::values);
+      .def_readwrite("values", &window_standards::Spectrum::values)
+      .def(pickle_members<window_standards::Spectrum>(
+          &window_standards::Spectrum::type,
+          &window_standards::Spectrum::description,
+          &window_standards::Spectrum::t, &window_standards::Spectrum::a,
+          &window_standards::Spectrum::b, &window_standards::Spectrum::values));
 
   py::enum_<window_standards::Wavelength_Set_Type>(m, "WavelengthSetType",
                                                    py::arithmetic())
@@ -655,7 +1915,11 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("type", &window_standards::Wavelength_Set::type)
       .def_readwrite("description",
                      &window_standards::Wavelength_Set::description)
-      .def_readwrite("values", &window_standards::Wavelength_Set::values);
+      .def_readwrite("values", &window_standards::Wavelength_Set::values)
+      .def(pickle_members<window_standards::Wavelength_Set>(
+          &window_standards::Wavelength_Set::type,
+          &window_standards::Wavelength_Set::description,
+          &window_standards::Wavelength_Set::values));
 
   py::enum_<window_standards::Wavelength_Boundary_Type>(
       m, "WavelengthBoundaryType", py::arithmetic())
@@ -665,7 +1929,10 @@ PYBIND11_MODULE(wincalcbindings, m) {
 
   py::class_<window_standards::Wavelength_Boundary>(m, "WavelengthBoundary")
       .def_readwrite("type", &window_standards::Wavelength_Boundary::type)
-      .def_readwrite("value", &window_standards::Wavelength_Boundary::value);
+      .def_readwrite("value", &window_standards::Wavelength_Boundary::value)
+      .def(pickle_members<window_standards::Wavelength_Boundary>(
+          &window_standards::Wavelength_Boundary::type,
+          &window_standards::Wavelength_Boundary::value));
 
   py::enum_<window_standards::Integration_Rule_Type>(m, "IntegrationRuleType",
                                                      py::arithmetic())
@@ -677,7 +1944,10 @@ PYBIND11_MODULE(wincalcbindings, m) {
 
   py::class_<window_standards::Integration_Rule>(m, "IntegrationRule")
       .def_readwrite("type", &window_standards::Integration_Rule::type)
-      .def_readwrite("k", &window_standards::Integration_Rule::k);
+      .def_readwrite("k", &window_standards::Integration_Rule::k)
+      .def(pickle_members<window_standards::Integration_Rule>(
+          &window_standards::Integration_Rule::type,
+          &window_standards::Integration_Rule::k));
 
   py::class_<window_standards::Optical_Standard_Method>(m,
                                                         "OpticalStandardMethod")
@@ -699,14 +1969,28 @@ PYBIND11_MODULE(wincalcbindings, m) {
                      &window_standards::Optical_Standard_Method::min_wavelength)
       .def_readwrite(
           "max_wavelength",
-          &window_standards::Optical_Standard_Method::max_wavelength);
+          &window_standards::Optical_Standard_Method::max_wavelength)
+      .def(pickle_members<window_standards::Optical_Standard_Method>(
+          &window_standards::Optical_Standard_Method::name,
+          &window_standards::Optical_Standard_Method::description,
+          &window_standards::Optical_Standard_Method::source_spectrum,
+          &window_standards::Optical_Standard_Method::detector_spectrum,
+          &window_standards::Optical_Standard_Method::wavelength_set,
+          &window_standards::Optical_Standard_Method::integration_rule,
+          &window_standards::Optical_Standard_Method::min_wavelength,
+          &window_standards::Optical_Standard_Method::max_wavelength));
 
   py::class_<window_standards::Optical_Standard>(m, "OpticalStandard")
       .def_readwrite("name", &window_standards::Optical_Standard::name)
       .def_readwrite("description",
                      &window_standards::Optical_Standard::description)
       .def_readwrite("file", &window_standards::Optical_Standard::file)
-      .def_readwrite("methods", &window_standards::Optical_Standard::methods);
+      .def_readwrite("methods", &window_standards::Optical_Standard::methods)
+      .def(pickle_members<window_standards::Optical_Standard>(
+          &window_standards::Optical_Standard::name,
+          &window_standards::Optical_Standard::description,
+          &window_standards::Optical_Standard::file,
+          &window_standards::Optical_Standard::methods));
 
   py::class_<wincalc::Trichromatic>(m, "Trichromatic")
       .def_readwrite("X", &wincalc::Trichromatic::X)
@@ -770,13 +2054,24 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("air_speed", &wincalc::Environment::air_speed)
       .def_readwrite("air_direction", &wincalc::Environment::air_direction)
       .def_readwrite("direct_solar_radiation",
-                     &wincalc::Environment::direct_solar_radiation);
+                     &wincalc::Environment::direct_solar_radiation)
+      .def(pickle_constructor_members<wincalc::Environment>(
+          &wincalc::Environment::air_temperature,
+          &wincalc::Environment::pressure,
+          &wincalc::Environment::convection_coefficient,
+          &wincalc::Environment::coefficient_model,
+          &wincalc::Environment::radiation_temperature,
+          &wincalc::Environment::emissivity, &wincalc::Environment::air_speed,
+          &wincalc::Environment::air_direction,
+          &wincalc::Environment::direct_solar_radiation));
 
   py::class_<wincalc::Environments>(m, "Environments")
       .def(py::init<wincalc::Environment, wincalc::Environment>(),
            py::arg("outside"), py::arg("inside"))
       .def_readwrite("outside", &wincalc::Environments::outside)
-      .def_readwrite("inside", &wincalc::Environments::inside);
+      .def_readwrite("inside", &wincalc::Environments::inside)
+      .def(pickle_constructor_members<wincalc::Environments>(
+          &wincalc::Environments::outside, &wincalc::Environments::inside));
 
   m.def("nfrc_u_environments", &wincalc::nfrc_u_environments,
         "Returns the default environments for running a NFRC U-Value "
@@ -824,7 +2119,19 @@ PYBIND11_MODULE(wincalcbindings, m) {
 					 &wincalc::Product_Data_Thermal::permeability_factor)
       .def_readwrite("youngs_modulus",
                      &wincalc::Product_Data_Thermal::youngs_modulus)
-      .def_readwrite("density", &wincalc::Product_Data_Thermal::density);
+      .def_readwrite("density", &wincalc::Product_Data_Thermal::density)
+      .def(pickle_constructor_members<wincalc::Product_Data_Thermal>(
+          &wincalc::Product_Data_Thermal::conductivity,
+          &wincalc::Product_Data_Thermal::thickness_meters,
+          &wincalc::Product_Data_Thermal::flipped,
+          &wincalc::Product_Data_Thermal::opening_top,
+          &wincalc::Product_Data_Thermal::opening_bottom,
+          &wincalc::Product_Data_Thermal::opening_left,
+          &wincalc::Product_Data_Thermal::opening_right,
+          &wincalc::Product_Data_Thermal::effective_front_thermal_openness_area,
+          &wincalc::Product_Data_Thermal::permeability_factor,
+          &wincalc::Product_Data_Thermal::youngs_modulus,
+          &wincalc::Product_Data_Thermal::density));
 
   py::class_<wincalc::Product_Data_Optical, Py_Product_Data_Optical,
              std::shared_ptr<wincalc::Product_Data_Optical>>(
@@ -879,11 +2186,76 @@ PYBIND11_MODULE(wincalcbindings, m) {
            py::arg("emissivity_front") = std::optional<double>(),
            py::arg("emissivity_back") = std::optional<double>(),
            py::arg("flipped") = false)
+      .def_static(
+          "from_arrays",
+          [](FenestrationCommon::MaterialType material_type,
+             double thickness_meters, Series_Array const &wavelengths,
+             Series_Array const &transmittance_front,
+             Series_Array const &transmittance_back,
+             Series_Array const &reflectance_front,
+             Series_Array const &reflectance_back,
+             std::optional<Series_Array> const &diffuse_transmittance_front,
+             std::optional<Series_Array> const &diffuse_transmittance_back,
+             std::optional<Series_Array> const &diffuse_reflectance_front,
+             std::optional<Series_Array> const &diffuse_reflectance_back,
+             std::optional<Series_Array> const &eqe_front,
+             std::optional<Series_Array> const &eqe_back,
+             std::optional<wincalc::CoatedSide> coated_side,
+             std::optional<double> ir_transmittance_front,
+             std::optional<double> ir_transmittance_back,
+             std::optional<double> emissivity_front,
+             std::optional<double> emissivity_back, bool flipped) {
+            return std::make_shared<wincalc::Product_Data_N_Band_Optical>(
+                material_type, thickness_meters,
+                wavelength_data_from_arrays(
+                    wavelengths, transmittance_front, transmittance_back,
+                    reflectance_front, reflectance_back,
+                    diffuse_transmittance_front, diffuse_transmittance_back,
+                    diffuse_reflectance_front, diffuse_reflectance_back,
+                    eqe_front, eqe_back),
+                coated_side, ir_transmittance_front, ir_transmittance_back,
+                emissivity_front, emissivity_back, flipped);
+          },
+          "Create n-band optical data from 1D arrays with one value per "
+          "wavelength instead of a list of WavelengthData.  Wavelengths are in "
+          "microns.",
+          py::arg("material_type"), py::arg("thickness_meters"),
+          py::arg("wavelengths"), py::arg("transmittance_front"),
+          py::arg("transmittance_back"), py::arg("reflectance_front"),
+          py::arg("reflectance_back"),
+          py::arg("diffuse_transmittance_front") = py::none(),
+          py::arg("diffuse_transmittance_back") = py::none(),
+          py::arg("diffuse_reflectance_front") = py::none(),
+          py::arg("diffuse_reflectance_back") = py::none(),
+          py::arg("eqe_front") = py::none(), py::arg("eqe_back") = py::none(),
+          py::arg("coated_side") = std::optional<wincalc::CoatedSide>(),
+          py::arg("ir_transmittance_front") = std::optional<double>(),
+          py::arg("ir_transmittance_back") = std::optional<double>(),
+          py::arg("emissivity_front") = std::optional<double>(),
+          py::arg("emissivity_back") = std::optional<double>(),
+          py::arg("flipped") = false)
+      .def(
+          "to_arrays",
+          [](wincalc::Product_Data_N_Band_Optical const &self) {
+            return wavelength_data_to_arrays(self.wavelength_data);
+          },
+          "Return the wavelength data as a dict of 1D arrays with the same "
+          "names as the arguments of from_arrays.")
       .def("wavelengths", &wincalc::Product_Data_N_Band_Optical::wavelengths)
       .def_readwrite("material_type",
                      &wincalc::Product_Data_N_Band_Optical::material_type)
       .def_readwrite("wavelength_data",
-                     &wincalc::Product_Data_N_Band_Optical::wavelength_data);
+                     &wincalc::Product_Data_N_Band_Optical::wavelength_data)
+      .def(pickle_constructor_members<wincalc::Product_Data_N_Band_Optical>(
+          &wincalc::Product_Data_N_Band_Optical::material_type,
+          &wincalc::Product_Data_N_Band_Optical::thickness_meters,
+          &wincalc::Product_Data_N_Band_Optical::wavelength_data,
+          &wincalc::Product_Data_N_Band_Optical::coated_side,
+          &wincalc::Product_Data_N_Band_Optical::ir_transmittance_front,
+          &wincalc::Product_Data_N_Band_Optical::ir_transmittance_back,
+          &wincalc::Product_Data_N_Band_Optical::emissivity_front,
+          &wincalc::Product_Data_N_Band_Optical::emissivity_back,
+          &wincalc::Product_Data_N_Band_Optical::flipped));
 
   py::class_<wincalc::Product_Data_Dual_Band_Optical,
              wincalc::Product_Data_Optical,
@@ -946,7 +2318,23 @@ PYBIND11_MODULE(wincalcbindings, m) {
           &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::rf_visible)
       .def_readwrite(
           "visible_reflectance_back",
-          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::rb_visible);
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::rb_visible)
+      .def(pickle_constructor_members<
+           wincalc::Product_Data_Dual_Band_Optical_Hemispheric>(
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::tf_solar,
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::tb_solar,
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::rf_solar,
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::rb_solar,
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::tf_visible,
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::tb_visible,
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::rf_visible,
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::rb_visible,
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::thickness_meters,
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::ir_transmittance_front,
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::ir_transmittance_back,
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::emissivity_front,
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::emissivity_back,
+          &wincalc::Product_Data_Dual_Band_Optical_Hemispheric::flipped));
 
   py::class_<wincalc::Product_Data_Dual_Band_Optical_BSDF,
              wincalc::Product_Data_Dual_Band_Optical,
@@ -998,7 +2386,26 @@ PYBIND11_MODULE(wincalcbindings, m) {
 					 &wincalc::Product_Data_Dual_Band_Optical_BSDF::user_defined_effective_values)
       .def("effective_thermal_values",
            &wincalc::Product_Data_Dual_Band_Optical_BSDF::
-               effective_thermal_values);
+               effective_thermal_values)
+      .def(pickle_constructor_members<
+           wincalc::Product_Data_Dual_Band_Optical_BSDF>(
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::tf_solar,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::tb_solar,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::rf_solar,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::rb_solar,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::tf_visible,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::tb_visible,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::rf_visible,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::rb_visible,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::bsdf_hemisphere,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::thickness_meters,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::ir_transmittance_front,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::ir_transmittance_back,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::emissivity_front,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::emissivity_back,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::flipped,
+          &wincalc::Product_Data_Dual_Band_Optical_BSDF::
+              user_defined_effective_values));
 
   py::class_<wincalc::Product_Data_Optical_With_Material,
              wincalc::Product_Data_Optical,
@@ -1041,7 +2448,15 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("distribution_method",
                      &wincalc::Venetian_Geometry::distribution_method)
       .def_readwrite("is_horizontal",
-                     &wincalc::Venetian_Geometry::is_horizontal);
+                     &wincalc::Venetian_Geometry::is_horizontal)
+      .def(pickle_constructor_members<wincalc::Venetian_Geometry>(
+          &wincalc::Venetian_Geometry::slat_tilt,
+          &wincalc::Venetian_Geometry::slat_width,
+          &wincalc::Venetian_Geometry::slat_spacing,
+          &wincalc::Venetian_Geometry::slat_curvature,
+          &wincalc::Venetian_Geometry::is_horizontal,
+          &wincalc::Venetian_Geometry::distribution_method,
+          &wincalc::Venetian_Geometry::number_slat_segments));
 
   py::class_<wincalc::Product_Data_Optical_Venetian,
              wincalc::Product_Data_Optical_With_Material,
@@ -1051,7 +2466,10 @@ PYBIND11_MODULE(wincalcbindings, m) {
                     wincalc::Venetian_Geometry const &>(),
            py::arg("product_data_optical"), py::arg("geometry"))
       .def_readwrite("geometry",
-                     &wincalc::Product_Data_Optical_Venetian::geometry);
+                     &wincalc::Product_Data_Optical_Venetian::geometry)
+      .def(pickle_constructor_members<wincalc::Product_Data_Optical_Venetian>(
+          &wincalc::Product_Data_Optical_Venetian::material_optical_data,
+          &wincalc::Product_Data_Optical_Venetian::geometry));
 
   py::class_<wincalc::Woven_Geometry, std::shared_ptr<wincalc::Woven_Geometry>>(
       m, "WovenGeometry")
@@ -1061,7 +2479,11 @@ PYBIND11_MODULE(wincalcbindings, m) {
                      &wincalc::Woven_Geometry::thread_diameter)
       .def_readwrite("thread_spacing", &wincalc::Woven_Geometry::thread_spacing)
       .def_readwrite("shade_thickness",
-                     &wincalc::Woven_Geometry::shade_thickness);
+                     &wincalc::Woven_Geometry::shade_thickness)
+      .def(pickle_constructor_members<wincalc::Woven_Geometry>(
+          &wincalc::Woven_Geometry::thread_diameter,
+          &wincalc::Woven_Geometry::thread_spacing,
+          &wincalc::Woven_Geometry::shade_thickness));
 
   py::class_<wincalc::Product_Data_Optical_Woven_Shade,
              wincalc::Product_Data_Optical_With_Material,
@@ -1071,7 +2493,10 @@ PYBIND11_MODULE(wincalcbindings, m) {
                     wincalc::Woven_Geometry const &>(),
            py::arg("material_product_data_optical"), py::arg("geometry"))
       .def_readwrite("geometry",
-                     &wincalc::Product_Data_Optical_Woven_Shade::geometry);
+                     &wincalc::Product_Data_Optical_Woven_Shade::geometry)
+      .def(pickle_constructor_members<wincalc::Product_Data_Optical_Woven_Shade>(
+          &wincalc::Product_Data_Optical_Woven_Shade::material_optical_data,
+          &wincalc::Product_Data_Optical_Woven_Shade::geometry));
 
   py::class_<wincalc::Perforated_Geometry,
              std::shared_ptr<wincalc::Perforated_Geometry>>
@@ -1087,7 +2512,13 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("dimension_x", &wincalc::Perforated_Geometry::dimension_x)
       .def_readwrite("dimension_y", &wincalc::Perforated_Geometry::dimension_y)
       .def_readwrite("perforation_type",
-                     &wincalc::Perforated_Geometry::perforation_type);
+                     &wincalc::Perforated_Geometry::perforation_type)
+      .def(pickle_constructor_members<wincalc::Perforated_Geometry>(
+          &wincalc::Perforated_Geometry::spacing_x,
+          &wincalc::Perforated_Geometry::spacing_y,
+          &wincalc::Perforated_Geometry::dimension_x,
+          &wincalc::Perforated_Geometry::dimension_y,
+          &wincalc::Perforated_Geometry::perforation_type));
 
   py::enum_<wincalc::Perforated_Geometry::Type>(perforated_geometry, "Type")
       .value("CIRCULAR", wincalc::Perforated_Geometry::Type::CIRCULAR)
@@ -1103,7 +2534,11 @@ PYBIND11_MODULE(wincalcbindings, m) {
            py::arg("material_product_data_optical"), py::arg("geometry"))
       .def_readwrite(
           "geometry",
-          &wincalc::Product_Data_Optical_Perforated_Screen::geometry);
+          &wincalc::Product_Data_Optical_Perforated_Screen::geometry)
+      .def(pickle_constructor_members<
+           wincalc::Product_Data_Optical_Perforated_Screen>(
+          &wincalc::Product_Data_Optical_Perforated_Screen::material_optical_data,
+          &wincalc::Product_Data_Optical_Perforated_Screen::geometry));
 
   py::class_<wincalc::Product_Data_Optical_Thermal>(
       m, "ProductDataOpticalAndThermal")
@@ -1113,7 +2548,16 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("optical_data",
                      &wincalc::Product_Data_Optical_Thermal::optical_data)
       .def_readwrite("thermal_data",
-                     &wincalc::Product_Data_Optical_Thermal::thermal_data);
+                     &wincalc::Product_Data_Optical_Thermal::thermal_data)
+      .def(pickle_constructor_members<wincalc::Product_Data_Optical_Thermal>(
+          &wincalc::Product_Data_Optical_Thermal::optical_data,
+          &wincalc::Product_Data_Optical_Thermal::thermal_data))
+      .def("__copy__", &copy_solid_layer)
+      .def(
+          "__deepcopy__",
+          [](wincalc::Product_Data_Optical_Thermal const &self,
+             py::dict const &) { return copy_solid_layer(self); },
+          py::arg("memo"));
 
   py::enum_<SingleLayerOptics::BSDFBasis>(m, "BSDFBasisType", py::arithmetic())
       .value("SMALL", SingleLayerOptics::BSDFBasis::Small)
@@ -1126,7 +2570,16 @@ PYBIND11_MODULE(wincalcbindings, m) {
                   py::overload_cast<SingleLayerOptics::BSDFBasis>(
                       &SingleLayerOptics::BSDFHemisphere::create),
                   py::arg("bsdf_basis"))
-      .def("get_directions", &SingleLayerOptics::BSDFHemisphere::getDirections);
+      .def("get_directions", &SingleLayerOptics::BSDFHemisphere::getDirections)
+      .def(py::pickle(
+          [](SingleLayerOptics::BSDFHemisphere const &self) {
+            return py::make_tuple(bsdf_basis(self));
+          },
+          [](py::tuple const &state) {
+            check_pickle_state(state, 1);
+            return SingleLayerOptics::BSDFHemisphere::create(
+                state[0].cast<SingleLayerOptics::BSDFBasis>());
+          }));
 
   py::enum_<Tarcog::ISO15099::System>(m, "TarcogSystemType", py::arithmetic())
       .value("U", Tarcog::ISO15099::System::Uvalue)
@@ -1143,7 +2596,9 @@ PYBIND11_MODULE(wincalcbindings, m) {
   m.def("nfrc_u_environments", &wincalc::nfrc_u_environments);
   m.def("nfrc_shgc_environments", &wincalc::nfrc_shgc_environments);
 
-  py::class_<wincalc::Deflection_Results>(m, "DeflectionResults")
+  py::class_<wincalc::Deflection_Results> deflection_results(
+      m, "DeflectionResults");
+  deflection_results
       .def_readwrite("layer_deflection_max",
                      &wincalc::Deflection_Results::layer_deflection_max)
       .def_readwrite("layer_deflection_mean",
@@ -1153,8 +2608,9 @@ PYBIND11_MODULE(wincalcbindings, m) {
                      &wincalc::Deflection_Results::gap_width_max)
       .def_readwrite("gap_width_mean",
                      &wincalc::Deflection_Results::gap_width_mean);
+  def_copy(deflection_results);
 
-  py::class_<wincalc::Glazing_System>(m, "GlazingSystem")
+  py::class_<Locked_Glazing_System>(m, "GlazingSystem")
       .def(
           py::init<window_standards::Optical_Standard const &,
                    std::vector<wincalc::Product_Data_Optical_Thermal> const &,
@@ -1221,70 +2677,104 @@ PYBIND11_MODULE(wincalcbindings, m) {
               wincalc::Spectal_Data_Wavelength_Range_Method::FULL,
           py::arg("number_visible_bands") = 5,
           py::arg("number_solar_bands") = 10)
-      .def("u", &wincalc::Glazing_System::u, py::arg("theta") = 0,
+      .def("u", locked(&wincalc::Glazing_System::u), py::arg("theta") = 0,
            py::arg("phi") = 0)
-      .def("shgc", &wincalc::Glazing_System::shgc, py::arg("theta") = 0,
+      .def("shgc", locked(&wincalc::Glazing_System::shgc), py::arg("theta") = 0,
            py::arg("phi") = 0)
-      .def("layer_temperatures", &wincalc::Glazing_System::layer_temperatures,
+      .def("layer_temperatures",
+           locked(&wincalc::Glazing_System::layer_temperatures),
            py::arg("system_type"), py::arg("theta") = 0, py::arg("phi") = 0)
       .def("optical_method_results",
-           &wincalc::Glazing_System::optical_method_results,
+           locked(&wincalc::Glazing_System::optical_method_results),
            py::arg("method_name"), py::arg("theta") = 0, py::arg("phi") = 0)
-      .def("color", &wincalc::Glazing_System::color, py::arg("theta") = 0,
-           py::arg("phi") = 0,
+      .def("color", locked(&wincalc::Glazing_System::color),
+           py::arg("theta") = 0, py::arg("phi") = 0,
            py::arg("tristimulus_x_method") = "COLOR_TRISTIMX",
            py::arg("tristimulus_y_method") = "COLOR_TRISTIMY",
            py::arg("tristimulus_z_method") = "COLOR_TRISTIMZ")
       .def("solid_layers_effective_conductivities",
-           &wincalc::Glazing_System::solid_layers_effective_conductivities,
-           py::arg("system_type"), py::arg("theta") = 0, py::arg("phi") = 0)
-      .def("gap_layers_effective_conductivities",
-           &wincalc::Glazing_System::gap_layers_effective_conductivities,
+           locked(
+               &wincalc::Glazing_System::solid_layers_effective_conductivities),
            py::arg("system_type"), py::arg("theta") = 0, py::arg("phi") = 0)
+      .def(
+          "gap_layers_effective_conductivities",
+          locked(&wincalc::Glazing_System::gap_layers_effective_conductivities),
+          py::arg("system_type"), py::arg("theta") = 0, py::arg("phi") = 0)
       .def("system_effective_conductivity",
-           &wincalc::Glazing_System::system_effective_conductivity,
+           locked(&wincalc::Glazing_System::system_effective_conductivity),
            py::arg("system_type"), py::arg("theta") = 0, py::arg("phi") = 0)
-      .def("relative_heat_gain", &wincalc::Glazing_System::relative_heat_gain,
+      .def("relative_heat_gain",
+           locked(&wincalc::Glazing_System::relative_heat_gain),
            py::arg("theta") = 0, py::arg("phi") = 0)
+      .def("simulate_timeseries", &simulate_timeseries,
+           py::arg("outside_temps"), py::arg("inside_temps"),
+           py::arg("wind_speeds"), py::arg("solar_radiation"),
+           py::arg("theta") = 0, py::arg("phi") = 0,
+           py::arg("outside_radiation_temps") = py::none(),
+           py::arg("inside_radiation_temps") = py::none(),
+           "Calculate thermal results for each time step.  Each time step "
+           "uses the current environments with the outside and inside air "
+           "temperatures (K), outside air speed (m/s) and direct solar "
+           "radiation (W/m2) replaced by the values for that step.  The "
+           "radiation temperatures (K) are replaced too if series are given "
+           "for them and are otherwise kept from the environments.  Returns a "
+           "dict of numpy arrays with u, shgc, heat_flux "
+           "(W/m2 into the building, U * (Tout - Tin) + SHGC * solar) and "
+           "layer_temperatures (one row per step, SHGC system) plus the "
+           "number of steps and wall_time_seconds.")
       .def("environments",
-           py::overload_cast<wincalc::Environments const &>(
-               &wincalc::Glazing_System::environments),
+           locked(py::overload_cast<wincalc::Environments const &>(
+               &wincalc::Glazing_System::environments)),
            py::arg("environments"))
       .def("environments",
-           py::overload_cast<>(&wincalc::Glazing_System::environments,
-                               py::const_))
-      .def("enable_deflection", &wincalc::Glazing_System::enable_deflection,
+           locked(py::overload_cast<>(&wincalc::Glazing_System::environments,
+                                      py::const_)))
+      .def("enable_deflection",
+           locked(&wincalc::Glazing_System::enable_deflection),
            py::arg("enable"))
       .def("set_deflection_properties",
-           py::overload_cast<double, double>(
-               &wincalc::Glazing_System::set_deflection_properties),
+           locked(py::overload_cast<double, double>(
+               &wincalc::Glazing_System::set_deflection_properties)),
            py::arg("temperature_at_construction"),
            py::arg("pressure_at_construction"))
       .def("set_deflection_properties",
-           py::overload_cast<std::vector<double> const &>(
-               &wincalc::Glazing_System::set_deflection_properties),
+           locked(py::overload_cast<std::vector<double> const &>(
+               &wincalc::Glazing_System::set_deflection_properties)),
            py::arg("measured_deflected_gaps"))
       .def("calc_deflection_properties",
-           &wincalc::Glazing_System::calc_deflection_properties,
+           locked(&wincalc::Glazing_System::calc_deflection_properties),
            py::arg("system_type"), py::arg("theta") = 0, py::arg("phi") = 0)
-      .def("set_applied_loads", &wincalc::Glazing_System::set_applied_loads,
+      .def("set_applied_loads",
+           locked(&wincalc::Glazing_System::set_applied_loads),
            py::arg("loads"))
-      .def("set_height", &wincalc::Glazing_System::set_height,
+      .def("set_height", locked(&wincalc::Glazing_System::set_height),
            py::arg("height_meters"))
-      .def("set_width", &wincalc::Glazing_System::set_width,
+      .def("set_width", locked(&wincalc::Glazing_System::set_width),
            py::arg("width_meters"))
-      .def("set_tilt", &wincalc::Glazing_System::set_tilt,
+      .def("set_tilt", locked(&wincalc::Glazing_System::set_tilt),
            py::arg("tilt_degrees"))
-      .def("flip_layer", &wincalc::Glazing_System::flip_layer,
+      .def("flip_layer", locked(&wincalc::Glazing_System::flip_layer),
            py::arg("layer_index"), py::arg("flipped"))
       .def("solid_layers",
-           py::overload_cast<
-               std::vector<wincalc::Product_Data_Optical_Thermal> const &>(
-               &wincalc::Glazing_System::solid_layers),
+           locked(py::overload_cast<
+                  std::vector<wincalc::Product_Data_Optical_Thermal> const &>(
+               &wincalc::Glazing_System::solid_layers)),
            py::arg("solid_layers"))
       .def("solid_layers",
-           py::overload_cast<>(&wincalc::Glazing_System::solid_layers,
-                               py::const_));
+           locked(py::overload_cast<>(&wincalc::Glazing_System::solid_layers,
+                                      py::const_)));
+
+  m.def("results_to_columns", &optical_results_to_columns, py::arg("results"),
+        "Convert a list of OpticalResults to a dict of numpy arrays with one "
+        "array per result value.  System values have one value per result.  "
+        "Layer values have one row per result and one column per layer and "
+        "are padded with NaN for results with fewer layers.");
+
+  m.def("color_results_to_columns", &color_results_to_columns,
+        py::arg("results"),
+        "Convert a list of OpticalResultsColor to a dict of numpy arrays with "
+        "one value per result for every trichromatic, Lab and RGB value of "
+        "the system results.");
 
   m.def("convert_to_solid_layer", &wincalc::convert_to_solid_layer,
         "Convert product data into a solid layer that can be used in glazing "
@@ -1297,20 +2787,28 @@ PYBIND11_MODULE(wincalcbindings, m) {
   m.def("load_standard",
         py::overload_cast<std::string const &>(
             &window_standards::load_optical_standard),
-        "Load standard from .std file");
+        "Load standard from .std file",
+        py::call_guard<py::gil_scoped_release>());
   m.def("parse_json", &OpticsParser::parseJSONString,
-        "Load product data from json string");
+        "Load product data from json string",
+        py::call_guard<py::gil_scoped_release>());
   m.def("parse_json_file", &OpticsParser::parseJSONFile,
-        "Load product data from json file");
+        "Load product data from json file",
+        py::call_guard<py::gil_scoped_release>());
   m.def("parse_optics_file", &OpticsParser::parseOpticsFile,
-        "Load product data from optics file");
+        "Load product data from optics file",
+        py::call_guard<py::gil_scoped_release>());
   m.def("parse_bsdf_xml_file", &OpticsParser::parseBSDFXMLFile,
-        "Load product data from BSDF xml file");
+        "Load product data from BSDF xml file",
+        py::call_guard<py::gil_scoped_release>());
   m.def("parse_bsdf_xml_string", &OpticsParser::parseBSDFXMLString,
-        "Load product data from BSDF xml string");
-  m.def("parse_thmx_file", &thmxParser::parseFile, "Parse a THERM thmx file");
+        "Load product data from BSDF xml string",
+        py::call_guard<py::gil_scoped_release>());
+  m.def("parse_thmx_file", &thmxParser::parseFile, "Parse a THERM thmx file",
+        py::call_guard<py::gil_scoped_release>());
   m.def("parse_thmx_string", &thmxParser::parseString,
-        "Parse THERM thmx format from a string");
+        "Parse THERM thmx format from a string",
+        py::call_guard<py::gil_scoped_release>());
 
   m.def("create_gas", &wincalc::create_gas, py::arg("components"),
         "Create a gas mixture from components: a list of pairs where the first "
@@ -1375,12 +2873,22 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("error_limit", &thmxParser::MeshParameters::errorLimit)
       .def_readwrite("max_iterations",
                      &thmxParser::MeshParameters::maxIterations)
-      .def_readwrite("cma_flag", &thmxParser::MeshParameters::cmaFlag);
+      .def_readwrite("cma_flag", &thmxParser::MeshParameters::cmaFlag)
+      .def(pickle_members<thmxParser::MeshParameters>(
+          &thmxParser::MeshParameters::quadTreeMeshLevel,
+          &thmxParser::MeshParameters::errorCheckFlag,
+          &thmxParser::MeshParameters::errorLimit,
+          &thmxParser::MeshParameters::maxIterations,
+          &thmxParser::MeshParameters::cmaFlag));
 
   py::class_<thmxParser::ColorRGB>(m, "ThmxRGB")
       .def_readwrite("r", &thmxParser::ColorRGB::r)
       .def_readwrite("g", &thmxParser::ColorRGB::g)
-      .def_readwrite("b", &thmxParser::ColorRGB::b);
+      .def_readwrite("b", &thmxParser::ColorRGB::b)
+      .def(pickle_members<thmxParser::ColorRGB>(
+          &thmxParser::ColorRGB::r,
+          &thmxParser::ColorRGB::g,
+          &thmxParser::ColorRGB::b));
 
   py::class_<thmxParser::Material>(m, "ThmxMaterial")
       .def_readwrite("name", &thmxParser::Material::name)
@@ -1392,7 +2900,18 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("color", &thmxParser::Material::color)
       .def_readwrite("cavity_model", &thmxParser::Material::cavityModel)
       .def_readwrite("transmittances", &thmxParser::Material::transmittances)
-      .def_readwrite("reflectances", &thmxParser::Material::reflectances);
+      .def_readwrite("reflectances", &thmxParser::Material::reflectances)
+      .def(pickle_members<thmxParser::Material>(
+          &thmxParser::Material::name,
+          &thmxParser::Material::type,
+          &thmxParser::Material::conductivity,
+          &thmxParser::Material::emissivityFront,
+          &thmxParser::Material::emissivityBack,
+          &thmxParser::Material::tir,
+          &thmxParser::Material::color,
+          &thmxParser::Material::cavityModel,
+          &thmxParser::Material::transmittances,
+          &thmxParser::Material::reflectances));
 
   py::class_<thmxParser::BoundaryCondition>(m, "ThmxBoundaryCondition")
       .def_readwrite("name", &thmxParser::BoundaryCondition::name)
@@ -1415,17 +2934,42 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("constant_temperature_flag",
                      &thmxParser::BoundaryCondition::constantTemperatureFlag)
       .def_readwrite("emissivity_modifier",
-                     &thmxParser::BoundaryCondition::emissivityModifier);
+                     &thmxParser::BoundaryCondition::emissivityModifier)
+      .def(pickle_members<thmxParser::BoundaryCondition>(
+          &thmxParser::BoundaryCondition::name,
+          &thmxParser::BoundaryCondition::type,
+          &thmxParser::BoundaryCondition::H,
+          &thmxParser::BoundaryCondition::heatFlux,
+          &thmxParser::BoundaryCondition::temperature,
+          &thmxParser::BoundaryCondition::color,
+          &thmxParser::BoundaryCondition::Tr,
+          &thmxParser::BoundaryCondition::Hr,
+          &thmxParser::BoundaryCondition::Ei,
+          &thmxParser::BoundaryCondition::viewFactor,
+          &thmxParser::BoundaryCondition::radiationModel,
+          &thmxParser::BoundaryCondition::convectionFlag,
+          &thmxParser::BoundaryCondition::fluxFlag,
+          &thmxParser::BoundaryCondition::radiationFlag,
+          &thmxParser::BoundaryCondition::constantTemperatureFlag,
+          &thmxParser::BoundaryCondition::emissivityModifier));
 
   py::class_<thmxParser::PolygonPoint>(m, "ThmxPolygonPoint")
       .def_readwrite("index", &thmxParser::PolygonPoint::index)
       .def_readwrite("x", &thmxParser::PolygonPoint::x)
-      .def_readwrite("y", &thmxParser::PolygonPoint::y);
+      .def_readwrite("y", &thmxParser::PolygonPoint::y)
+      .def(pickle_members<thmxParser::PolygonPoint>(
+          &thmxParser::PolygonPoint::index,
+          &thmxParser::PolygonPoint::x,
+          &thmxParser::PolygonPoint::y));
 
   py::class_<thmxParser::Polygon>(m, "ThmxPolygon")
       .def_readwrite("id", &thmxParser::Polygon::id)
       .def_readwrite("material", &thmxParser::Polygon::material)
-      .def_readwrite("points", &thmxParser::Polygon::points);
+      .def_readwrite("points", &thmxParser::Polygon::points)
+      .def(pickle_members<thmxParser::Polygon>(
+          &thmxParser::Polygon::id,
+          &thmxParser::Polygon::material,
+          &thmxParser::Polygon::points));
 
   py::class_<thmxParser::BoundaryConditionPolygon>(
       m, "ThmxBoundaryConditionPolygon")
@@ -1445,7 +2989,18 @@ PYBIND11_MODULE(wincalcbindings, m) {
                      &thmxParser::BoundaryConditionPolygon::surfaceSide)
       .def_readwrite("illuminated_surface",
                      &thmxParser::BoundaryConditionPolygon::illuminatedSurface)
-      .def_readwrite("points", &thmxParser::BoundaryConditionPolygon::points);
+      .def_readwrite("points", &thmxParser::BoundaryConditionPolygon::points)
+      .def(pickle_members<thmxParser::BoundaryConditionPolygon>(
+          &thmxParser::BoundaryConditionPolygon::id,
+          &thmxParser::BoundaryConditionPolygon::name,
+          &thmxParser::BoundaryConditionPolygon::polygonId,
+          &thmxParser::BoundaryConditionPolygon::enclosureId,
+          &thmxParser::BoundaryConditionPolygon::ufactorTag,
+          &thmxParser::BoundaryConditionPolygon::ratationModel,
+          &thmxParser::BoundaryConditionPolygon::emissivity,
+          &thmxParser::BoundaryConditionPolygon::surfaceSide,
+          &thmxParser::BoundaryConditionPolygon::illuminatedSurface,
+          &thmxParser::BoundaryConditionPolygon::points));
 
   py::class_<thmxParser::CMABestWorstOption>(m, "ThmxCMABestWorstOption")
       .def_readwrite("option", &thmxParser::CMABestWorstOption::option)
@@ -1458,7 +3013,13 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("glazing_gap_conductance",
                      &thmxParser::CMABestWorstOption::glazingGapConductance)
       .def_readwrite("spacer_conductance",
-                     &thmxParser::CMABestWorstOption::spacerConductance);
+                     &thmxParser::CMABestWorstOption::spacerConductance)
+      .def(pickle_members<thmxParser::CMABestWorstOption>(
+          &thmxParser::CMABestWorstOption::option,
+          &thmxParser::CMABestWorstOption::insideConvectiveFilmCoefficient,
+          &thmxParser::CMABestWorstOption::outsideConvectiveFilmCoefficient,
+          &thmxParser::CMABestWorstOption::glazingGapConductance,
+          &thmxParser::CMABestWorstOption::spacerConductance));
 
   py::class_<thmxParser::CMAOptions>(m, "ThmxCMAOptions")
       .def_readwrite("interior_layer_conductivity",
@@ -1478,7 +3039,17 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("exterior_temperature",
                      &thmxParser::CMAOptions::exteriorTemperature)
       .def_readwrite("best_worst_options",
-                     &thmxParser::CMAOptions::bestWorstOptions);
+                     &thmxParser::CMAOptions::bestWorstOptions)
+      .def(pickle_members<thmxParser::CMAOptions>(
+          &thmxParser::CMAOptions::interiorLayerConductivity,
+          &thmxParser::CMAOptions::interiorLayerThickness,
+          &thmxParser::CMAOptions::interiorLayerEmissivity,
+          &thmxParser::CMAOptions::exteriorLayerConductivity,
+          &thmxParser::CMAOptions::exteriorLayerThickness,
+          &thmxParser::CMAOptions::exteriorLayerEmissivity,
+          &thmxParser::CMAOptions::interiorTemperature,
+          &thmxParser::CMAOptions::exteriorTemperature,
+          &thmxParser::CMAOptions::bestWorstOptions));
 
   py::class_<thmxParser::UFactorProjectionResult>(m,
                                                   "ThmxUFactorProjectionResult")
@@ -1489,20 +3060,36 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("length", &thmxParser::UFactorProjectionResult::length)
       .def_readwrite("ufactor_units",
                      &thmxParser::UFactorProjectionResult::ufactorUnits)
-      .def_readwrite("ufactor", &thmxParser::UFactorProjectionResult::ufactor);
+      .def_readwrite("ufactor", &thmxParser::UFactorProjectionResult::ufactor)
+      .def(pickle_members<thmxParser::UFactorProjectionResult>(
+          &thmxParser::UFactorProjectionResult::lengthType,
+          &thmxParser::UFactorProjectionResult::lengthUnits,
+          &thmxParser::UFactorProjectionResult::length,
+          &thmxParser::UFactorProjectionResult::ufactorUnits,
+          &thmxParser::UFactorProjectionResult::ufactor));
 
   py::class_<thmxParser::UFactorResults>(m, "ThmxUFactorResults")
       .def_readwrite("tag", &thmxParser::UFactorResults::tag)
       .def_readwrite("delta_t_units", &thmxParser::UFactorResults::deltaTUnits)
       .def_readwrite("delta_t", &thmxParser::UFactorResults::deltaT)
       .def_readwrite("projection_results",
-                     &thmxParser::UFactorResults::projectionResults);
+                     &thmxParser::UFactorResults::projectionResults)
+      .def(pickle_members<thmxParser::UFactorResults>(
+          &thmxParser::UFactorResults::tag,
+          &thmxParser::UFactorResults::deltaTUnits,
+          &thmxParser::UFactorResults::deltaT,
+          &thmxParser::UFactorResults::projectionResults));
 
   py::class_<thmxParser::Result>(m, "ThmxResult")
       .def_readwrite("model_type", &thmxParser::Result::modelType)
       .def_readwrite("glazing_case", &thmxParser::Result::glazingCase)
       .def_readwrite("spacer_case", &thmxParser::Result::spacerCase)
-      .def_readwrite("ufactor_results", &thmxParser::Result::ufactorResults);
+      .def_readwrite("ufactor_results", &thmxParser::Result::ufactorResults)
+      .def(pickle_members<thmxParser::Result>(
+          &thmxParser::Result::modelType,
+          &thmxParser::Result::glazingCase,
+          &thmxParser::Result::spacerCase,
+          &thmxParser::Result::ufactorResults));
 
   py::class_<thmxParser::ThmxFileContents>(m, "ThmxFileContents")
       .def_readwrite("file_version", &thmxParser::ThmxFileContents::fileVersion)
@@ -1515,7 +3102,16 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("boundary_condition_polygons",
                      &thmxParser::ThmxFileContents::boundaryConditionPolygons)
       .def_readwrite("cma_options", &thmxParser::ThmxFileContents::cmaOptions)
-      .def_readwrite("results", &thmxParser::ThmxFileContents::results);
+      .def_readwrite("results", &thmxParser::ThmxFileContents::results)
+      .def(pickle_members<thmxParser::ThmxFileContents>(
+          &thmxParser::ThmxFileContents::fileVersion,
+          &thmxParser::ThmxFileContents::meshParameters,
+          &thmxParser::ThmxFileContents::materials,
+          &thmxParser::ThmxFileContents::boundaryConditions,
+          &thmxParser::ThmxFileContents::polygons,
+          &thmxParser::ThmxFileContents::boundaryConditionPolygons,
+          &thmxParser::ThmxFileContents::cmaOptions,
+          &thmxParser::ThmxFileContents::results));
 
   py::class_<Tarcog::IGUDimensions>(m, "GlazingSystemDimensions")
       .def_readwrite("width", &Tarcog::IGUDimensions::width)
@@ -1625,7 +3221,8 @@ PYBIND11_MODULE(wincalcbindings, m) {
                      &wincalc::ThermalIRResults::emissivity_back_hemispheric);
 
   m.def("calc_thermal_ir", &wincalc::calc_thermal_ir,
-        py::arg("optical_standard"), py::arg("product_data"));
+        py::arg("optical_standard"), py::arg("product_data"),
+        py::call_guard<py::gil_scoped_release>());
 
   m.def("get_spacer_keff", &wincalc::get_spacer_keff,
         "Calculate the effective conductivity of a spacer from a THERM thmx "
@@ -1689,7 +3286,8 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def_readwrite("shgc", &wincalc::CMAResult::shgc)
       .def_readwrite("vt", &wincalc::CMAResult::vt);
 
-  m.def("calc_cma", &wincalc::calc_cma, "Get CMA results.");
+  m.def("calc_cma", &wincalc::calc_cma, "Get CMA results.",
+        py::call_guard<py::gil_scoped_release>());
 
   py::enum_<SingleLayerOptics::BSDFDirection>(m, "BSDFDirection",
                                               py::arithmetic())
@@ -1706,6 +3304,13 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .value("R", FenestrationCommon::PropertySimple::R);
 
   py::class_<FenestrationCommon::SquareMatrix>(m, "SquareMatrix")
+      .def(py::init([](Matrix_Array const &input) {
+             if (input.ndim() != 2 || input.shape(0) != input.shape(1)) {
+               throw std::invalid_argument("Expected a square 2D array.");
+             }
+             return FenestrationCommon::SquareMatrix(array_to_matrix(input));
+           }),
+           py::arg("input"))
       .def(py::init<std::vector<std::vector<double>> const &>(),
            py::arg("input"))
       .def("size", &FenestrationCommon::SquareMatrix::size)
@@ -1716,7 +3321,15 @@ PYBIND11_MODULE(wincalcbindings, m) {
            &FenestrationCommon::SquareMatrix::makeUpperTriangular)
       .def("inverse", &FenestrationCommon::SquareMatrix::inverse)
       .def("mmult_rows", &FenestrationCommon::SquareMatrix::mmultRows)
-      .def("get_matrix", &FenestrationCommon::SquareMatrix::getMatrix);
+      .def("get_matrix", &FenestrationCommon::SquareMatrix::getMatrix)
+      .def(
+          "get_matrix_array",
+          [](FenestrationCommon::SquareMatrix const &self) {
+            return matrix_to_array(self.getMatrix());
+          },
+          "Get the matrix as a 2D numpy array.");
+
+  py::implicitly_convertible<py::array, FenestrationCommon::SquareMatrix>();
 
   py::class_<SingleLayerOptics::BSDFDirections>(m, "BSDFDirections")
       .def(py::init<>())
@@ -1733,6 +3346,15 @@ PYBIND11_MODULE(wincalcbindings, m) {
       .def(py::init<SingleLayerOptics::BSDFDirections const &>(),
            py::arg("directions"))
       .def("get_matrix", &SingleLayerOptics::BSDFIntegrator::getMatrix)
+      .def(
+          "get_matrix_array",
+          [](SingleLayerOptics::BSDFIntegrator &self,
+             FenestrationCommon::Side side,
+             FenestrationCommon::PropertySimple property) {
+            return matrix_to_array(self.getMatrix(side, property).getMatrix());
+          },
+          py::arg("side"), py::arg("property"),
+          "Get the matrix for the side and property as a 2D numpy array.")
       .def("at", &SingleLayerOptics::BSDFIntegrator::at)
       .def("set_matrices", &SingleLayerOptics::BSDFIntegrator::setMatrices)
       .def(
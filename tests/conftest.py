@@ -0,0 +1,32 @@
+from pathlib import Path
+
+import pytest
+
+import pywincalc
+
+PRODUCTS = Path(__file__).resolve().parent.parent / "examples" / "products"
+
+
+@pytest.fixture(scope="session")
+def products_path():
+    return PRODUCTS
+
+
+@pytest.fixture(scope="session")
+def clear_3():
+    return pywincalc.parse_optics_file(str(PRODUCTS / "CLEAR_3.DAT"))
+
+
+@pytest.fixture(scope="session")
+def clear_6():
+    return pywincalc.parse_optics_file(str(PRODUCTS / "CLEAR_6.DAT"))
+
+
+@pytest.fixture(scope="session")
+def low_e():
+    return pywincalc.parse_optics_file(str(PRODUCTS / "LOW-E_5.LOF"))
+
+
+@pytest.fixture
+def gap():
+    return pywincalc.Layers.gap(thickness=.0127)
@@ -0,0 +1,56 @@
+import numpy
+import pytest
+
+import pywincalc
+
+THETAS = [0, 15, 30, 45, 60, 75]
+
+
+@pytest.fixture
+def glazing_system(clear_3, clear_6, gap):
+    return pywincalc.GlazingSystem(solid_layers=[clear_6, clear_3], gap_layers=[gap],
+                                   environment=pywincalc.nfrc_shgc_environments())
+
+
+def test_u_and_shgc_angles_match_single_angles(glazing_system, clear_3, clear_6, gap):
+    reference = pywincalc.GlazingSystem(solid_layers=[clear_6, clear_3], gap_layers=[gap],
+                                        environment=pywincalc.nfrc_shgc_environments())
+    numpy.testing.assert_allclose(glazing_system.u_angles(THETAS), [reference.u(theta) for theta in THETAS])
+    numpy.testing.assert_allclose(glazing_system.shgc_angles(THETAS), [reference.shgc(theta) for theta in THETAS])
+
+
+def test_angles_are_cached(glazing_system):
+    first = glazing_system.shgc_angles(THETAS)
+    hits = glazing_system.cache_info().hits
+    second = glazing_system.shgc_angles(THETAS)
+    assert glazing_system.cache_info().hits == hits + len(THETAS)
+    numpy.testing.assert_array_equal(first, second)
+    # Single angle calls share the same cache
+    assert glazing_system.shgc(THETAS[2]) == first[2]
+
+
+def test_phis(glazing_system):
+    numpy.testing.assert_allclose(glazing_system.u_angles(THETAS, [0]), glazing_system.u_angles(THETAS))
+    numpy.testing.assert_allclose(glazing_system.u_angles([30, 30], [0, 90]),
+                                  [glazing_system.u(30, 0), glazing_system.u(30, 90)])
+    with pytest.raises(ValueError):
+        glazing_system.u_angles(THETAS, [0, 90])
+
+
+def test_optical_method_results_angles_columns(glazing_system):
+    columns = glazing_system.optical_method_results_angles("SOLAR", THETAS)
+    numpy.testing.assert_array_equal(columns["theta"], THETAS)
+    numpy.testing.assert_array_equal(columns["phi"], numpy.zeros(len(THETAS)))
+    expected = [glazing_system.optical_method_results("SOLAR", theta).system_results.front.transmittance
+                .direct_hemispherical for theta in THETAS]
+    numpy.testing.assert_allclose(columns["system_front_transmittance_direct_hemispherical"], expected)
+    # Transmittance decreases with the incidence angle
+    assert numpy.all(numpy.diff(expected) < 0)
+
+
+def test_color_angles_columns(glazing_system):
+    columns = glazing_system.color_angles(THETAS)
+    numpy.testing.assert_array_equal(columns["theta"], THETAS)
+    expected = [glazing_system.color(theta).system_results.front.transmittance.direct_hemispherical.lab.L
+                for theta in THETAS]
+    numpy.testing.assert_allclose(columns["system_front_transmittance_direct_hemispherical_lab_L"], expected)
@@ -0,0 +1,58 @@
+import numpy
+import pytest
+
+import pywincalc
+from pywincalc import bsdf_binary
+
+
+@pytest.fixture(scope="module")
+def bsdf_product(products_path):
+    return pywincalc.parse_bsdf_xml_file(str(products_path / "2011-SA1.XML"))
+
+
+@pytest.fixture
+def binary_path(tmp_path, products_path):
+    path = tmp_path / "2011-SA1.bsdf"
+    bsdf_binary.convert_bsdf_xml(str(products_path / "2011-SA1.XML"), path)
+    return path
+
+
+def test_round_trip(bsdf_product, binary_path):
+    product = bsdf_binary.read_bsdf_binary(binary_path)
+    for field in bsdf_binary.PRODUCT_FIELDS:
+        assert getattr(product, field) == getattr(bsdf_product, field)
+    for band in bsdf_binary.BANDS:
+        for name in bsdf_binary.PROPERTIES:
+            expected = getattr(getattr(bsdf_product.measurements, band), name)
+            bsdf = getattr(getattr(product.measurements, band), name)
+            if expected is None:
+                assert bsdf is None
+                continue
+            assert bsdf.data == expected.data
+            assert bsdf.row_angle_basis_name == expected.row_angle_basis_name
+
+
+def test_arrays_are_memory_mapped(bsdf_product, binary_path):
+    metadata, arrays = bsdf_binary.read_bsdf_arrays(binary_path)
+    assert metadata["product"]["product_name"] == bsdf_product.product_name
+    transmittance = arrays[("solar", "transmittance_front")]
+    assert isinstance(transmittance, numpy.memmap)
+    assert not transmittance.flags.writeable
+    numpy.testing.assert_array_equal(transmittance, bsdf_product.measurements.solar.transmittance_front.data)
+
+
+def test_glazing_system_results_match(bsdf_product, binary_path):
+    bsdf_hemisphere = pywincalc.BSDFHemisphere.create(pywincalc.BSDFBasisType.FULL)
+    results = [pywincalc.GlazingSystem(solid_layers=[product], bsdf_hemisphere=bsdf_hemisphere)
+               .optical_method_results("SOLAR").system_results.front.transmittance.direct_hemispherical
+               for product in (bsdf_product, bsdf_binary.read_bsdf_binary(binary_path))]
+    assert results[1] == pytest.approx(results[0])
+
+
+def test_invalid_files(tmp_path, clear_3):
+    not_binary = tmp_path / "not_binary.bsdf"
+    not_binary.write_bytes(b"<WindowElement>" + bytes(16))
+    with pytest.raises(ValueError):
+        bsdf_binary.read_bsdf_binary(not_binary)
+    with pytest.raises(ValueError):
+        bsdf_binary.write_bsdf_binary(clear_3, tmp_path / "clear_3.bsdf")
@@ -0,0 +1,76 @@
+import pytest
+
+import pywincalc
+
+
+def make_system(clear_3, clear_6, gap):
+    return pywincalc.GlazingSystem(solid_layers=[clear_6, clear_3], gap_layers=[gap],
+                                   environment=pywincalc.nfrc_shgc_environments())
+
+
+def test_results_are_cached(clear_3, clear_6, gap):
+    glazing_system = make_system(clear_3, clear_6, gap)
+    u = glazing_system.u()
+    glazing_system.optical_method_results("SOLAR")
+    assert glazing_system.cache_info() == pywincalc.CacheInfo(0, 2, 2)
+    assert glazing_system.u() == u
+    glazing_system.optical_method_results("SOLAR")
+    assert glazing_system.cache_info() == pywincalc.CacheInfo(2, 2, 2)
+
+
+def test_setters_only_clear_thermal_results(clear_3, clear_6, gap):
+    glazing_system = make_system(clear_3, clear_6, gap)
+    u = glazing_system.u()
+    glazing_system.optical_method_results("SOLAR")
+    glazing_system.set_tilt(45)
+    assert glazing_system.cache_info().size == 1
+    assert glazing_system.u() != u
+    glazing_system.set_tilt(90)
+    # Solved again, starting from the last solution
+    assert glazing_system.u() == pytest.approx(u)
+    glazing_system.flip_layer(0, True)
+    assert glazing_system.cache_info().size == 0
+    glazing_system.clear_cache()
+    assert glazing_system.cache_info().size == 0
+
+
+def test_results_are_kept_per_environment(clear_3, clear_6, gap):
+    glazing_system = make_system(clear_3, clear_6, gap)
+    shgc_environment_u = glazing_system.u()
+    glazing_system.environments(pywincalc.nfrc_u_environments())
+    u_environment_u = glazing_system.u()
+    misses = glazing_system.cache_info().misses
+    glazing_system.environments(pywincalc.nfrc_shgc_environments())
+    assert glazing_system.u() == shgc_environment_u
+    glazing_system.environments(pywincalc.nfrc_u_environments())
+    assert glazing_system.u() == u_environment_u
+    assert glazing_system.cache_info().misses == misses
+
+
+def test_optical_results_are_kept_when_environments_change(clear_3, clear_6, gap):
+    glazing_system = make_system(clear_3, clear_6, gap)
+    expected = glazing_system.optical_method_results("PHOTOPIC").system_results.front.transmittance \
+        .direct_hemispherical
+    glazing_system.environments(pywincalc.nfrc_u_environments())
+    hits = glazing_system.cache_info().hits
+    assert glazing_system.optical_method_results("PHOTOPIC").system_results.front.transmittance \
+        .direct_hemispherical == expected
+    assert glazing_system.cache_info().hits == hits + 1
+
+
+def test_returned_results_are_copies(clear_3, clear_6, gap):
+    glazing_system = make_system(clear_3, clear_6, gap)
+    results = glazing_system.optical_method_results("SOLAR")
+    expected = results.system_results.front.transmittance.direct_hemispherical
+    results.system_results.front.transmittance.direct_hemispherical = -1
+    assert glazing_system.optical_method_results("SOLAR").system_results.front.transmittance \
+        .direct_hemispherical == expected
+
+    color = glazing_system.color()
+    expected = color.system_results.front.transmittance.direct_hemispherical.lab.L
+    color.system_results.front.transmittance.direct_hemispherical.lab.L = -1
+    assert glazing_system.color().system_results.front.transmittance.direct_hemispherical.lab.L == expected
+
+    temperatures = glazing_system.layer_temperatures(pywincalc.TarcogSystemType.U)
+    temperatures.clear()
+    assert len(glazing_system.layer_temperatures(pywincalc.TarcogSystemType.U)) == 4
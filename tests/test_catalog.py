@@ -0,0 +1,69 @@
+import shutil
+
+import pytest
+
+import pywincalc
+from pywincalc import catalog
+
+
+@pytest.fixture
+def product_files(tmp_path, products_path):
+    for name in ("CLEAR_3.DAT", "CLEAR_6.DAT"):
+        shutil.copy(products_path / name, tmp_path / name)
+    return tmp_path
+
+
+def test_add_files_and_query(product_files):
+    with catalog.Catalog() as product_catalog:
+        assert product_catalog.add_files(sorted(product_files.glob("*.DAT"))) == 2
+        rows = product_catalog.query(order_by="tvis DESC")
+        assert [row["product_name"] for row in rows] == ["Generic Clear Glass", "Generic Clear Glass"]
+        assert rows[0]["tvis"] > rows[1]["tvis"]
+        assert product_catalog.query("thickness > ?", (5,))[0]["source"].endswith("CLEAR_6.DAT")
+
+
+def test_integrated_results_match_glazing_system(clear_3):
+    results = catalog.integrated_results(clear_3, pywincalc.standards.get())
+    glazing_system = pywincalc.GlazingSystem(solid_layers=[clear_3])
+    solar = glazing_system.optical_method_results("SOLAR").system_results.front
+    assert results["tsol"] == pytest.approx(solar.transmittance.direct_hemispherical)
+    assert results["rf_sol"] == pytest.approx(solar.reflectance.direct_hemispherical)
+
+
+def test_unchanged_files_are_not_added_again(product_files):
+    with catalog.Catalog() as product_catalog:
+        paths = sorted(product_files.glob("*.DAT"))
+        product_catalog.add_files(paths)
+        assert product_catalog.add_files(paths) == 0
+        assert len(product_catalog) == 2
+
+
+def test_failures_do_not_stop_the_import(product_files):
+    bad = product_files / "BAD.DAT"
+    bad.write_text("not an optics file\n")
+    missing = product_files / "MISSING.DAT"
+    paths = [bad, missing] + sorted(product_files.glob("CLEAR_*.DAT"))
+    with catalog.Catalog() as product_catalog:
+        with pytest.raises(catalog.CatalogImportError) as error:
+            product_catalog.add_files(paths)
+        assert set(error.value.failures) == {str(bad.resolve()), str(missing.resolve())}
+        assert isinstance(error.value.failures[str(missing.resolve())], OSError)
+        assert error.value.added == 2
+        assert len(product_catalog) == 2
+
+
+def test_reopened_catalog_integrates_files_for_new_standards(product_files, tmp_path_factory):
+    path = tmp_path_factory.mktemp("catalog") / "catalog.sqlite"
+    paths = sorted(product_files.glob("*.DAT"))
+    with catalog.Catalog(path) as product_catalog:
+        product_catalog.add_files(paths)
+        ids = [row["id"] for row in product_catalog.query()]
+    standard_names = (pywincalc.standards.DEFAULT_STANDARD, "NFRC_300_2003")
+    with catalog.Catalog(path, standard_names=standard_names) as product_catalog:
+        assert product_catalog.add_files(paths) == 2
+        assert product_catalog.add_files(paths) == 0
+        assert len(product_catalog) == 2
+        # The products are kept, only the missing results are added
+        assert [row["id"] for row in product_catalog.query()] == ids
+        assert sorted(row["source"] for row in product_catalog.query(standard="NFRC_300_2003")) == \
+               sorted(str(path.resolve()) for path in paths)
@@ -0,0 +1,65 @@
+import shutil
+
+import pytest
+
+import pywincalc
+
+FRAMES = ["sample-head_CMA", "sample-jamb_CMA", "sample-sill_CMA", "Spacer_CMA", "Divider_CMA"]
+
+
+@pytest.fixture(scope="module")
+def library(products_path):
+    return pywincalc.CMAFrameLibrary.from_directory(products_path, workers=2)
+
+
+@pytest.fixture
+def frame_directory(tmp_path, products_path):
+    for name in FRAMES:
+        shutil.copy(products_path / (name + ".thmx"), tmp_path)
+    return tmp_path
+
+
+def cma_u(cma_window, spacer_keff):
+    return pywincalc.calc_cma(cma_window, 1.258, 0.341, 0.535, spacer_keff).u
+
+
+def test_frames_are_compacted(library):
+    assert library.names() == sorted(FRAMES)
+    assert "sample-head_CMA" in library
+    assert len(library["sample-head_CMA"].polygons) == 0
+
+
+def test_single_vision_matches_parsed_frames(library, products_path):
+    head, sill, jamb, spacer = (pywincalc.parse_thmx_file(str(products_path / (name + ".thmx")))
+                                for name in ("sample-head_CMA", "sample-sill_CMA", "sample-jamb_CMA", "Spacer_CMA"))
+    expected = cma_u(pywincalc.get_cma_window_single_vision(head, sill, jamb, jamb, 1.2, 1.5),
+                     pywincalc.get_spacer_keff(spacer))
+    assert library.spacer_keff("Spacer_CMA") == pytest.approx(pywincalc.get_spacer_keff(spacer))
+    cma_window = library.single_vision("sample-head_CMA", "sample-sill_CMA", "sample-jamb_CMA", "sample-jamb_CMA",
+                                       1.2, 1.5)
+    assert cma_u(cma_window, library.spacer_keff("Spacer_CMA")) == pytest.approx(expected)
+
+
+def test_cache_file_is_reused_until_a_file_changes(frame_directory, monkeypatch):
+    cache_file = frame_directory / "frames.cache"
+    pywincalc.CMAFrameLibrary.from_directory(frame_directory, cache_file=cache_file)
+    parsed = []
+    parse = pywincalc.cma._parse_compact_thmx
+    monkeypatch.setattr(pywincalc.cma, "_parse_compact_thmx", lambda path: parsed.append(path) or parse(path))
+    assert len(pywincalc.CMAFrameLibrary.from_directory(frame_directory, cache_file=cache_file)) == len(FRAMES)
+    assert parsed == []
+    (frame_directory / "Divider_CMA.thmx").unlink()
+    assert len(pywincalc.CMAFrameLibrary.from_directory(frame_directory, cache_file=cache_file)) == len(FRAMES) - 1
+    assert len(parsed) == len(FRAMES) - 1
+
+
+def test_save_and_load(library, tmp_path):
+    path = tmp_path / "library.frames"
+    library.save(path)
+    loaded = pywincalc.CMAFrameLibrary.load(path)
+    assert loaded.names() == library.names()
+    assert loaded.spacer_keff("Spacer_CMA") == pytest.approx(library.spacer_keff("Spacer_CMA"))
+    not_a_library = tmp_path / "not_a_library"
+    not_a_library.write_bytes(b"not a library")
+    with pytest.raises(ValueError):
+        pywincalc.CMAFrameLibrary.load(not_a_library)
@@ -0,0 +1,45 @@
+import math
+
+import numpy
+import pytest
+
+import pywincalc
+
+
+@pytest.fixture
+def systems(clear_3, clear_6, low_e, gap):
+    return [pywincalc.GlazingSystem(solid_layers=[clear_3]),
+            pywincalc.GlazingSystem(solid_layers=[low_e, clear_6], gap_layers=[gap])]
+
+
+def test_results_to_columns(systems):
+    results = [glazing_system.optical_method_results("SOLAR") for glazing_system in systems]
+    columns = pywincalc.results_to_columns(results)
+    numpy.testing.assert_array_equal(columns["number_of_layers"], [1, 2])
+    numpy.testing.assert_allclose(columns["system_front_transmittance_direct_hemispherical"],
+                                  [result.system_results.front.transmittance.direct_hemispherical
+                                   for result in results])
+    numpy.testing.assert_allclose(columns["system_back_reflectance_diffuse_diffuse"],
+                                  [result.system_results.back.reflectance.diffuse_diffuse for result in results])
+    absorptance = columns["layer_front_absorptance_total_direct"]
+    assert absorptance.shape == (2, 2)
+    assert absorptance[0, 0] == pytest.approx(results[0].layer_results[0].front.absorptance.total_direct)
+    assert math.isnan(absorptance[0, 1])
+    numpy.testing.assert_allclose(absorptance[1], [layer.front.absorptance.total_direct
+                                                   for layer in results[1].layer_results])
+
+
+def test_results_to_columns_without_results():
+    columns = pywincalc.results_to_columns([])
+    assert len(columns["number_of_layers"]) == 0
+    assert columns["layer_front_absorptance_total_direct"].shape[0] == 0
+
+
+def test_color_results_to_columns(systems):
+    results = [glazing_system.color() for glazing_system in systems]
+    columns = pywincalc.color_results_to_columns(results)
+    for name, value in (("lab_L", lambda color: color.lab.L), ("rgb_R", lambda color: color.rgb.R),
+                        ("trichromatic_Y", lambda color: color.trichromatic.Y)):
+        numpy.testing.assert_allclose(columns["system_front_transmittance_direct_hemispherical_" + name],
+                                      [value(result.system_results.front.transmittance.direct_hemispherical)
+                                       for result in results])
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+import pywincalc
+
+PARSERS = {".json": pywincalc.parse_json_file, ".xml": pywincalc.parse_bsdf_xml_file}
+# Files with UTF-8 text.  The full parser cannot return the cp1252 product names of the others as str.
+PRODUCT_FILES = ["CLEAR_3.DAT", "CLEAR_6.DAT", "SS20-8_3ww.bsf", "2011-SA1.XML", "46016 SEATEX Midnight.xml",
+                 "generic_pv.json", "venetian_blind_CGDB_22034.json"]
+
+
+@pytest.mark.parametrize("name", PRODUCT_FILES)
+def test_header_matches_full_parser(products_path, name):
+    path = products_path / name
+    header = pywincalc.parse_product_header(path)
+    product = PARSERS.get(path.suffix.lower(), pywincalc.parse_optics_file)(str(path))
+    for field in pywincalc.ProductHeader._fields:
+        assert getattr(header, field) == getattr(product, field), field
+
+
+def test_cp1252_optics_header(products_path):
+    header = pywincalc.parse_product_header(products_path / "LOW-E_5.LOF")
+    assert header.product_name == "Energy Advantage\u2122 Low-E"
+    assert header.nfrc_id == 9923
+    assert header.emissivity_front == pytest.approx(0.1579693)
+
+
+@pytest.mark.parametrize("name", ["Spacer_CMA.thm", "Spacer_CMA.thmx", "Divider_CMA.THM", "Divider_CMA.thmx"])
+def test_unknown_files_raise(products_path, name):
+    with pytest.raises(ValueError):
+        pywincalc.parse_product_header(products_path / name)
+
+
+@pytest.mark.parametrize("name", ["generic_pv.json", "venetian_blind_CGDB_22034.json"])
+def test_json_header_does_not_depend_on_member_order(products_path, name):
+    product = json.loads((products_path / name).read_text())
+    expected = pywincalc.parse_json_header(json.dumps(product))
+    # Measured data first and the header fields last
+    reordered = dict(sorted(product.items(), key=lambda item: not isinstance(item[1], (dict, list))))
+    assert list(reordered) != list(product)
+    assert pywincalc.parse_json_header(json.dumps(reordered).encode("utf-8")) == expected
+    assert pywincalc.parse_json_header(json.dumps(dict(reversed(list(product.items()))))) == expected
+
+
+@pytest.mark.parametrize("name", ["generic_pv.json", "venetian_blind_CGDB_22034.json"])
+def test_json_file_header_is_read_in_parts(products_path, monkeypatch, name):
+    monkeypatch.setattr(pywincalc.headers, "_JSON_CHUNK_SIZE", 7)
+    assert pywincalc.parse_json_file_header(products_path / name) == \
+           pywincalc.parse_json_header((products_path / name).read_text())
+
+
+def test_json_file_is_read_until_the_header_is_complete(products_path, tmp_path, monkeypatch):
+    product = json.loads((products_path / "venetian_blind_CGDB_22034.json").read_text())
+    expected = pywincalc.parse_json_header(json.dumps(product))
+    monkeypatch.setattr(pywincalc.headers, "_JSON_CHUNK_SIZE", 7)
+    # Everything after the header is never read so it does not have to be valid JSON
+    text = json.dumps(dict(sorted(product.items(), key=lambda item: isinstance(item[1], list))))
+    path = tmp_path / "truncated.json"
+    path.write_text(text[:text.index("[")] + "[not json")
+    assert pywincalc.parse_json_file_header(path) == expected
+
+
+def test_json_file_header_errors(tmp_path, monkeypatch):
+    monkeypatch.setattr(pywincalc.headers, "_JSON_CHUNK_SIZE", 7)
+    path = tmp_path / "bad.json"
+    path.write_text('{"name": "Clear", "nfrc_id": 10')
+    with pytest.raises(ValueError):
+        pywincalc.parse_json_file_header(path)
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from pywincalc import igsdb
+
+@pytest.fixture
+def catalog(products_path):
+    return igsdb.load_catalog(products_path)
+
+
+@pytest.fixture
+def product_ids(catalog):
+    return sorted(catalog)
+
+
+def test_get_products(catalog, product_ids):
+    with igsdb.LocalIGSDBServer(catalog) as server:
+        async def download():
+            async with igsdb.IGSDBClient(base_url=server.url, cache=False) as client:
+                return await client.get_products(product_ids)
+
+        assert asyncio.run(download()) == [catalog[product_id] for product_id in product_ids]
+
+
+def test_client_can_be_used_from_several_event_loops(catalog, product_ids):
+    with igsdb.LocalIGSDBServer(catalog) as server:
+        client = igsdb.IGSDBClient(base_url=server.url, max_concurrency=1, cache=False)
+        for product_id in product_ids:
+            assert asyncio.run(client.get_product(product_id)) == catalog[product_id]
+        client.close()
+
+
+def test_retries(catalog, product_ids):
+    with igsdb.LocalIGSDBServer(catalog, failures=2) as server:
+        client = igsdb.IGSDBClient(base_url=server.url, max_retries=2, backoff_seconds=0, cache=False)
+        assert asyncio.run(client.get_product(product_ids[0])) == catalog[product_ids[0]]
+        assert server.requests == 3
+        server.failures = 3
+        with pytest.raises(igsdb.IGSDBError):
+            asyncio.run(client.get_product(product_ids[0]))
+        with pytest.raises(igsdb.IGSDBError) as error:
+            asyncio.run(client.get_product("not_a_product"))
+        assert error.value.status == 404
+        client.close()
+
+
+def test_cached_responses_are_revalidated(catalog, product_ids, tmp_path):
+    with igsdb.LocalIGSDBServer(catalog) as server:
+        async def download():
+            async with igsdb.IGSDBClient(base_url=server.url, cache=tmp_path) as client:
+                return await client.get_product_data(product_ids[0])
+
+        first = asyncio.run(download())
+        second = asyncio.run(download())
+        assert first.product_name == second.product_name
+        assert server.requests == 2
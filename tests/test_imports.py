@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+import pytest
+
+import pywincalc
+
+
+def test_import_does_not_import_numpy_or_asyncio():
+    code = "import sys, pywincalc; print(sorted(name for name in ('numpy', 'asyncio') if name in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    assert output.strip() == "[]"
+
+
+def test_lazy_submodules_and_functions():
+    for name in pywincalc._LAZY_SUBMODULES:
+        assert getattr(pywincalc, name).__name__ == "pywincalc." + name
+        assert name in dir(pywincalc)
+    assert pywincalc.validate_products is pywincalc.validation.validate_products
+    from pywincalc import read_bsdf_binary
+    assert read_bsdf_binary is pywincalc.bsdf_binary.read_bsdf_binary
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        pywincalc.not_an_attribute
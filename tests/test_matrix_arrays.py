@@ -0,0 +1,47 @@
+import numpy
+import pytest
+
+import pywincalc
+
+
+@pytest.fixture(scope="module")
+def bsdf_hemisphere():
+    return pywincalc.BSDFHemisphere.create(pywincalc.BSDFBasisType.QUARTER)
+
+
+@pytest.fixture(scope="module")
+def bsdf_product(products_path):
+    return pywincalc.parse_bsdf_xml_file(str(products_path / "2011-SA1.XML"))
+
+
+def test_result_matrix_array(clear_3, bsdf_hemisphere):
+    glazing_system = pywincalc.GlazingSystem(solid_layers=[clear_3], bsdf_hemisphere=bsdf_hemisphere)
+    transmittance = glazing_system.optical_method_results("SOLAR").system_results.front.transmittance
+    matrix = transmittance.matrix_array
+    assert isinstance(matrix, numpy.ndarray)
+    assert matrix.shape == (41, 41)
+    numpy.testing.assert_array_equal(matrix, numpy.array(transmittance.matrix))
+
+
+def test_result_without_matrix(clear_3):
+    results = pywincalc.GlazingSystem(solid_layers=[clear_3]).optical_method_results("SOLAR")
+    assert results.system_results.front.transmittance.matrix_array is None
+
+
+def test_square_matrix_from_array():
+    values = numpy.arange(9, dtype=float).reshape(3, 3)
+    matrix = pywincalc.SquareMatrix(values)
+    assert matrix.size() == 3
+    numpy.testing.assert_array_equal(matrix.get_matrix_array(), values)
+    assert matrix.get_matrix() == values.tolist()
+    with pytest.raises(ValueError):
+        pywincalc.SquareMatrix(numpy.zeros((2, 3)))
+
+
+def test_bsdf_data_array(bsdf_product):
+    bsdf = bsdf_product.measurements.solar.transmittance_front
+    data = bsdf.data_array
+    numpy.testing.assert_array_equal(data, numpy.array(bsdf.data))
+    bsdf.data_array = data * 0.5
+    numpy.testing.assert_allclose(numpy.array(bsdf.data), data * 0.5)
+    bsdf.data_array = data
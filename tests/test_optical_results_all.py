@@ -0,0 +1,44 @@
+import pytest
+
+import pywincalc
+
+
+def test_default_methods_leave_out_uncovered_methods(clear_3):
+    glazing_system = pywincalc.GlazingSystem(solid_layers=[clear_3])
+    results = glazing_system.optical_results_all()
+    # CLEAR_3 is measured from 0.3 microns and SPF starts at 0.28
+    assert "SPF" not in results
+    assert {"SOLAR", "PHOTOPIC", "TUV", "TDW", "TKR", "COLOR"} <= set(results)
+    assert "THERMAL IR" not in results
+    solar = results["SOLAR"].system_results.front.transmittance.direct_hemispherical
+    assert solar == pytest.approx(glazing_system.optical_method_results("SOLAR").system_results.front.transmittance
+                                  .direct_hemispherical)
+
+
+def test_uncovered_method_requested_explicitly_raises(clear_3):
+    with pytest.raises(RuntimeError):
+        pywincalc.GlazingSystem(solid_layers=[clear_3]).optical_results_all(["SPF"])
+
+
+def test_other_errors_are_raised(clear_3, monkeypatch):
+    glazing_system = pywincalc.GlazingSystem(solid_layers=[clear_3])
+    calculate = glazing_system.optical_method_results
+
+    def optical_method_results(method, *args):
+        if method == "TDW":
+            raise RuntimeError("Failed")
+        return calculate(method, *args)
+
+    monkeypatch.setattr(glazing_system, "optical_method_results", optical_method_results)
+    with pytest.raises(RuntimeError, match="Failed"):
+        glazing_system.optical_results_all()
+
+
+def test_parallel_results_match(clear_3, low_e, gap):
+    layers = dict(solid_layers=[clear_3, low_e], gap_layers=[gap])
+    serial = pywincalc.GlazingSystem(**layers).optical_results_all()
+    parallel = pywincalc.GlazingSystem(**layers).optical_results_all(max_workers=4)
+    assert list(parallel) == list(serial)
+    for method in ("SOLAR", "PHOTOPIC"):
+        assert parallel[method].system_results.front.transmittance.direct_hemispherical == pytest.approx(
+            serial[method].system_results.front.transmittance.direct_hemispherical)
@@ -0,0 +1,74 @@
+import json
+import threading
+
+import pytest
+
+import pywincalc
+from pywincalc import parallel
+
+NAMES = ["generic_pv.json", "venetian_blind_CGDB_22034.json"]
+
+
+@pytest.fixture(scope="module")
+def expected(products_path):
+    return [pywincalc.parse_json_file(str(products_path / name)) for name in NAMES * 3]
+
+
+@pytest.fixture
+def jsonl(tmp_path, products_path):
+    path = tmp_path / "products.jsonl"
+    lines = [json.dumps(json.loads((products_path / name).read_text())) for name in NAMES * 3]
+    path.write_text("\n".join(lines) + "\n\n")
+    return path
+
+
+def assert_same_products(products, expected):
+    assert [(product.product_name, product.nfrc_id, product.thickness) for product in products] == \
+        [(product.product_name, product.nfrc_id, product.thickness) for product in expected]
+
+
+def test_paths(products_path, expected):
+    paths = [products_path / name for name in NAMES * 3]
+    results = sorted(pywincalc.parse_json_many(paths, workers=2), key=lambda result: result[0])
+    assert [index for index, _ in results] == list(range(len(paths)))
+    assert_same_products([product for _, product in results], expected)
+    assert_same_products(list(pywincalc.parse_json_many(paths, workers=2, ordered=True)), expected)
+
+
+def test_strings_and_bytes(products_path, expected):
+    texts = [(products_path / name).read_text() for name in NAMES * 3]
+    records = [text if index % 2 else text.encode("utf-8") for index, text in enumerate(texts)]
+    assert_same_products(list(pywincalc.parse_json_many(records, workers=1, ordered=True)), expected)
+
+
+def test_jsonl_path_and_stream(jsonl, expected):
+    assert_same_products(list(pywincalc.parse_json_many(jsonl, workers=2, ordered=True)), expected)
+    assert_same_products(list(pywincalc.parse_json_many(str(jsonl), workers=2, ordered=True)), expected)
+    with open(jsonl, "rb") as stream:
+        assert_same_products(list(pywincalc.parse_json_many(stream, workers=2, ordered=True)), expected)
+
+
+def test_errors_are_raised_in_order(products_path):
+    products = pywincalc.parse_json_many([products_path / NAMES[0], "{not json"], workers=2, ordered=True)
+    assert next(products).product_name == pywincalc.parse_json_file(str(products_path / NAMES[0])).product_name
+    with pytest.raises(RuntimeError):
+        next(products)
+
+
+def test_slow_records_do_not_hold_back_the_others(products_path, monkeypatch):
+    paths = [products_path / name for name in NAMES * 2]
+    first_yielded = threading.Event()
+    parse = parallel._parse_json_record
+
+    def parse_first_slowly(record):
+        if record is paths[0]:
+            first_yielded.wait(10)
+        return parse(record)
+
+    monkeypatch.setattr(parallel, "_parse_json_record", parse_first_slowly)
+    indexes = []
+    for index, _ in pywincalc.parse_json_many(paths, workers=2):
+        indexes.append(index)
+        first_yielded.set()
+    assert indexes[0] != 0
+    assert sorted(indexes) == list(range(len(paths)))
@@ -0,0 +1,130 @@
+import pickle
+
+import numpy
+import pytest
+
+import pywincalc
+
+
+def solar(glazing_system):
+    results = glazing_system.optical_method_results("SOLAR")
+    system = results.system_results
+    return [system.front.transmittance.direct_hemispherical, system.front.reflectance.direct_hemispherical,
+            system.back.transmittance.direct_hemispherical, system.back.reflectance.direct_hemispherical,
+            system.front.transmittance.diffuse_diffuse, results.layer_results[0].front.absorptance.total_direct]
+
+
+def round_trip(value):
+    return pickle.loads(pickle.dumps(value))
+
+
+@pytest.mark.parametrize("name, parse", [("CLEAR_3.DAT", pywincalc.parse_optics_file),
+                                         ("2011-SA1.XML", pywincalc.parse_bsdf_xml_file),
+                                         ("venetian_blind_CGDB_22034.json", pywincalc.parse_json_file),
+                                         ("generic_pv.json", pywincalc.parse_json_file)])
+def test_product_data_round_trip(products_path, name, parse):
+    product = parse(str(products_path / name))
+    unpickled = round_trip(product)
+    assert isinstance(product.__getstate__(), bytes)
+    for attribute in ["product_name", "product_type", "product_subtype", "nfrc_id", "thickness", "conductivity",
+                      "coating_name", "coated_side", "ir_transmittance", "emissivity_front", "emissivity_back",
+                      "permeability_factor", "density", "youngs_modulus"]:
+        assert getattr(unpickled, attribute) == getattr(product, attribute)
+    # Pickling the unpickled product gives the same state
+    assert unpickled.__getstate__() == product.__getstate__()
+
+    bsdf_hemisphere = pywincalc.BSDFHemisphere.create(pywincalc.BSDFBasisType.QUARTER)
+    expected = solar(pywincalc.GlazingSystem(solid_layers=[product], bsdf_hemisphere=bsdf_hemisphere))
+    numpy.testing.assert_array_equal(
+        solar(pywincalc.GlazingSystem(solid_layers=[unpickled], bsdf_hemisphere=bsdf_hemisphere)), expected)
+
+
+def test_invalid_product_data_state(clear_3):
+    state = clear_3.__getstate__()
+    with pytest.raises(RuntimeError):
+        pywincalc.ProductData.__new__(pywincalc.ProductData).__setstate__(state[:-1])
+
+
+def test_glazing_system_round_trip(clear_3):
+    glazing_system = pywincalc.GlazingSystem(solid_layers=[clear_3], environment=pywincalc.nfrc_shgc_environments())
+    glazing_system.set_tilt(45)
+    glazing_system.set_height(2.0)
+    glazing_system.flip_layer(0, True)
+    expected = solar(glazing_system) + [glazing_system.u(), glazing_system.shgc()]
+
+    unpickled = round_trip(glazing_system)
+    assert type(unpickled) is pywincalc.GlazingSystem
+    # Results are not pickled
+    assert unpickled.cache_info().size == 0
+    numpy.testing.assert_array_equal(solar(unpickled) + [unpickled.u(), unpickled.shgc()], expected)
+
+
+def test_glazing_system_resampled_round_trip(clear_3):
+    glazing_system = pywincalc.GlazingSystem(solid_layers=[clear_3], spectral_resampling_tolerance=1e-3)
+    unpickled = round_trip(glazing_system)
+    numpy.testing.assert_array_equal(solar(unpickled), solar(glazing_system))
+    assert unpickled.spectral_resampling()[0].number_of_wavelengths == \
+        glazing_system.spectral_resampling()[0].number_of_wavelengths
+
+
+def test_double_glazing_round_trip(clear_3, clear_6):
+    gas = pywincalc.create_gas([[0.9, pywincalc.PredefinedGasType.ARGON], [0.1, pywincalc.PredefinedGasType.AIR]])
+    gap = pywincalc.Layers.gap(thickness=.0127, gas=gas)
+    glazing_system = pywincalc.GlazingSystem(solid_layers=[clear_6, clear_3], gap_layers=[gap],
+                                             environment=pywincalc.nfrc_shgc_environments())
+    glazing_system.flip_layer(1, True)
+    expected = solar(glazing_system) + [glazing_system.u(), glazing_system.shgc()]
+
+    unpickled = round_trip(glazing_system)
+    numpy.testing.assert_array_equal(solar(unpickled) + [unpickled.u(), unpickled.shgc()], expected)
+    # The unpickled system can be pickled again
+    numpy.testing.assert_array_equal(round_trip(unpickled).u(), expected[-2])
+
+
+def test_gap_layers_round_trip(clear_3, clear_6):
+    coefficients = pywincalc.GasCoefficients(0.013, 0, 0)
+    sulfur_hexafluoride = pywincalc.GasData("sulfur_hexafluoride", molecular_weight=146.1, specific_heat_ratio=1,
+                                            Cp=pywincalc.GasCoefficients(418.6, 0, 0),
+                                            thermal_conductivity=coefficients,
+                                            viscosity=pywincalc.GasCoefficients(7.214E-7, 4.928E-8, 0))
+    gas = pywincalc.create_gas([[0.8, sulfur_hexafluoride], [0.2, pywincalc.PredefinedGasType.ARGON]])
+    pillar = pywincalc.CylindricalPillar(height=0.0002, material_conductivity=20,
+                                         cell_area=pywincalc.pillar_cell_area(pywincalc.CellSpacingType.SQUARE,
+                                                                              0.03),
+                                         radius=0.25e-3)
+    gaps = [pywincalc.Layers.gap(thickness=.003, gas=gas, pressure=101500),
+            pywincalc.IGUGapLayer(thickness=.0127, pressure=101325, gas=gas),
+            pywincalc.Layers.create_pillar(pillar=pillar, pressure=0.1333),
+            pywincalc.CylindricalPillarLayer(pywincalc.Layers.gap(thickness=.0002, pressure=0.1333), pillar)]
+    for gap in gaps:
+        unpickled = round_trip(gap)
+        assert type(unpickled) is type(gap)
+        expected = pywincalc.GlazingSystem(solid_layers=[clear_6, clear_3], gap_layers=[gap]).u()
+        assert pywincalc.GlazingSystem(solid_layers=[clear_6, clear_3], gap_layers=[unpickled]).u() == expected
+
+
+def test_changed_gas_cannot_be_pickled():
+    gas = pywincalc.create_gas([[1.0, pywincalc.PredefinedGasType.ARGON]])
+    round_trip(gas)
+    gas.add_gas_item(0.1, pywincalc.PredefinedGasType.AIR)
+    with pytest.raises(TypeError):
+        pickle.dumps(gas)
+
+
+def test_dual_band_bsdf_round_trip():
+    bsdf_hemisphere = pywincalc.BSDFHemisphere.create(pywincalc.BSDFBasisType.QUARTER)
+    # The quarter basis has 41 directions
+    transmittance = (numpy.eye(41) * 0.5).tolist()
+    reflectance = (numpy.eye(41) * 0.1).tolist()
+    optical = pywincalc.ProductDataOpticalDualBandBSDF(transmittance, transmittance, reflectance, reflectance,
+                                                       transmittance, transmittance, reflectance, reflectance,
+                                                       bsdf_hemisphere, .003, 0, 0, .84, .84)
+    thermal = pywincalc.ProductDataThermal(conductivity=1, thickness_meters=.003, flipped=False)
+    layer = pywincalc.ProductDataOpticalAndThermal(optical, thermal)
+    unpickled = round_trip(layer)
+    assert unpickled.optical_data.solar_transmittance_front == transmittance
+    assert unpickled.optical_data.visible_reflectance_back == reflectance
+    assert unpickled.optical_data.emissivity_front == .84
+    expected = solar(pywincalc.GlazingSystem(solid_layers=[layer], bsdf_hemisphere=bsdf_hemisphere))
+    numpy.testing.assert_array_equal(
+        solar(pywincalc.GlazingSystem(solid_layers=[unpickled], bsdf_hemisphere=bsdf_hemisphere)), expected)
@@ -0,0 +1,85 @@
+import os
+import shutil
+
+import pytest
+
+import pywincalc
+from pywincalc import cache
+
+
+@pytest.fixture
+def product_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYWINCALC_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setitem(cache._product_cache, "max_size_bytes", cache.DEFAULT_MAX_SIZE_BYTES)
+    monkeypatch.setitem(cache._product_cache, "enabled", False)
+    cache.enable()
+    yield cache
+    cache.disable()
+
+
+def write_files(directory, count):
+    paths = []
+    for index in range(count):
+        path = directory / "product_{i}.txt".format(i=index)
+        path.write_text("product {i}\n".format(i=index) * 100)
+        paths.append(path)
+    return paths
+
+
+def test_disabled_cache_is_not_used(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYWINCALC_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setitem(cache._product_cache, "enabled", False)
+    path, = write_files(tmp_path, 1)
+    assert cache.cached_parse("test", path, lambda p: {"parsed": str(p)}) == {"parsed": str(path)}
+    assert cache.size() == 0
+
+
+def test_parsed_once_per_contents(product_cache, tmp_path):
+    path, = write_files(tmp_path, 1)
+    parsed = []
+
+    def parse(p):
+        parsed.append(p)
+        return {"parsed": len(parsed)}
+
+    assert product_cache.cached_parse("test", path, parse) == {"parsed": 1}
+    assert product_cache.cached_parse("test", path, parse) == {"parsed": 1}
+    copy = tmp_path / "copy.txt"
+    shutil.copy(path, copy)
+    assert product_cache.cached_parse("test", copy, parse) == {"parsed": 1}
+    # Results of other parsers are kept apart
+    assert product_cache.cached_parse("other", path, parse) == {"parsed": 2}
+    path.write_text("changed")
+    assert product_cache.cached_parse("test", path, parse) == {"parsed": 3}
+    assert len(parsed) == 3
+
+
+def test_least_recently_used_are_evicted(product_cache, tmp_path):
+    paths = write_files(tmp_path, 3)
+    for path in paths:
+        product_cache.cached_parse("test", path, lambda p: "x" * 1000)
+    entries = sorted(product_cache._product_cache_files())
+    entry_size = entries[0].stat().st_size
+    for age, entry in enumerate(sorted(entries, key=lambda entry: entry.stat().st_mtime_ns)):
+        os.utime(entry, ns=(age * 10 ** 9, age * 10 ** 9))
+    oldest = min(entries, key=lambda entry: entry.stat().st_mtime_ns)
+    product_cache.evict(2 * entry_size)
+    remaining = product_cache._product_cache_files()
+    assert len(remaining) == 2
+    assert oldest not in remaining
+    product_cache.clear()
+    assert product_cache.size() == 0
+
+
+def test_bsdf_xml_file_is_cached(product_cache, products_path, monkeypatch):
+    path = str(products_path / "2011-SA1.XML")
+    product = pywincalc.parse_bsdf_xml_file(path)
+    assert product_cache.size() > 0
+
+    def parse(p):
+        raise AssertionError("The product should be read from the cache")
+
+    monkeypatch.setattr(pywincalc, "_parse_bsdf_xml_file", parse)
+    cached = pywincalc.parse_bsdf_xml_file(path)
+    assert cached.product_name == product.product_name
+    assert cached.measurements.solar.transmittance_front.data == product.measurements.solar.transmittance_front.data
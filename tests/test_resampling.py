@@ -0,0 +1,83 @@
+import numpy
+import pytest
+
+import pywincalc
+from pywincalc import resampling
+
+TOLERANCE = 1e-3
+
+
+@pytest.fixture(autouse=True)
+def clear_resampled_products():
+    resampling.clear()
+    yield
+    resampling.clear()
+
+
+def test_select_wavelengths_keeps_ends_of_linear_data():
+    wavelengths = numpy.linspace(.3, 2.5, 50)
+    values = [wavelengths / 2.5, 1 - wavelengths / 2.5]
+    weights = [numpy.ones(50) / 50]
+    kept, bounds = resampling.select_wavelengths(wavelengths, values, weights, TOLERANCE)
+    numpy.testing.assert_array_equal(kept, [0, 49])
+    assert bounds[0] == pytest.approx(0, abs=1e-12)
+
+
+def test_select_wavelengths_meets_tolerance():
+    wavelengths = numpy.linspace(.3, 2.5, 200)
+    values = [.5 + .4 * numpy.sin(8 * wavelengths)]
+    weights = numpy.zeros((1, 200))
+    weights[0, 20:180] = 1 / 160
+    kept, bounds = resampling.select_wavelengths(wavelengths, values, weights, TOLERANCE)
+    assert bounds[0] <= TOLERANCE
+    assert len(kept) < 200
+    # Wavelengths no method weighs are kept as they are
+    assert set(range(20)) <= set(kept) and set(range(180, 200)) <= set(kept)
+
+
+def test_select_wavelengths_rejects_negative_tolerance():
+    with pytest.raises(ValueError):
+        resampling.select_wavelengths([.3, .4], [[0, 1]], [[1, 1]], -1)
+
+
+def test_resample_bounds_errors(clear_3):
+    number_of_wavelengths = len(clear_3.measurements)
+    result = resampling.resample(clear_3, TOLERANCE)
+    assert result.original_number_of_wavelengths == number_of_wavelengths
+    assert result.number_of_wavelengths == len(result.product.measurements) < number_of_wavelengths
+    assert len(clear_3.measurements) == number_of_wavelengths
+    assert sorted(result.error_bounds) == sorted(resampling.DEFAULT_METHODS)
+    for method, bound in result.error_bounds.items():
+        assert bound <= TOLERANCE
+        assert result.errors[method] <= bound + 1e-12
+
+
+def test_resample_is_cached(clear_3):
+    result = resampling.resample(clear_3, TOLERANCE)
+    assert resampling.resample(clear_3, TOLERANCE) is result
+    assert resampling.size() == 1
+    assert resampling.resample(clear_3, TOLERANCE / 10).product is not result.product
+    assert resampling.size() == 2
+
+
+def test_products_without_measurements_are_unchanged(products_path):
+    bsdf = pywincalc.parse_bsdf_xml_file(str(products_path / "2011-SA1.XML"))
+    result = resampling.resample(bsdf, TOLERANCE)
+    assert result.product is bsdf
+    assert result.number_of_wavelengths is None
+    assert resampling.size() == 0
+
+
+@pytest.mark.parametrize("method", resampling.DEFAULT_METHODS)
+def test_resampled_system_is_within_tolerance(clear_3, method):
+    full = pywincalc.GlazingSystem(solid_layers=[clear_3])
+    resampled = pywincalc.GlazingSystem(solid_layers=[clear_3], spectral_resampling_tolerance=TOLERANCE)
+    assert full.spectral_resampling() is None
+    assert [result.product for result in resampled.spectral_resampling()] == \
+           [resampling.resample(clear_3, TOLERANCE).product]
+    expected = full.optical_method_results(method).system_results
+    actual = resampled.optical_method_results(method).system_results
+    for side in ("front", "back"):
+        for name in ("transmittance", "reflectance"):
+            assert getattr(getattr(actual, side), name).direct_direct == \
+                   pytest.approx(getattr(getattr(expected, side), name).direct_direct, abs=TOLERANCE)
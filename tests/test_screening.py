@@ -0,0 +1,60 @@
+import numpy
+import pytest
+
+import pywincalc
+from pywincalc import screening
+
+
+@pytest.fixture(autouse=True)
+def clear_condensed_products():
+    screening.clear()
+    yield
+    screening.clear()
+
+
+def test_band_edges():
+    edges = screening.band_edges(number_visible_bands=5, number_solar_bands=10)
+    assert len(edges) == 5 + 10 + 2
+    assert numpy.all(numpy.diff(edges) > 0)
+    with pytest.raises(ValueError):
+        screening.band_edges(number_visible_bands=0)
+
+
+def test_condensed_product_is_cached(clear_3):
+    number_of_wavelengths = len(clear_3.measurements)
+    condensed = screening.condensed_product(clear_3)
+    assert len(condensed.measurements) < number_of_wavelengths
+    assert screening.condensed_product(clear_3) is condensed
+    assert screening.size() == 1
+    assert screening.condensed_product(clear_3, number_solar_bands=20) is not condensed
+    assert screening.size() == 2
+    # The product itself keeps its measurements
+    assert len(clear_3.measurements) == number_of_wavelengths
+
+
+def test_condensed_product_keeps_infrared_data(low_e):
+    edges = screening.band_edges()
+    condensed = screening.condensed_product(low_e)
+    infrared = [row.wavelength for row in low_e.measurements if row.wavelength > edges[-1] + 1e-6]
+    assert infrared
+    assert [row.wavelength for row in condensed.measurements][-len(infrared):] == infrared
+
+
+def test_products_without_measurements_are_unchanged(products_path):
+    bsdf = pywincalc.parse_bsdf_xml_file(str(products_path / "2011-SA1.XML"))
+    assert screening.condensed_product(bsdf) is bsdf
+    assert screening.size() == 0
+
+
+def test_screening_results_are_close(clear_3, low_e, gap):
+    for layers in ([clear_3], [low_e, clear_3]):
+        gap_layers = [gap] * (len(layers) - 1)
+        environment = pywincalc.nfrc_shgc_environments()
+        full = pywincalc.GlazingSystem(solid_layers=layers, gap_layers=gap_layers, environment=environment)
+        screened = screening.glazing_system(layers, gap_layers=gap_layers, environment=environment)
+        for method in ("SOLAR", "PHOTOPIC"):
+            assert screened.optical_method_results(method).system_results.front.transmittance.direct_hemispherical \
+                   == pytest.approx(full.optical_method_results(
+                       method).system_results.front.transmittance.direct_hemispherical, abs=1e-2)
+        assert screened.shgc() == pytest.approx(full.shgc(), abs=1e-2)
+        assert screened.u() == pytest.approx(full.u(), abs=1e-3)
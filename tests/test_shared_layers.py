@@ -0,0 +1,82 @@
+import copy
+import pickle
+
+import pytest
+
+import pywincalc
+
+
+def _front_reflectance(glazing_system):
+    results = glazing_system.optical_method_results("SOLAR")
+    return results.system_results.front.reflectance.direct_hemispherical
+
+
+@pytest.fixture(params=["product", "solid_layer", "resampled"])
+def system_arguments(request, low_e):
+    if request.param == "product":
+        return dict(solid_layers=[low_e])
+    if request.param == "solid_layer":
+        return dict(solid_layers=[pywincalc.convert_to_solid_layer(low_e)])
+    return dict(solid_layers=[low_e], spectral_resampling_tolerance=1e-3)
+
+
+def test_flipping_does_not_change_other_systems(system_arguments):
+    flipped = pywincalc.GlazingSystem(**system_arguments)
+    other = pywincalc.GlazingSystem(**system_arguments)
+    expected = _front_reflectance(other)
+    flipped.flip_layer(0, True)
+    assert _front_reflectance(flipped) != pytest.approx(expected)
+    assert _front_reflectance(pywincalc.GlazingSystem(**system_arguments)) == pytest.approx(expected)
+    other.optical_method_results("SOLAR")
+    other.flip_layer(0, False)
+    assert _front_reflectance(other) == pytest.approx(expected)
+
+
+def test_flipping_twice_unflips(low_e):
+    glazing_system = pywincalc.GlazingSystem(solid_layers=[low_e])
+    expected = _front_reflectance(glazing_system)
+    glazing_system.flip_layer(0, True)
+    glazing_system.flip_layer(0, False)
+    assert _front_reflectance(glazing_system) == pytest.approx(expected)
+
+
+def test_shared_layers_are_shared(clear_3):
+    first = pywincalc.GlazingSystem(solid_layers=[clear_3])
+    second = pywincalc.GlazingSystem(solid_layers=[clear_3])
+    assert first.solid_layers()[0].optical_data is second.solid_layers()[0].optical_data
+    assert pywincalc.shared_layers.solid_layer(clear_3) is pywincalc.shared_layers.solid_layer(clear_3)
+
+
+def test_flipping_copies_the_material(products_path):
+    venetian = pywincalc.parse_json_file(str(products_path / "venetian_blind_CGDB_22034.json"))
+    bsdf_hemisphere = pywincalc.BSDFHemisphere.create(pywincalc.BSDFBasisType.QUARTER)
+    flipped = pywincalc.GlazingSystem(solid_layers=[venetian], bsdf_hemisphere=bsdf_hemisphere)
+    other = pywincalc.GlazingSystem(solid_layers=[venetian], bsdf_hemisphere=bsdf_hemisphere)
+    expected = _front_reflectance(other)
+    flipped.flip_layer(0, True)
+    shared = pywincalc.shared_layers.solid_layer(venetian).optical_data
+    private = flipped.solid_layers()[0].optical_data
+    assert private is not shared
+    assert private.material_optical_data is not shared.material_optical_data
+    other.clear_cache()
+    assert _front_reflectance(other) == pytest.approx(expected)
+
+
+def test_optical_data_defined_in_python_cannot_be_copied():
+    class OpticalData(pywincalc.ProductDataOptical):
+        def wavelengths(self):
+            return [0.3, 2.5]
+
+    thermal = pywincalc.ProductDataThermal(conductivity=1, thickness_meters=.003, flipped=False)
+    layer = pywincalc.ProductDataOpticalAndThermal(OpticalData(.003), thermal)
+    with pytest.raises(TypeError):
+        copy.copy(layer)
+
+
+def test_failed_flip_changes_nothing(clear_3):
+    glazing_system = pywincalc.GlazingSystem(solid_layers=[clear_3])
+    expected = _front_reflectance(glazing_system)
+    with pytest.raises(IndexError):
+        glazing_system.flip_layer(1, True)
+    assert glazing_system.cache_info().size == 1
+    assert _front_reflectance(pickle.loads(pickle.dumps(glazing_system))) == pytest.approx(expected)
@@ -0,0 +1,75 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+import pywincalc
+from pywincalc import standards
+
+
+@pytest.fixture
+def standard_directory(tmp_path):
+    for standard_file in standards.referenced_files(standards.path(standards.DEFAULT_STANDARD)):
+        shutil.copy(standard_file, tmp_path)
+    return tmp_path
+
+
+def test_get_returns_the_same_standard():
+    assert standards.get() is standards.get(standards.DEFAULT_STANDARD + ".std")
+    assert "SOLAR" in standards.get().methods
+
+
+def test_import_does_not_parse_a_standard():
+    code = "import pywincalc; print(len(pywincalc.standards._standards))"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    assert output.strip() == "0"
+
+
+def test_names_and_paths():
+    assert standards.DEFAULT_STANDARD in standards.names()
+    assert standards.path(standards.DEFAULT_STANDARD) == standards.standard_path / "W5_NFRC_2003.std"
+    with pytest.raises(FileNotFoundError):
+        standards.get("not_a_standard")
+
+
+def test_glazing_systems_share_the_default_standard(clear_3):
+    standards.clear()
+    pywincalc.GlazingSystem(solid_layers=[clear_3]).u()
+    pywincalc.GlazingSystem(solid_layers=[clear_3]).u()
+    assert len(standards._standards) == 1
+
+
+def test_load_returns_a_new_standard():
+    assert standards.load(standards.DEFAULT_STANDARD, use_cache=False) is not standards.get()
+
+
+def test_prebuilt_cache_ignores_modification_times(standard_directory, monkeypatch):
+    cache_files = standards.build_cache(standard_directory)
+    assert [cache_file.name for cache_file in cache_files] == [standards.DEFAULT_STANDARD + standards.CACHE_SUFFIX]
+    # Installing the package gives the files new modification times
+    for path in standard_directory.iterdir():
+        os.utime(path, ns=(1, 1))
+
+    def parse(path):
+        raise AssertionError("The standard should be read from the cache")
+
+    monkeypatch.setattr(standards, "_load_standard", parse)
+    standard = standards.load(standard_directory / (standards.DEFAULT_STANDARD + ".std"))
+    assert standard.methods.keys() == standards.get().methods.keys()
+
+
+def test_prebuilt_cache_is_not_used_when_a_file_changes(standard_directory, monkeypatch):
+    standards.build_cache(standard_directory)
+    spectrum = standards.referenced_files(standard_directory / (standards.DEFAULT_STANDARD + ".std"))[1]
+    contents = bytearray(spectrum.read_bytes())
+    contents[-2] = ord("9") if contents[-2] != ord("9") else ord("8")
+    spectrum.write_bytes(bytes(contents))
+
+    parsed = []
+    load_standard = standards._load_standard
+    monkeypatch.setattr(standards, "_load_standard", lambda path: parsed.append(path) or load_standard(path))
+    monkeypatch.setenv("PYWINCALC_CACHE_DIR", str(standard_directory / "user_cache"))
+    standards.load(standard_directory / (standards.DEFAULT_STANDARD + ".std"))
+    assert parsed
@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+import pytest
+
+import pywincalc
+
+
+def results(glazing_system, theta=0):
+    solar = glazing_system.optical_method_results("SOLAR", theta)
+    return (glazing_system.u(theta), glazing_system.shgc(theta),
+            solar.system_results.front.transmittance.direct_hemispherical)
+
+
+@pytest.fixture
+def layer_combinations(clear_3, clear_6, low_e):
+    return [[clear_3], [clear_6], [low_e], [clear_3, clear_6], [low_e, clear_3], [clear_6, low_e]]
+
+
+def make_system(layers, gap):
+    return pywincalc.GlazingSystem(solid_layers=layers, gap_layers=[gap] * (len(layers) - 1),
+                                   environment=pywincalc.nfrc_shgc_environments())
+
+
+def test_distinct_systems_in_threads_match_serial(layer_combinations, gap):
+    serial = [results(make_system(layers, gap)) for layers in layer_combinations]
+    systems = [make_system(layers, gap) for layers in layer_combinations]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        threaded = list(executor.map(results, systems))
+    numpy.testing.assert_allclose(threaded, serial)
+
+
+def test_threads_sharing_a_system_wait_for_each_other(clear_3, clear_6, gap):
+    thetas = [0, 10, 20, 30, 40, 50, 60, 70]
+    serial_system = make_system([clear_3, clear_6], gap)
+    serial = [results(serial_system, theta) for theta in thetas]
+    shared = make_system([clear_3, clear_6], gap)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        threaded = list(executor.map(lambda theta: results(shared, theta), thetas))
+    numpy.testing.assert_allclose(threaded, serial)
+
+
+def test_evaluate_many_matches_serial(layer_combinations, gap):
+    serial = [{"u": system.u(), "shgc": system.shgc()}
+              for system in (make_system(layers, gap) for layers in layer_combinations)]
+    systems = [make_system(layers, gap) for layers in layer_combinations]
+    evaluated = pywincalc.evaluate_many(systems + systems[:2], max_workers=4)
+    assert len(evaluated) == len(systems) + 2
+    for result, expected in zip(evaluated, serial + serial[:2]):
+        assert result == pytest.approx(expected)
+
+
+def test_color_many_matches_serial(layer_combinations, gap):
+    serial = [make_system(layers, gap).color(theta=20) for layers in layer_combinations]
+    systems = [make_system(layers, gap) for layers in layer_combinations]
+    columns = pywincalc.color_many(systems + systems[:1], theta=20, max_workers=4)
+    for name, value in (("lab_L", lambda color: color.lab.L), ("lab_b", lambda color: color.lab.b),
+                        ("trichromatic_Y", lambda color: color.trichromatic.Y)):
+        expected = [value(result.system_results.front.transmittance.direct_hemispherical) for result in serial]
+        numpy.testing.assert_allclose(columns["system_front_transmittance_direct_hemispherical_" + name],
+                                      expected + expected[:1])
+
+
+def test_color_many_without_systems():
+    columns = pywincalc.color_many([])
+    assert len(columns["system_front_transmittance_direct_hemispherical_lab_L"]) == 0
@@ -0,0 +1,77 @@
+import numpy
+import pytest
+
+import pywincalc
+
+OUTSIDE = [268.15, 278.15, 288.15]
+INSIDE = [294.15, 295.15, 296.15]
+WIND = [1.0, 3.0, 5.0]
+SOLAR = [0.0, 400.0, 783.0]
+
+
+@pytest.fixture
+def glazing_system(clear_3, gap):
+    return pywincalc.GlazingSystem(solid_layers=[clear_3, clear_3], gap_layers=[gap],
+                                   environment=pywincalc.nfrc_shgc_environments())
+
+
+def step_system(clear_3, gap, step, environments=None, radiation_temperatures=True):
+    environments = environments or pywincalc.nfrc_shgc_environments()
+    environments.outside.air_temperature = OUTSIDE[step]
+    environments.outside.air_speed = WIND[step]
+    environments.outside.direct_solar_radiation = SOLAR[step]
+    environments.inside.air_temperature = INSIDE[step]
+    if radiation_temperatures:
+        environments.outside.radiation_temperature = OUTSIDE[step]
+        environments.inside.radiation_temperature = INSIDE[step]
+    return pywincalc.GlazingSystem(solid_layers=[clear_3, clear_3], gap_layers=[gap], environment=environments)
+
+
+def test_steps_match_separate_systems(glazing_system, clear_3, gap):
+    results = glazing_system.simulate_timeseries(OUTSIDE, INSIDE, WIND, SOLAR, outside_radiation_temps=OUTSIDE,
+                                                 inside_radiation_temps=INSIDE)
+    assert results["steps"] == 3
+    assert results["wall_time_seconds"] >= 0
+    assert results["layer_temperatures"].shape == (3, 4)
+    for step in range(3):
+        expected = step_system(clear_3, gap, step)
+        assert results["u"][step] == pytest.approx(expected.u())
+        assert results["shgc"][step] == pytest.approx(expected.shgc())
+        numpy.testing.assert_allclose(results["layer_temperatures"][step],
+                                      expected.layer_temperatures(pywincalc.TarcogSystemType.SHGC))
+    numpy.testing.assert_allclose(results["heat_flux"], results["u"] * (numpy.array(OUTSIDE) - INSIDE) +
+                                  results["shgc"] * numpy.array(SOLAR))
+
+
+def test_radiation_temperatures_are_kept_from_the_environments(clear_3, gap):
+    def environments():
+        sky = pywincalc.nfrc_shgc_environments()
+        sky.outside.radiation_temperature = 255.15
+        sky.inside.radiation_temperature = 290.15
+        return sky
+
+    glazing_system = pywincalc.GlazingSystem(solid_layers=[clear_3, clear_3], gap_layers=[gap],
+                                             environment=environments())
+    results = glazing_system.simulate_timeseries(OUTSIDE, INSIDE, WIND, SOLAR)
+    for step in range(3):
+        expected = step_system(clear_3, gap, step, environments(), radiation_temperatures=False)
+        assert results["u"][step] == pytest.approx(expected.u())
+        numpy.testing.assert_allclose(results["layer_temperatures"][step],
+                                      expected.layer_temperatures(pywincalc.TarcogSystemType.SHGC))
+        assert results["u"][step] != pytest.approx(step_system(clear_3, gap, step).u())
+
+
+def test_environments_are_restored(glazing_system):
+    u = glazing_system.u()
+    glazing_system.simulate_timeseries(OUTSIDE, INSIDE, WIND, SOLAR)
+    environments = glazing_system.environments()
+    assert environments.outside.air_temperature == pywincalc.nfrc_shgc_environments().outside.air_temperature
+    # Calculate again in WinCalc instead of returning the cached result
+    assert super(pywincalc.GlazingSystem, glazing_system).u() == pytest.approx(u)
+
+
+def test_series_of_different_lengths(glazing_system):
+    with pytest.raises(ValueError):
+        glazing_system.simulate_timeseries(OUTSIDE, INSIDE[:2], WIND, SOLAR)
+    with pytest.raises(ValueError):
+        glazing_system.simulate_timeseries(OUTSIDE, INSIDE, WIND, SOLAR, inside_radiation_temps=INSIDE[:2])
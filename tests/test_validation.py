@@ -0,0 +1,51 @@
+import shutil
+
+import pywincalc
+from pywincalc import validation
+
+BOGUS_BSDF_XML = ("<WindowElement><Optical><Layer><Material><Name>x</Name></Material><WavelengthData>"
+                  "<WavelengthDataBlock><ScatteringData>1,2,</ScatteringData></WavelengthDataBlock>"
+                  "</WavelengthData></Layer></Optical></WindowElement>")
+
+
+def test_valid_products(products_path):
+    paths = [products_path / name for name in ("CLEAR_3.DAT", "CLEAR_6.DAT", "generic_pv.json")]
+    report = pywincalc.validate_products(paths, workers=2)
+    assert report.ok
+    assert [result.path for result in report.results] == [str(path) for path in paths]
+
+
+def test_errors_do_not_stop_other_files(tmp_path, products_path):
+    truncated = tmp_path / "truncated.DAT"
+    truncated.write_bytes((products_path / "CLEAR_3.DAT").read_bytes()[:3000])
+    not_xml = tmp_path / "not_xml.xml"
+    not_xml.write_text("<WindowElement>")
+    clear_3 = tmp_path / "CLEAR_3.DAT"
+    shutil.copy(products_path / "CLEAR_3.DAT", clear_3)
+    report = pywincalc.validate_products([truncated, not_xml, clear_3], workers=2)
+    errors = {result.path: result.errors for result in report.errors}
+    assert set(errors) == {str(truncated), str(not_xml)}
+    assert errors[str(not_xml)][0].code == "read_error"
+
+
+def test_file_that_ends_the_worker_process(tmp_path, products_path):
+    bogus = tmp_path / "bogus.xml"
+    bogus.write_text(BOGUS_BSDF_XML)
+    paths = [bogus, products_path / "CLEAR_3.DAT", bogus, products_path / "CLEAR_6.DAT"]
+    report = pywincalc.validate_products(paths, workers=1)
+    assert [bool(result.errors) for result in report.results] == [True, False, True, False]
+    assert report.results[0].errors[0].code == "parse_error"
+
+
+def test_check_product_warnings(clear_3):
+    assert validation.check_product(clear_3) == []
+    clear_3.thickness, thickness = -1, clear_3.thickness
+    try:
+        assert [issue.code for issue in validation.check_product(clear_3)] == ["invalid_thickness"]
+    finally:
+        clear_3.thickness = thickness
+
+
+def test_time_limit(products_path):
+    report = pywincalc.validate_products([products_path / "CLEAR_3.DAT"] * 3, time_limit_seconds=0)
+    assert [result.errors[0].code for result in report.results] == ["time_limit"] * 3
@@ -0,0 +1,67 @@
+import numpy
+import pytest
+
+import pywincalc
+
+NAMES = ["wavelengths", "transmittance_front", "transmittance_back", "reflectance_front", "reflectance_back"]
+
+
+def nband_layer(optical_data, thickness):
+    thermal = pywincalc.ProductDataThermal(conductivity=1, thickness_meters=thickness, flipped=False)
+    return pywincalc.ProductDataOpticalAndThermal(optical_data, thermal)
+
+
+def test_wavelength_data_round_trip(clear_3):
+    arrays = pywincalc.wavelength_data_to_arrays(clear_3.measurements)
+    assert sorted(arrays) == sorted(NAMES)
+    assert all(isinstance(array, numpy.ndarray) for array in arrays.values())
+    numpy.testing.assert_array_equal(arrays["wavelengths"], [row.wavelength for row in clear_3.measurements])
+    numpy.testing.assert_array_equal(arrays["transmittance_front"],
+                                     [row.direct_component.transmittance_front for row in clear_3.measurements])
+
+    measurements = pywincalc.wavelength_data_from_arrays(**arrays)
+    assert len(measurements) == len(clear_3.measurements)
+    round_trip = pywincalc.wavelength_data_to_arrays(measurements)
+    for name in NAMES:
+        numpy.testing.assert_array_equal(round_trip[name], arrays[name])
+
+
+def test_from_arrays_matches_wavelength_data(clear_3):
+    thickness = clear_3.thickness / 1000
+    properties = dict(material_type=pywincalc.MaterialType.MONOLITHIC, thickness_meters=thickness,
+                      coated_side=pywincalc.CoatedSide.NEITHER, emissivity_front=.84, emissivity_back=.84,
+                      ir_transmittance_front=0, ir_transmittance_back=0)
+    optical = pywincalc.ProductDataOpticalNBand(wavelength_data=clear_3.measurements, **properties)
+    from_arrays = pywincalc.ProductDataOpticalNBand.from_arrays(**properties, **optical.to_arrays())
+    assert from_arrays.wavelengths() == optical.wavelengths()
+
+    expected = pywincalc.GlazingSystem(solid_layers=[nband_layer(optical, thickness)])
+    actual = pywincalc.GlazingSystem(solid_layers=[nband_layer(from_arrays, thickness)])
+    assert actual.optical_method_results("SOLAR").system_results.front.transmittance.direct_direct == \
+           pytest.approx(expected.optical_method_results("SOLAR").system_results.front.transmittance.direct_direct)
+    assert actual.u() == pytest.approx(expected.u())
+
+
+def test_from_arrays_pv_columns():
+    wavelengths = numpy.linspace(.3, 2.5, 5)
+    values = numpy.full(5, .5)
+    measurements = pywincalc.wavelength_data_from_arrays(wavelengths, values, values, values, values,
+                                                         eqe_front=values, eqe_back=values)
+    arrays = pywincalc.wavelength_data_to_arrays(measurements)
+    numpy.testing.assert_array_equal(arrays["eqe_front"], values)
+    numpy.testing.assert_array_equal(arrays["eqe_back"], values)
+    assert "diffuse_transmittance_front" not in arrays
+
+
+def test_from_arrays_rejects_bad_columns():
+    wavelengths = numpy.linspace(.3, 2.5, 5)
+    values = numpy.full(5, .5)
+    with pytest.raises(ValueError):
+        pywincalc.wavelength_data_from_arrays(wavelengths, values[:4], values, values, values)
+    with pytest.raises(ValueError):
+        pywincalc.wavelength_data_from_arrays(wavelengths.reshape(5, 1), values, values, values, values)
+    with pytest.raises(ValueError):
+        pywincalc.wavelength_data_from_arrays(wavelengths, values, values, values, values, eqe_front=values)
+    with pytest.raises(ValueError):
+        pywincalc.wavelength_data_from_arrays(wavelengths, values, values, values, values,
+                                              diffuse_transmittance_front=values)
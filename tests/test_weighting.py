@@ -0,0 +1,46 @@
+import gc
+
+import pytest
+
+import pywincalc
+from pywincalc import weighting
+
+
+@pytest.mark.parametrize("method", ["SOLAR", "PHOTOPIC"])
+@pytest.mark.parametrize("product_name", ["clear_3", "clear_6", "low_e"])
+def test_integrate_product_matches_glazing_system(request, product_name, method):
+    product = request.getfixturevalue(product_name)
+    integrated = weighting.integrate_product(product, method)
+    results = pywincalc.GlazingSystem(solid_layers=[product]).optical_method_results(method).system_results
+    assert integrated.transmittance_front == pytest.approx(results.front.transmittance.direct_direct, abs=1e-4)
+    assert integrated.transmittance_back == pytest.approx(results.back.transmittance.direct_direct, abs=1e-4)
+    assert integrated.reflectance_front == pytest.approx(results.front.reflectance.direct_direct, abs=1e-4)
+    assert integrated.reflectance_back == pytest.approx(results.back.reflectance.direct_direct, abs=1e-4)
+
+
+def test_integrate_products_matches_integrate_product(clear_3, clear_6, low_e):
+    products = [clear_3, low_e, clear_6, clear_3]
+    assert weighting.integrate_products(products, "SOLAR") == \
+        [weighting.integrate_product(product, "SOLAR") for product in products]
+
+
+def test_kernels_are_dropped_with_their_standard():
+    standard = pywincalc.standards.load(pywincalc.standards.DEFAULT_STANDARD, use_cache=False)
+    size = weighting.size()
+    assert weighting.kernel("SOLAR", standard) is weighting.kernel("SOLAR", standard)
+    assert weighting.size() == size + 1
+    del standard
+    gc.collect()
+    assert weighting.size() == size
+
+
+def test_weights_are_kept_for_a_bounded_number_of_grids(monkeypatch):
+    monkeypatch.setattr(weighting, "MAX_GRIDS_PER_KERNEL", 2)
+    method_kernel = weighting.kernel("SOLAR")
+    grids = [[0.2, 1.0 + i / 10, 5.0] for i in range(3)]
+    first = method_kernel.weights_for(grids[0])
+    assert method_kernel.weights_for(grids[0]) is first
+    method_kernel.weights_for(grids[1])
+    method_kernel.weights_for(grids[2])
+    assert method_kernel.weights_for(grids[0]) is not first
+    assert method_kernel.weights_for(grids[0]).sum() == pytest.approx(1)